@@ -7,6 +7,7 @@ import re
 from six import add_metaclass
 
 from django.conf import settings
+from django.core.cache import cache
 from django.utils.translation import ugettext_lazy, ugettext as _
 from django.core.urlresolvers import resolve
 
@@ -113,6 +114,37 @@ class SearchIndexerBase(object):
         result_ids = [result["data"]["id"] for result in response["results"]]
         searcher.remove(cls.DOCUMENT_TYPE, result_ids)
 
+    @classmethod
+    def _indexed_version_cache_key(cls, structure_key):
+        """ Cache key of the version of the given structure that was last indexed """
+        return u'{}.indexed_version.{}'.format(cls.INDEX_NAME, structure_key)
+
+    @classmethod
+    def _get_structure_changes(cls, modulestore, structure_key, version):
+        """
+        Returns a (changed_locations, ancestor_locations, removed_locations)
+        tuple of the sets of the locations of the blocks that were added or
+        updated since the given version of the structure was last indexed, of
+        their ancestors, and of the blocks that were removed; or None if the
+        changes can't be determined.
+        """
+        indexed_version = cache.get(cls._indexed_version_cache_key(structure_key))
+        if version is None or indexed_version is None:
+            return None
+
+        changes = modulestore.get_structure_changes(structure_key, indexed_version, version)
+        if changes is None:
+            return None
+
+        changed_locations, removed_locations = changes
+        ancestor_locations = set()
+        for location in changed_locations:
+            parent_location = modulestore.get_parent_location(location)
+            while parent_location is not None and parent_location not in ancestor_locations:
+                ancestor_locations.add(parent_location)
+                parent_location = modulestore.get_parent_location(parent_location)
+        return changed_locations, ancestor_locations, removed_locations
+
     @classmethod
     def index(cls, modulestore, structure_key, triggered_at=None, reindex_age=REINDEX_AGE):
         """
@@ -129,6 +161,11 @@ class SearchIndexerBase(object):
             updating their index but are still walked through in order to identify
             which items may need to be removed from the index
             If None, then a full reindex takes place
+            Otherwise, if the structure is versioned (split modulestore) and
+            the version that was last indexed is known, only the items added or
+            changed since that version are indexed, along with their
+            descendants, and only the items removed since then are removed
+            from the index, rather than walking through the whole structure
 
         Returns:
         Number of items that have been added to the index
@@ -157,6 +194,16 @@ class SearchIndexerBase(object):
         # instead of per item index API call.
         items_index = []
 
+        # For an incremental update, changed_locations holds the locations of
+        # the items added or changed since the structure was last indexed, each
+        # of which is indexed along with its descendants, and walked_locations
+        # additionally holds the locations of their ancestors, which are only
+        # walked through to reach them.  Other items are neither walked nor
+        # indexed.
+        changed_locations = None
+        walked_locations = None
+        version = None
+
         def get_item_location(item):
             """
             Gets the version agnostic item location
@@ -210,18 +257,28 @@ class SearchIndexerBase(object):
             indexed_items.add(item_id)
             if item.has_children:
                 # determine if it's okay to skip adding the children herein based upon how recently any may have changed
-                skip_child_index = skip_index or \
-                    (triggered_at is not None and (triggered_at - item.subtree_edited_on) > reindex_age)
+                skip_child_index = skip_index or (
+                    changed_locations is None and
+                    triggered_at is not None and
+                    (triggered_at - item.subtree_edited_on) > reindex_age
+                )
                 children_groups_usage = []
                 for child_item in item.get_children():
-                    if modulestore.has_published_version(child_item):
-                        children_groups_usage.append(
-                            prepare_item_index(
-                                child_item,
-                                skip_index=skip_child_index,
-                                groups_usage_info=groups_usage_info
-                            )
+                    if not modulestore.has_published_version(child_item):
+                        continue
+                    child_skip_index = skip_child_index
+                    if changed_locations is not None and skip_index:
+                        child_location = get_item_location(child_item)
+                        if child_location not in walked_locations:
+                            continue
+                        child_skip_index = child_location not in changed_locations
+                    children_groups_usage.append(
+                        prepare_item_index(
+                            child_item,
+                            skip_index=child_skip_index,
+                            groups_usage_info=groups_usage_info
                         )
+                    )
                 if None in children_groups_usage:
                     item_content_groups = None
 
@@ -249,6 +306,14 @@ class SearchIndexerBase(object):
         try:
             with modulestore.branch_setting(ModuleStoreEnum.RevisionOption.published_only):
                 structure = cls._fetch_top_level(modulestore, structure_key)
+                version = getattr(structure, 'course_version', None)
+                changes = None
+                if triggered_at is not None:
+                    changes = cls._get_structure_changes(modulestore, structure_key, version)
+                if changes is not None and get_item_location(structure) not in changes[0]:
+                    changed_locations, ancestor_locations, removed_locations = changes
+                    walked_locations = changed_locations | ancestor_locations
+
                 groups_usage_info = cls.fetch_group_usage(modulestore, structure)
 
                 # First perform any additional indexing from the structure object
@@ -256,9 +321,22 @@ class SearchIndexerBase(object):
 
                 # Now index the content
                 for item in structure.get_children():
-                    prepare_item_index(item, groups_usage_info=groups_usage_info)
+                    if changed_locations is None:
+                        prepare_item_index(item, groups_usage_info=groups_usage_info)
+                    elif get_item_location(item) in walked_locations:
+                        prepare_item_index(
+                            item,
+                            skip_index=get_item_location(item) not in changed_locations,
+                            groups_usage_info=groups_usage_info
+                        )
                 searcher.index(cls.DOCUMENT_TYPE, items_index)
-                cls.remove_deleted_items(searcher, structure_key, indexed_items)
+                if changed_locations is None:
+                    cls.remove_deleted_items(searcher, structure_key, indexed_items)
+                elif removed_locations:
+                    searcher.remove(
+                        cls.DOCUMENT_TYPE,
+                        [unicode(cls._id_modifier(location)) for location in removed_locations]
+                    )
         except Exception as err:  # pylint: disable=broad-except
             # broad exception so that index operation does not prevent the rest of the application from working
             log.exception(
@@ -268,6 +346,14 @@ class SearchIndexerBase(object):
             )
             error_list.append(_('General indexing error occurred'))
 
+        # Record the indexed version of the structure, from which the next
+        # update can be made incrementally, only if it was completely indexed.
+        version_cache_key = cls._indexed_version_cache_key(structure_key)
+        if error_list or version is None:
+            cache.delete(version_cache_key)
+        else:
+            cache.set(version_cache_key, unicode(version), None)
+
         if error_list:
             raise SearchIndexingError('Error(s) present during indexing', error_list)
 
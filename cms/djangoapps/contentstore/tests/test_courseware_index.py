@@ -431,11 +431,16 @@ class TestCoursewareSearchIndexer(MixedWithOptionsTestCase):
 
         before_time = datetime.now(UTC)
         self.publish_item(store, vertical2.location)
-        # index based on time, will include an index of the origin sequential
-        # because it is in a common subtree but not of the original vertical
-        # because the original sequential's subtree is too old
         new_indexed_count = self.index_recent_changes(store, before_time)
-        self.assertEqual(new_indexed_count, 5)
+        if store.get_modulestore_type(self.course.id) == ModuleStoreEnum.Type.split:
+            # split structures are compared with the version that was last indexed,
+            # so only the new sequential and its descendants are indexed
+            self.assertEqual(new_indexed_count, 3)
+        else:
+            # index based on time, will include an index of the origin sequential
+            # because it is in a common subtree but not of the original vertical
+            # because the original sequential's subtree is too old
+            self.assertEqual(new_indexed_count, 5)
 
         # full index again
         indexed_count = self.reindex_course(store)
@@ -544,6 +549,32 @@ class TestCoursewareSearchIndexer(MixedWithOptionsTestCase):
         with self.assertRaises(SearchIndexingError):
             self.reindex_course(store)
 
+    def _test_incremental_index(self, store):
+        """ Make sure that only the changes since the last indexed version of a split course are indexed """
+        self.publish_item(store, self.vertical.location)
+        indexed_count = self.reindex_course(store)
+        self.assertEqual(indexed_count, 4)
+
+        # Renaming the sequential reindexes its subtree, whose location path changed
+        self.sequential.display_name = "Lesson One"
+        self.update_item(store, self.sequential)
+        self.publish_item(store, self.sequential.location)
+        indexed_count = self.index_recent_changes(store, datetime.now(UTC))
+        self.assertEqual(indexed_count, 3)
+        response = self.search()
+        self.assertEqual(response["total"], 4)
+        for result in response["results"]:
+            if result["data"]["id"] == unicode(self.html_unit.location):
+                self.assertEqual(result["data"]["location"], ["Week 1", "Lesson One", "Subsection 1"])
+
+        # Deleting the html unit only removes it from the index
+        self.delete_item(store, self.html_unit.location)
+        self.publish_item(store, self.vertical.location)
+        indexed_count = self.index_recent_changes(store, datetime.now(UTC))
+        self.assertEqual(indexed_count, 0)
+        response = self.search()
+        self.assertEqual(response["total"], 3)
+
     @ddt.data(*WORKS_WITH_STORES)
     def test_indexing_course(self, store_type):
         self._perform_test_using_store(store_type, self._test_indexing_course)
@@ -572,6 +603,9 @@ class TestCoursewareSearchIndexer(MixedWithOptionsTestCase):
     def test_time_based_index(self, store_type):
         self._perform_test_using_store(store_type, self._test_time_based_index)
 
+    def test_incremental_index(self):
+        self._perform_test_using_store(ModuleStoreEnum.Type.split, self._test_incremental_index)
+
     @ddt.data(*WORKS_WITH_STORES)
     def test_exception(self, store_type):
         self._perform_test_using_store(store_type, self._test_exception)
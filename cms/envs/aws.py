@@ -327,6 +327,22 @@ for name, database in DATABASES.items():
         })
 
 MODULESTORE = convert_module_store_setting_if_needed(AUTH_TOKENS.get('MODULESTORE', MODULESTORE))
+COURSE_STRUCTURE_LOCAL_CACHE_MAX_SIZE = ENV_TOKENS.get(
+    'COURSE_STRUCTURE_LOCAL_CACHE_MAX_SIZE', COURSE_STRUCTURE_LOCAL_CACHE_MAX_SIZE
+)
+CONTENTSERVER_LOCAL_CACHE_MAX_SIZE = ENV_TOKENS.get(
+    'CONTENTSERVER_LOCAL_CACHE_MAX_SIZE', CONTENTSERVER_LOCAL_CACHE_MAX_SIZE
+)
+CONTENTSERVER_LOCAL_CACHE_TIMEOUT = ENV_TOKENS.get(
+    'CONTENTSERVER_LOCAL_CACHE_TIMEOUT', CONTENTSERVER_LOCAL_CACHE_TIMEOUT
+)
+CONTENTSERVER_STREAM_CHUNK_SIZE = ENV_TOKENS.get('CONTENTSERVER_STREAM_CHUNK_SIZE', CONTENTSERVER_STREAM_CHUNK_SIZE)
+COURSE_OVERVIEW_LOCAL_CACHE_MAX_ITEMS = ENV_TOKENS.get(
+    'COURSE_OVERVIEW_LOCAL_CACHE_MAX_ITEMS', COURSE_OVERVIEW_LOCAL_CACHE_MAX_ITEMS
+)
+COURSE_OVERVIEW_LOCAL_CACHE_TIMEOUT = ENV_TOKENS.get(
+    'COURSE_OVERVIEW_LOCAL_CACHE_TIMEOUT', COURSE_OVERVIEW_LOCAL_CACHE_TIMEOUT
+)
 
 MODULESTORE_FIELD_OVERRIDE_PROVIDERS = ENV_TOKENS.get(
     'MODULESTORE_FIELD_OVERRIDE_PROVIDERS',
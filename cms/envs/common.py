@@ -464,6 +464,39 @@ MODULESTORE = {
     }
 }
 
+# Maximum total size, in bytes, of the serialized split modulestore course
+# structures kept in each process's memory in front of the
+# 'course_structure_cache'.  Set to 0 to disable this in-process cache.
+COURSE_STRUCTURE_LOCAL_CACHE_MAX_SIZE = 32 * 1024 * 1024
+
+# Name of the codec with which serialized data is compressed in caches: either
+# 'pickle+zlib' or, if the lz4 package is installed, the faster 'pickle+lz4'.
+# All the processes sharing the caches should use the same codec, since values
+# written by a codec that is unavailable in a process are ignored there.
+CACHE_CODEC = 'pickle+zlib'
+
+# Maximum total size, in bytes, of the course assets kept in each process's
+# memory in front of the 'course_assets' cache, and the number of seconds for
+# which each asset is kept there.  Other processes can't invalidate this cache
+# when an asset is updated, so the timeout bounds how long an outdated asset may
+# be served, including an asset that was just locked, which is then served without
+# checking access to it.  Disabled by default, with a size of 0.
+CONTENTSERVER_LOCAL_CACHE_MAX_SIZE = 0
+CONTENTSERVER_LOCAL_CACHE_TIMEOUT = 60
+
+# Maximum number of course overviews kept in each process's memory in front of
+# the database, and the number of seconds for which each is kept there.  Only
+# the process that handles a course's publish signal invalidates its cached
+# overview, so the timeout bounds how long other processes may return an
+# outdated one.  Set the number to 0 to disable this in-process cache.
+COURSE_OVERVIEW_LOCAL_CACHE_MAX_ITEMS = 0
+COURSE_OVERVIEW_LOCAL_CACHE_TIMEOUT = 60
+
+# Size, in bytes, of the chunks in which assets that are read from the
+# contentstore are streamed to clients.  It matches the default GridFS chunk
+# size, so that each chunk sent is read from a single GridFS chunk.
+CONTENTSERVER_STREAM_CHUNK_SIZE = 255 * 1024
+
 # Modulestore-level field override providers. These field override providers don't
 # require student context.
 MODULESTORE_FIELD_OVERRIDE_PROVIDERS = ()
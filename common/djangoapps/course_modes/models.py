@@ -6,9 +6,11 @@ import pytz
 
 from collections import namedtuple, defaultdict
 from config_models.models import ConfigurationModel
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.db import models
-from django.db.models import Q
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.utils.translation import ugettext_lazy as _
 from openedx.core.djangoapps.xmodule_django.models import CourseKeyField
 
@@ -141,6 +143,12 @@ class CourseMode(models.Model):
     DEFAULT_SHOPPINGCART_MODE_SLUG = HONOR
     DEFAULT_SHOPPINGCART_MODE = Mode(HONOR, _('Honor'), 0, '', 'usd', None, None, None, None)
 
+    # cache key format e.g course_modes.<course_id> = [Mode, ...]
+    CACHE_KEY = u'course_modes.{}'
+    # The cached modes are invalidated when saved or deleted; the timeout only
+    # bounds the staleness after changes that bypass the model's signals.
+    CACHE_TIMEOUT = 60 * 60
+
     class Meta(object):
         unique_together = ('course_id', 'mode_slug', 'currency')
 
@@ -185,6 +193,60 @@ class CourseMode(models.Model):
             self.expiration_datetime_is_explicit = True
         self._expiration_datetime = new_datetime
 
+    @classmethod
+    def cache_key_name(cls, course_id):
+        """Return cache key name to be used to cache the modes of a course.
+        Args:
+            course_id (CourseKey): The course.
+
+        Returns:
+            Unicode cache key
+        """
+        return cls.CACHE_KEY.format(unicode(course_id))
+
+    @classmethod
+    def _get_cached_modes_for_courses(cls, course_id_list):
+        """Return all the modes stored for a list of course IDs, including expired modes.
+
+        The modes are read from the cache in a single round trip, and those of
+        the courses that aren't cached are loaded with a single query, and cached.
+        Expiration is left to the callers to check, so that the cached modes stay
+        valid as their expiration datetimes pass.
+
+        Arguments:
+            course_id_list (list): List of `CourseKey`s
+
+        Returns:
+            dict mapping `CourseKey` to lists of `Mode`, which are empty
+            for courses that have no modes in the database.
+
+        """
+        cache_keys = {cls.cache_key_name(course_id): course_id for course_id in course_id_list}
+        modes_by_course = {
+            cache_keys[cache_key]: modes
+            for cache_key, modes in cache.get_many(cache_keys.keys()).iteritems()
+        }
+
+        missing_courses = {
+            unicode(course_id): course_id
+            for course_id in course_id_list
+            if course_id not in modes_by_course
+        }
+        if missing_courses:
+            loaded_modes = {course_id: [] for course_id in missing_courses.itervalues()}
+            found_course_modes = cls.objects.filter(course_id__in=missing_courses.values()).order_by('id')
+            for mode in found_course_modes:
+                course_id = missing_courses.get(unicode(mode.course_id))
+                if course_id is not None:
+                    loaded_modes[course_id].append(mode.to_tuple())
+            cache.set_many(
+                {cls.cache_key_name(course_id): modes for course_id, modes in loaded_modes.iteritems()},
+                cls.CACHE_TIMEOUT
+            )
+            modes_by_course.update(loaded_modes)
+
+        return modes_by_course
+
     @classmethod
     def all_modes_for_courses(cls, course_id_list):
         """Find all modes for a list of course IDs, including expired modes.
@@ -199,13 +261,9 @@ class CourseMode(models.Model):
 
         """
         modes_by_course = defaultdict(list)
-        for mode in cls.objects.filter(course_id__in=course_id_list):
-            modes_by_course[mode.course_id].append(mode.to_tuple())
-
-        # Assign default modes if nothing available in the database
-        missing_courses = set(course_id_list) - set(modes_by_course.keys())
-        for course_id in missing_courses:
-            modes_by_course[course_id] = [cls.DEFAULT_MODE]
+        for course_id, modes in cls._get_cached_modes_for_courses(course_id_list).iteritems():
+            # Assign default modes if nothing available in the database
+            modes_by_course[course_id] = modes or [cls.DEFAULT_MODE]
 
         return modes_by_course
 
@@ -254,15 +312,10 @@ class CourseMode(models.Model):
 
         """
         now = datetime.now(pytz.UTC)
-        found_course_modes = cls.objects.filter(
-            Q(course_id=course_id) &
-            Q(min_price__gt=0) &
-            (
-                Q(_expiration_datetime__isnull=True) |
-                Q(_expiration_datetime__gte=now)
-            )
-        )
-        return [mode.to_tuple() for mode in found_course_modes]
+        return [
+            mode for mode in cls._get_cached_modes_for_courses([course_id])[course_id]
+            if mode.min_price > 0 and (mode.expiration_datetime is None or mode.expiration_datetime >= now)
+        ]
 
     @classmethod
     def modes_for_course(cls, course_id, include_expired=False, only_selectable=True):
@@ -287,28 +340,51 @@ class CourseMode(models.Model):
             list of `Mode` tuples
 
         """
-        now = datetime.now(pytz.UTC)
+        return cls.modes_for_courses(
+            [course_id], include_expired=include_expired, only_selectable=only_selectable
+        )[course_id]
 
-        found_course_modes = cls.objects.filter(course_id=course_id)
+    @classmethod
+    def modes_for_courses(cls, course_id_list, include_expired=False, only_selectable=True):
+        """
+        Returns the non-expired modes for each of a list of course ids, as
+        modes_for_course does, with at most one cache round trip and one query.
 
-        # Filter out expired course modes if include_expired is not set
-        if not include_expired:
-            found_course_modes = found_course_modes.filter(
-                Q(_expiration_datetime__isnull=True) | Q(_expiration_datetime__gte=now)
-            )
+        Arguments:
+            course_id_list (list of `CourseKey`): Search for course modes for these courses.
 
-        # Credit course modes are currently not shown on the track selection page;
-        # they're available only when students complete a course.  For this reason,
-        # we exclude them from the list if we're only looking for selectable modes
-        # (e.g. on the track selection page or in the payment/verification flows).
-        if only_selectable:
-            found_course_modes = found_course_modes.exclude(mode_slug__in=cls.CREDIT_MODES)
+        Keyword Arguments:
+            include_expired (bool): If True, expired course modes will be included
+            in the returned JSON data. If False, these modes will be omitted.
 
-        modes = ([mode.to_tuple() for mode in found_course_modes])
-        if not modes:
-            modes = [cls.DEFAULT_MODE]
+            only_selectable (bool): If True, include only modes that are shown
+                to users on the track selection page.
 
-        return modes
+        Returns:
+            dict mapping `CourseKey` to lists of `Mode` tuples
+
+        """
+        now = datetime.now(pytz.UTC)
+
+        modes_by_course = {}
+        for course_id, found_course_modes in cls._get_cached_modes_for_courses(course_id_list).iteritems():
+            # Filter out expired course modes if include_expired is not set
+            if not include_expired:
+                found_course_modes = [
+                    mode for mode in found_course_modes
+                    if mode.expiration_datetime is None or mode.expiration_datetime >= now
+                ]
+
+            # Credit course modes are currently not shown on the track selection page;
+            # they're available only when students complete a course.  For this reason,
+            # we exclude them from the list if we're only looking for selectable modes
+            # (e.g. on the track selection page or in the payment/verification flows).
+            if only_selectable:
+                found_course_modes = [mode for mode in found_course_modes if mode.slug not in cls.CREDIT_MODES]
+
+            modes_by_course[course_id] = found_course_modes or [cls.DEFAULT_MODE]
+
+        return modes_by_course
 
     @classmethod
     def modes_for_course_dict(cls, course_id, modes=None, **kwargs):
@@ -663,6 +739,13 @@ class CourseMode(models.Model):
         )
 
 
+@receiver(post_save, sender=CourseMode)
+@receiver(post_delete, sender=CourseMode)
+def invalidate_course_mode_cache(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Invalidate the cached modes of the course of a CourseMode. """
+    cache.delete(CourseMode.cache_key_name(instance.course_id))
+
+
 class CourseModesArchive(models.Model):
     """
     Store the past values of course_mode that a course had in the past. We decided on having
@@ -9,8 +9,11 @@ from datetime import datetime, timedelta
 import itertools
 
 import ddt
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.test import TestCase
+from django.test.utils import override_settings
+from freezegun import freeze_time
 from opaque_keys.edx.locations import SlashSeparatedCourseKey
 from opaque_keys.edx.locator import CourseLocator
 import pytz
@@ -261,6 +264,36 @@ class CourseModeModelTest(TestCase):
         self.assertEqual(len(all_modes[other_course_key]), 1)
         self.assertEqual(all_modes[other_course_key][0], CourseMode.DEFAULT_MODE)
 
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_cached_modes(self):
+        cache.clear()
+        now = datetime.now(pytz.UTC)
+        honor, __ = self.create_mode('honor', 'Honor')
+        self.create_mode('verified', 'Verified', 10, expiration_datetime=now + timedelta(days=1))
+        other_course_key = CourseLocator(org="not", course="a", run="course")
+
+        # The modes of both courses are loaded with one query, and then cached
+        with self.assertNumQueries(1):
+            modes = CourseMode.modes_for_courses([self.course_key, other_course_key])
+        self.assertEqual([mode.slug for mode in modes[self.course_key]], ['honor', 'verified'])
+        self.assertEqual(modes[other_course_key], [CourseMode.DEFAULT_MODE])
+        with self.assertNumQueries(0):
+            self.assertEqual(CourseMode.modes_for_course(self.course_key), modes[self.course_key])
+            self.assertEqual(CourseMode.modes_for_course(other_course_key), [CourseMode.DEFAULT_MODE])
+
+        # The cached modes expire as their expiration datetimes pass
+        with freeze_time(now + timedelta(days=2)):
+            with self.assertNumQueries(0):
+                self.assertEqual([mode.slug for mode in CourseMode.modes_for_course(self.course_key)], ['honor'])
+                self.assertEqual(len(CourseMode.modes_for_course(self.course_key, include_expired=True)), 2)
+
+        # Saving and deleting modes invalidates the cached modes of their course
+        honor.mode_display_name = 'Honorable'
+        honor.save()
+        self.assertEqual(CourseMode.mode_for_course(self.course_key, 'honor').name, 'Honorable')
+        honor.delete()
+        self.assertIsNone(CourseMode.mode_for_course(self.course_key, 'honor'))
+
     @ddt.data('', 'no-id-professional', 'professional', 'verified')
     def test_course_has_professional_mode(self, mode):
         # check the professional mode.
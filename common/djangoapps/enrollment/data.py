@@ -7,6 +7,7 @@ import logging
 from django.contrib.auth.models import User
 from opaque_keys.edx.keys import CourseKey
 
+from course_modes.models import CourseMode
 from enrollment.errors import (
     CourseEnrollmentClosedError, CourseEnrollmentFullError,
     CourseEnrollmentExistsError, UserNotFoundError, InvalidEnrollmentAttribute
@@ -23,6 +24,33 @@ from student.models import (
 
 log = logging.getLogger(__name__)
 
+# Number of enrollments loaded per query by iter_user_enrollments
+ENROLLMENTS_CHUNK_SIZE = 1000
+
+
+def _serialize_enrollments(enrollments):
+    """Serialize a list of enrollments, with the details of their courses.
+
+    The course overviews and the course modes of all the enrollments' courses
+    are loaded in bulk beforehand, rather than once per enrollment.
+
+    Args:
+        enrollments (list): CourseEnrollment objects, with their users loaded.
+
+    Returns:
+        A serializable list of dictionaries of all aggregated enrollment data.
+
+    """
+    course_ids = set(enrollment.course_id for enrollment in enrollments)
+    course_overviews = CourseOverview.get_many(course_ids)
+    for enrollment in enrollments:
+        # pylint: disable=protected-access
+        enrollment._course_overview = course_overviews.get(enrollment.course_id)
+        enrollment._course_overview_load_failed = enrollment._course_overview is None
+
+    course_modes = CourseMode.modes_for_courses(course_overviews.keys(), only_selectable=False)
+    return CourseEnrollmentSerializer(enrollments, many=True, context={'course_modes': course_modes}).data
+
 
 def get_course_enrollments(user_id, org_filter=None):
     """Retrieve a list representing all aggregated data for a user's course enrollments.
@@ -40,7 +68,7 @@ def get_course_enrollments(user_id, org_filter=None):
     qset = CourseEnrollment.objects.filter(
         user__username=user_id,
         is_active=True
-    ).order_by('created')
+    ).select_related('user').order_by('created')
 
     # apply ORG filter, if specified
     # NOTE, do not do a Falsy type check here because an empty list
@@ -54,7 +82,7 @@ def get_course_enrollments(user_id, org_filter=None):
 
         qset = _set
 
-    enrollments = CourseEnrollmentSerializer(qset, many=True).data
+    enrollments = _serialize_enrollments(list(qset))
 
     # Find deleted courses and filter them out of the results
     deleted = []
@@ -121,7 +149,7 @@ def get_user_enrollments(course_id, org_filter=None, serialize=True):
 
         qset = CourseEnrollment.objects.filter(
             course_id=course_id
-        )
+        ).select_related('user')
 
         # apply ORG filter, if specified
         # NOTE, do not do a Falsy type check here because an empty list
@@ -136,13 +164,48 @@ def get_user_enrollments(course_id, org_filter=None, serialize=True):
             qset = _set
 
         if serialize:
-            return CourseEnrollmentSerializer(qset, many=True).data
+            return _serialize_enrollments(list(qset))
         else:
             return qset
     except CourseEnrollment.DoesNotExist:
         return None
 
 
+def iter_user_enrollments(course_id, chunk_size=ENROLLMENTS_CHUNK_SIZE):
+    """Based on the course id, iterate over the serialized user enrollments in the course
+
+    The enrollments are loaded in chunks of `chunk_size`, ordered by ID, each
+    query resuming after the last enrollment of the previous chunk, so that
+    large courses are streamed in constant memory and time per chunk.
+
+    Args:
+        course_id (str): The course to retrieve enrollment information for.
+
+        chunk_size (int): The number of enrollments loaded per query.
+
+    Yields:
+        Serializable dictionaries of the course's user enrollments
+
+    """
+    if isinstance(course_id, basestring):
+        course_id = CourseKey.from_string(course_id)
+
+    qset = CourseEnrollment.objects.filter(course_id=course_id).select_related('user').order_by('id')
+    last_id = None
+    while True:
+        chunk_qset = qset if last_id is None else qset.filter(id__gt=last_id)
+        enrollments = list(chunk_qset[:chunk_size])
+        if not enrollments:
+            return
+
+        for enrollment in _serialize_enrollments(enrollments):
+            yield enrollment
+
+        if len(enrollments) < chunk_size:
+            return
+        last_id = enrollments[-1].id
+
+
 def create_course_enrollment(username, course_id, mode, is_active):
     """Create a new course enrollment for the given user.
 
@@ -51,12 +51,19 @@ class CourseSerializer(serializers.Serializer):  # pylint: disable=abstract-meth
     def get_course_modes(self, obj):
         """
         Retrieve course modes associated with the course.
+
+        The unexpired modes are taken from the `course_modes` dict of the
+        serializer context, when the caller prefetched them for several courses.
         """
-        course_modes = CourseMode.modes_for_course(
-            obj.id,
-            include_expired=self.include_expired,
-            only_selectable=False
-        )
+        prefetched_modes = self.context.get('course_modes')
+        if prefetched_modes is not None and obj.id in prefetched_modes and not self.include_expired:
+            course_modes = prefetched_modes[obj.id]
+        else:
+            course_modes = CourseMode.modes_for_course(
+                obj.id,
+                include_expired=self.include_expired,
+                only_selectable=False
+            )
         return [
             ModeSerializer(mode).data
             for mode in course_modes
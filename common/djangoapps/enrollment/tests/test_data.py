@@ -232,6 +232,39 @@ class EnrollmentDataTest(ModuleStoreTestCase):
         )
         self.assertEqual(other_org_results, [])
 
+    @ddt.data(1, 3, 10, 100)
+    def test_iter_user_enrollments(self, chunk_size):
+        self._create_course_modes(['honor', 'verified', 'audit'])
+        self.assertEqual(list(data.iter_user_enrollments(unicode(self.course.id), chunk_size=chunk_size)), [])
+
+        created_enrollments = []
+        for i in xrange(10):
+            user = UserFactory.create(username=self.USERNAME + str(i))
+            created_enrollments.append(data.create_course_enrollment(
+                user.username,
+                unicode(self.course.id),
+                'verified',
+                True
+            ))
+
+        results = list(data.iter_user_enrollments(unicode(self.course.id), chunk_size=chunk_size))
+        self.assertEqual(results, created_enrollments)
+
+    def test_course_details_prefetched(self):
+        courses = [CourseFactory.create(number=str(i)) for i in xrange(3)]
+        created_enrollments = []
+        for course in courses:
+            self._create_course_modes(['honor', 'verified'], course=course)
+            created_enrollments.append(
+                data.create_course_enrollment(self.user.username, unicode(course.id), 'honor', True)
+            )
+
+        # The modes of all the courses are prefetched, rather than looked up per course
+        with patch.object(CourseMode, 'modes_for_course') as mock_modes_for_course:
+            results = data.get_course_enrollments(self.user.username)
+        self.assertFalse(mock_modes_for_course.called)
+        self.assertEqual(results, created_enrollments)
+
     @ddt.data(
         # Default (no course modes in the database)
         # Expect that users are automatically enrolled as "honor".
@@ -1010,6 +1010,8 @@ class CourseEnrollment(models.Model):
         # Private variable for storing course_overview to minimize calls to the database.
         # When the property .course_overview is accessed for the first time, this variable will be set.
         self._course_overview = None
+        # Whether the course_overview failed to load, in which case it isn't loaded again.
+        self._course_overview_load_failed = False
 
     def __unicode__(self):
         return (
@@ -1579,11 +1581,12 @@ class CourseEnrollment(models.Model):
             CourseEnrollment object, then the value of this property will
             become stale.
        """
-        if not self._course_overview:
+        if not self._course_overview and not self._course_overview_load_failed:
             try:
                 self._course_overview = CourseOverview.get_from_id(self.course_id)
             except (CourseOverview.DoesNotExist, IOError):
                 self._course_overview = None
+                self._course_overview_load_failed = True
         return self._course_overview
 
     def is_verified_enrollment(self):
@@ -1777,9 +1780,53 @@ class CourseAccessRole(models.Model):
     course_id = CourseKeyField(max_length=255, db_index=True, blank=True)
     role = models.CharField(max_length=64, db_index=True)
 
+    # cache key format e.g course_access_roles.<user_id>.version = '<hex uuid>'
+    ROLES_VERSION_CACHE_KEY = u'course_access_roles.{}.version'
+    # cache key format e.g course_access_roles.<user_id>.<version> = {(role, course_id, org), ...}
+    ROLES_CACHE_KEY = u'course_access_roles.{}.{}'
+    # A role change that commits while its user's roles are being cached may be
+    # missed until the snapshot expires.
+    ROLES_CACHE_TIMEOUT = 10 * 60
+
     class Meta(object):
         unique_together = ('user', 'org', 'course_id', 'role')
 
+    @classmethod
+    def roles_for_user(cls, user):
+        """
+        Returns a frozenset of (role, course_id, org) tuples identifying all the
+        roles held by the given user.
+
+        The roles are cached as a snapshot stamped with the user's role version,
+        which is replaced whenever one of the user's roles is saved or deleted,
+        so that an outdated snapshot is never read again.
+        """
+        version_cache_key = cls.ROLES_VERSION_CACHE_KEY.format(user.id)
+        version = cache.get(version_cache_key)
+        if version is None:
+            version = uuid.uuid4().hex
+            if not cache.add(version_cache_key, version, None):
+                version = cache.get(version_cache_key) or version
+        else:
+            roles = cache.get(cls.ROLES_CACHE_KEY.format(user.id, version))
+            if roles is not None:
+                return roles
+
+        roles = frozenset(
+            (access_role.role, access_role.course_id, access_role.org)
+            for access_role in cls.objects.filter(user=user)
+        )
+        cache.set(cls.ROLES_CACHE_KEY.format(user.id, version), roles, cls.ROLES_CACHE_TIMEOUT)
+        return roles
+
+    @classmethod
+    def update_roles_version(cls, user_id):
+        """
+        Stamps the roles of the given user with a new version, invalidating the
+        cached snapshot of them.
+        """
+        cache.set(cls.ROLES_VERSION_CACHE_KEY.format(user_id), uuid.uuid4().hex, None)
+
     @property
     def _key(self):
         """
@@ -1808,6 +1855,13 @@ class CourseAccessRole(models.Model):
         return "[CourseAccessRole] user: {}   role: {}   org: {}   course: {}".format(self.user.username, self.role, self.org, self.course_id)
 
 
+@receiver(models.signals.post_save, sender=CourseAccessRole)
+@receiver(models.signals.post_delete, sender=CourseAccessRole)
+def invalidate_course_access_roles_cache(sender, instance, **kwargs):  # pylint: disable=unused-argument, invalid-name
+    """Invalidate the cached roles of the user of a CourseAccessRole. """
+    CourseAccessRole.update_roles_version(instance.user_id)
+
+
 #### Helper methods for use from python manage.py shell and other classes.
 
 
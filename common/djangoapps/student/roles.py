@@ -39,19 +39,17 @@ class RoleCache(object):
     A cache of the CourseAccessRoles held by a particular user
     """
     def __init__(self, user):
-        self._roles = set(
-            CourseAccessRole.objects.filter(user=user).all()
-        )
+        self._roles = CourseAccessRole.roles_for_user(user)
 
     def has_role(self, role, course_id, org):
         """
         Return whether this RoleCache contains a role with the specified role, course_id, and org
         """
         return any(
-            access_role.role == role and
-            access_role.course_id == course_id and
-            access_role.org == org
-            for access_role in self._roles
+            access_role == role and
+            access_course_id == course_id and
+            access_org == org
+            for access_role, access_course_id, access_org in self._roles
         )
 
 
@@ -115,7 +115,10 @@ class TestCourseListing(ModuleStoreTestCase, MilestonesTestCaseMixin):
         self._create_course_with_access_groups(course_location, default_store=ModuleStoreEnum.Type.mongo)
         mongo_store.delete_course(course_location, ModuleStoreEnum.UserID.test)
 
-        courses_list = list(get_course_enrollments(self.student, None, []))
+        # The deleted course is only looked up once.
+        with mock.patch.object(CourseOverview, 'get_from_id') as mock_get_from_id:
+            courses_list = list(get_course_enrollments(self.student, None, []))
+        self.assertFalse(mock_get_from_id.called)
         self.assertEqual(len(courses_list), 1, courses_list)
         self.assertEqual(courses_list[0].course_id, good_location)
 
@@ -2,7 +2,9 @@
 Tests of student.roles
 """
 import ddt
+from django.core.cache import cache
 from django.test import TestCase
+from django.test.utils import override_settings
 
 from courseware.tests.factories import UserFactory, StaffFactory, InstructorFactory
 from student.tests.factories import AnonymousUserFactory
@@ -193,3 +195,22 @@ class RoleCacheTestCase(TestCase):
     def test_empty_cache(self, role, target):
         cache = RoleCache(self.user)
         self.assertFalse(cache.has_role(*target))
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_cached_roles(self):
+        cache.clear()
+        role, target = self.ROLES[0]
+        other_role, other_target = self.ROLES[1]
+        role.add_users(self.user)
+
+        # The roles are loaded once, and then read from the cache.
+        self.assertTrue(RoleCache(self.user).has_role(*target))
+        with self.assertNumQueries(0):
+            self.assertTrue(RoleCache(self.user).has_role(*target))
+
+        # Adding and removing roles invalidates the cached roles.
+        other_role.add_users(self.user)
+        self.assertTrue(RoleCache(self.user).has_role(*other_target))
+        role.remove_users(self.user)
+        self.assertFalse(RoleCache(self.user).has_role(*target))
+        self.assertTrue(RoleCache(self.user).has_role(*other_target))
@@ -128,6 +128,7 @@ from openedx.core.djangoapps.site_configuration import helpers as configuration_
 from openedx.core.djangoapps.theming import helpers as theming_helpers
 from openedx.core.djangoapps.user_api.preferences import api as preferences_api
 from openedx.core.djangoapps.catalog.utils import get_programs_data
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 
 
 log = logging.getLogger("edx.student")
@@ -297,7 +298,18 @@ def get_course_enrollments(user, org_to_include, orgs_to_exclude):
         generator[CourseEnrollment]: a sequence of enrollments to be displayed
         on the user's dashboard.
     """
-    for enrollment in CourseEnrollment.enrollments_for_user(user):
+    enrollments = list(CourseEnrollment.enrollments_for_user(user))
+
+    # Load the overviews of all the enrolled courses at once, rather than
+    # one at a time as each enrollment's course_overview is accessed.
+    course_overviews = CourseOverview.get_many([enrollment.course_id for enrollment in enrollments])
+    for enrollment in enrollments:
+        # pylint: disable=protected-access
+        enrollment._course_overview = course_overviews.get(enrollment.course_id)
+        # The courses left out couldn't be loaded, so they aren't loaded again.
+        enrollment._course_overview_load_failed = enrollment._course_overview is None
+
+    for enrollment in enrollments:
 
         # If the course is missing or broken, log an error and skip it.
         course_overview = enrollment.course_overview
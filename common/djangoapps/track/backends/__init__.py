@@ -25,3 +25,12 @@ class BaseBackend(object):
     def send(self, event):
         """Send event to tracker."""
         pass
+
+    def send_batch(self, events):
+        """
+        Send a batch of events to tracker.  Backends that can store
+        several events at once should override this, and raise an
+        exception if the events couldn't be stored.
+        """
+        for event in events:
+            self.send(event)
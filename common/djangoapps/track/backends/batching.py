@@ -0,0 +1,182 @@
+"""
+Event tracker backend that sends events to another backend in batches,
+from a background thread, so that tracking doesn't add latency to requests.
+
+Example configuration::
+
+  TRACKING_BACKENDS = {
+      'mongo': {
+          'ENGINE': 'track.backends.batching.BatchingBackend',
+          'OPTIONS': {
+              'backend': {
+                  'ENGINE': 'track.backends.mongodb.MongoBackend',
+                  'OPTIONS': {...},
+              },
+              'max_queue_size': 10000,
+              'batch_size': 100,
+              'flush_interval': 1.0,
+              'overflow': 'drop_newest',
+          }
+      }
+  }
+
+"""
+
+from __future__ import absolute_import
+
+import atexit
+import logging
+import os
+import threading
+import time
+from Queue import Queue, Empty, Full
+
+from dogapi import dog_stats_api
+
+from track.backends import BaseBackend
+
+
+log = logging.getLogger(__name__)
+
+
+class BatchingBackend(BaseBackend):
+    """
+    Event tracker backend that queues events in memory, and sends them to
+    the backend it wraps in batches of up to `batch_size` events, at least
+    every `flush_interval` seconds.
+
+    The queue holds up to `max_queue_size` events.  When it's full, the
+    `overflow` policy decides which event is dropped: 'drop_newest' (the
+    event being sent) or 'drop_oldest' (the event queued first).  Events
+    that are dropped, or that the wrapped backend fails to send, are lost.
+
+    The queued events are flushed when the process exits.
+    """
+    OVERFLOW_POLICIES = ('drop_newest', 'drop_oldest')
+
+    def __init__(self, backend, max_queue_size=10000, batch_size=100, flush_interval=1.0,
+                 overflow='drop_newest', **kwargs):
+        """
+        :Parameters:
+
+          - `backend`: configuration of the wrapped backend, a dict with
+            an `ENGINE` and optional `OPTIONS`
+          - `max_queue_size`: maximum number of queued events
+          - `batch_size`: maximum number of events sent at once
+          - `flush_interval`: maximum number of seconds an event is queued
+            for, unless the wrapped backend is slower
+          - `overflow`: policy applied when the queue is full
+
+        """
+        super(BatchingBackend, self).__init__(**kwargs)
+
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError('Invalid overflow policy %s' % overflow)
+
+        # import here, because the tracker module instantiates the backends when it's loaded
+        from track.tracker import _instantiate_backend_from_name
+        self.backend = _instantiate_backend_from_name(backend['ENGINE'], backend.get('OPTIONS', {}))
+
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+
+        self.flushed_count = 0
+        self.dropped_count = 0
+
+        # Serializes the sending of batches, between the background thread and flush.
+        self._send_lock = threading.Lock()
+        self._count_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._pid = None
+        self._queue = None
+        self._thread = None
+
+        atexit.register(self.flush)
+
+    def _get_queue(self):
+        """
+        Returns the queue of events, creating it and starting the thread
+        that flushes it if that wasn't yet done in this process (the
+        thread of a parent process doesn't survive forking).
+        """
+        if self._pid != os.getpid():
+            with self._start_lock:
+                if self._pid != os.getpid():
+                    self._queue = Queue(self.max_queue_size)
+                    self._thread = threading.Thread(target=self._run, name='BatchingBackend')
+                    self._thread.daemon = True
+                    self._thread.start()
+                    self._pid = os.getpid()
+        return self._queue
+
+    def send(self, event):
+        """Queue the event, to be sent by the background thread."""
+        queue = self._get_queue()
+        try:
+            queue.put_nowait(event)
+        except Full:
+            if self.overflow == 'drop_oldest':
+                try:
+                    queue.get_nowait()
+                except Empty:
+                    pass
+                try:
+                    queue.put_nowait(event)
+                except Full:
+                    pass
+            self._count_dropped(1)
+
+    def flush(self):
+        """Send all the queued events, from the calling thread."""
+        queue = self._queue
+        if queue is None or self._pid != os.getpid():
+            return
+
+        while True:
+            batch = []
+            try:
+                while len(batch) < self.batch_size:
+                    batch.append(queue.get_nowait())
+            except Empty:
+                pass
+            if not batch:
+                return
+            self._send_batch(batch)
+
+    def _run(self):
+        """Send the queued events in batches, forever."""
+        queue = self._queue
+        while True:
+            batch = [queue.get()]
+            deadline = time.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(queue.get(timeout=timeout))
+                except Empty:
+                    break
+            self._send_batch(batch)
+
+    def _send_batch(self, batch):
+        """Send the given events to the wrapped backend."""
+        with self._send_lock:
+            try:
+                self.backend.send_batch(batch)
+            except Exception:  # pylint: disable=broad-except
+                # broad exception so that the background thread keeps running
+                log.exception('Error sending %d events to the batched event tracker backend', len(batch))
+                self._count_dropped(len(batch))
+            else:
+                with self._count_lock:
+                    self.flushed_count += len(batch)
+                dog_stats_api.increment('track.batching.flushed', len(batch))
+
+    def _count_dropped(self, count):
+        """Count the given number of lost events."""
+        with self._count_lock:
+            self.dropped_count += count
+        dog_stats_api.increment('track.batching.dropped', count)
@@ -97,3 +97,12 @@ class MongoBackend(BaseBackend):
             # during the next event.
             msg = 'Error inserting to MongoDB event tracker backend'
             log.exception(msg)
+
+    def send_batch(self, events):
+        """
+        Insert the events in to the Mongo collection, all at once.
+
+        Errors are raised rather than logged, so that the caller can count
+        the events as lost.
+        """
+        self.collection.insert(events, manipulate=False)
@@ -0,0 +1,91 @@
+"""Tests for the batching event tracker backend."""
+from __future__ import absolute_import
+
+import time
+
+import ddt
+from mock import patch
+
+from django.test import TestCase
+
+from track.backends import BaseBackend
+from track.backends.batching import BatchingBackend
+
+
+class RecordingBackend(BaseBackend):
+    """Backend that records the batches of events it's sent."""
+    batches = []
+
+    def send(self, event):
+        self.send_batch([event])
+
+    def send_batch(self, events):
+        self.batches.append(list(events))
+
+
+@ddt.ddt
+class TestBatchingBackend(TestCase):
+    def setUp(self):
+        super(TestBatchingBackend, self).setUp()
+        RecordingBackend.batches = []
+
+    def create_backend(self, **kwargs):
+        """Returns a batching backend wrapping a RecordingBackend."""
+        return BatchingBackend(
+            backend={'ENGINE': 'track.backends.tests.test_batching.RecordingBackend'},
+            **kwargs
+        )
+
+    # Patching _run keeps the events queued until they're flushed by the test.
+    @patch.object(BatchingBackend, '_run')
+    def test_flush_in_batches(self, _mock_run):
+        backend = self.create_backend(batch_size=2)
+        for index in range(5):
+            backend.send({'test': index})
+        self.assertEqual(RecordingBackend.batches, [])
+
+        backend.flush()
+        self.assertEqual(
+            RecordingBackend.batches,
+            [[{'test': 0}, {'test': 1}], [{'test': 2}, {'test': 3}], [{'test': 4}]],
+        )
+        self.assertEqual(backend.flushed_count, 5)
+        self.assertEqual(backend.dropped_count, 0)
+
+    @ddt.data(
+        ('drop_newest', [{'test': 0}, {'test': 1}]),
+        ('drop_oldest', [{'test': 2}, {'test': 3}]),
+    )
+    @ddt.unpack
+    @patch.object(BatchingBackend, '_run')
+    def test_overflow(self, overflow, expected_events, _mock_run):
+        backend = self.create_backend(max_queue_size=2, overflow=overflow)
+        for index in range(4):
+            backend.send({'test': index})
+
+        backend.flush()
+        self.assertEqual(RecordingBackend.batches, [expected_events])
+        self.assertEqual(backend.flushed_count, 2)
+        self.assertEqual(backend.dropped_count, 2)
+
+    @patch.object(BatchingBackend, '_run')
+    def test_send_error(self, _mock_run):
+        backend = self.create_backend()
+        backend.send({'test': 0})
+        with patch.object(RecordingBackend, 'send_batch', side_effect=Exception):
+            backend.flush()
+        self.assertEqual(backend.flushed_count, 0)
+        self.assertEqual(backend.dropped_count, 1)
+
+    def test_background_flush(self):
+        backend = self.create_backend(flush_interval=0.01)
+        backend.send({'test': 0})
+        for __ in range(100):
+            if RecordingBackend.batches:
+                break
+            time.sleep(0.01)
+        self.assertEqual(RecordingBackend.batches, [[{'test': 0}]])
+
+    def test_invalid_overflow(self):
+        with self.assertRaises(ValueError):
+            self.create_backend(overflow='block')
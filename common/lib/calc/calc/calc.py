@@ -7,6 +7,9 @@ Uses pyparsing to parse. Main function as of now is evaluator().
 import math
 import operator
 import numbers
+import threading
+from collections import OrderedDict
+
 import numpy
 import scipy.constants
 import functions
@@ -61,6 +64,13 @@ DEFAULT_VARIABLES = {
     'q': scipy.constants.e  # Fund. Charge: 1.602176565e-19 (Coulombs)
 }
 
+# Functions which, applied to an array of samples, give the array of their
+# results for each sample, so that they can be used by `evaluator_batch`.
+VECTORIZED_FUNCTIONS = frozenset(
+    func for name, func in DEFAULT_FUNCTIONS.iteritems()
+    if name not in ('fact', 'factorial', 'arccot')
+)
+
 # We eliminated the following extreme suffixes:
 #   P (1e15), E (1e18), Z (1e21), Y (1e24),
 #   f (1e-15), a (1e-18), z (1e-21), y (1e-24)
@@ -200,6 +210,69 @@ def eval_product(parse_result):
     return prod
 
 
+def is_operand(token):
+    """
+    Return whether the token is a (previously calculated) number or array of
+    numbers, rather than an operator or a parenthesis.
+    """
+    return not isinstance(token, basestring)
+
+
+def eval_atom_batch(parse_result):
+    """
+    Like `eval_atom`, for arrays of values.
+    """
+    return next(k for k in parse_result if is_operand(k))
+
+
+def eval_power_batch(parse_result):
+    """
+    Like `eval_power`, for arrays of values.
+    """
+    parse_result = reversed([k for k in parse_result if is_operand(k)])
+    return reduce(lambda a, b: b ** a, parse_result)
+
+
+def eval_parallel_batch(parse_result):
+    """
+    Like `eval_parallel`, for arrays of values.
+
+    A zero among the inputs raises a FloatingPointError (within `evaluator_batch`).
+    """
+    operands = [k for k in parse_result if is_operand(k)]
+    if len(operands) == 1:
+        return operands[0]
+    return 1. / sum(1. / k for k in operands)
+
+
+def eval_sum_batch(parse_result):
+    """
+    Like `eval_sum`, for arrays of values.
+    """
+    total = 0.0
+    current_op = operator.add
+    for token in parse_result:
+        if not is_operand(token):
+            current_op = operator.add if token == '+' else operator.sub
+        else:
+            total = current_op(total, token)
+    return total
+
+
+def eval_product_batch(parse_result):
+    """
+    Like `eval_product`, for arrays of values.
+    """
+    prod = 1.0
+    current_op = operator.mul
+    for token in parse_result:
+        if not is_operand(token):
+            current_op = operator.mul if token == '*' else operator.truediv
+        else:
+            prod = current_op(prod, token)
+    return prod
+
+
 def add_defaults(variables, functions, case_sensitive):
     """
     Create dictionaries with both the default and user-defined variables.
@@ -229,8 +302,7 @@ def evaluator(variables, functions, math_expr, case_sensitive=False):
         return float('nan')
 
     # Parse the tree.
-    math_interpreter = ParseAugmenter(math_expr, case_sensitive)
-    math_interpreter.parse_algebra()
+    math_interpreter = parse_algebra_cached(math_expr, case_sensitive)
 
     # Get our variables together.
     all_variables, all_functions = add_defaults(variables, functions, case_sensitive)
@@ -258,6 +330,128 @@ def evaluator(variables, functions, math_expr, case_sensitive=False):
     return math_interpreter.reduce_tree(evaluate_actions)
 
 
+def evaluator_batch(variables_list, functions, math_expr, case_sensitive=False):
+    """
+    Evaluate an expression for each of several sets of variables; that is,
+    take a string of math and return a list of floats.
+
+    -`variables_list` is a list of dictionaries from string to value, such as
+     random samples of the variables. Their values must be python numbers.
+    -Unary functions are passed as a dictionary from string to function.
+
+    Return the same results as calling `evaluator` for each dictionary, or
+    raise the first exception it raises. When the expression only involves
+    vectorized functions, it is evaluated once over arrays of the samples of
+    each variable. If any sample would not evaluate to a finite number, it is
+    evaluated again sample by sample, so that the results match `evaluator`.
+    """
+    # No need to go further.
+    if math_expr.strip() == "":
+        return [float('nan')] * len(variables_list)
+
+    # Parse the tree.
+    math_interpreter = parse_algebra_cached(math_expr, case_sensitive)
+
+    # Get our variables together.
+    all_variables, all_functions = add_defaults({}, functions, case_sensitive)
+
+    if case_sensitive:
+        casify = lambda x: x
+    else:
+        casify = lambda x: x.lower()  # Lowercase for case insens.
+
+    variable_samples = _variable_sample_arrays(variables_list, case_sensitive)
+    if variable_samples is not None:
+        all_variables.update(variable_samples)
+        math_interpreter.check_variables(all_variables, all_functions)
+
+        if all(all_functions[casify(func)] in VECTORIZED_FUNCTIONS for func in math_interpreter.functions_used):
+            evaluate_actions = {
+                'number': eval_number,
+                'variable': lambda x: all_variables[casify(x[0])],
+                'function': lambda x: all_functions[casify(x[0])](x[1]),
+                'atom': eval_atom_batch,
+                'power': eval_power_batch,
+                'parallel': eval_parallel_batch,
+                'product': eval_product_batch,
+                'sum': eval_sum_batch
+            }
+            try:
+                with numpy.errstate(divide='raise', over='raise', invalid='raise', under='ignore'):
+                    results = math_interpreter.reduce_tree(evaluate_actions)
+            except Exception:  # pylint: disable=broad-except
+                # Evaluating sample by sample below raises the actual error, if any.
+                pass
+            else:
+                if numpy.ndim(results) == 0:
+                    return [results] * len(variables_list)
+                return list(results)
+
+    return [
+        evaluator(variables, functions, math_expr, case_sensitive=case_sensitive)
+        for variables in variables_list
+    ]
+
+
+def _variable_sample_arrays(variables_list, case_sensitive):
+    """
+    Return a dictionary from each variable name to the array of its values in
+    `variables_list`, or None if the dictionaries don't all define the same
+    variables as python numbers.
+    """
+    if not variables_list:
+        return None
+
+    names = set(variables_list[0])
+    samples = {}
+    for name in names:
+        values = []
+        for variables in variables_list:
+            value = variables.get(name)
+            if not isinstance(value, numbers.Number) or len(variables) != len(names):
+                return None
+            values.append(value)
+        dtype = float if all(isinstance(value, numbers.Real) for value in values) else complex
+        samples[name] = numpy.array(values, dtype=dtype)
+
+    if not case_sensitive:
+        samples = lower_dict(samples)
+    return samples
+
+
+# Parsed expressions, most recently used last.
+PARSE_CACHE_MAX_SIZE = 1000
+_parse_cache = OrderedDict()  # pylint: disable=invalid-name
+_parse_cache_lock = threading.Lock()  # pylint: disable=invalid-name
+
+
+def parse_algebra_cached(math_expr, case_sensitive=False):
+    """
+    Return a `ParseAugmenter` for the given math expression, with its tree
+    parsed.
+
+    Expressions are parsed again and again while checking answers and
+    rendering previews, so the most recently parsed ones are cached. The
+    returned object is shared, and must not be modified.
+    """
+    key = (math_expr, case_sensitive)
+    with _parse_cache_lock:
+        math_interpreter = _parse_cache.pop(key, None)
+        if math_interpreter is not None:
+            _parse_cache[key] = math_interpreter
+            return math_interpreter
+
+    # Parse outside of the lock; parse errors are not cached.
+    math_interpreter = ParseAugmenter(math_expr, case_sensitive)
+    math_interpreter.parse_algebra()
+
+    with _parse_cache_lock:
+        _parse_cache[key] = math_interpreter
+        while len(_parse_cache) > PARSE_CACHE_MAX_SIZE:
+            _parse_cache.popitem(last=False)
+    return math_interpreter
+
+
 class ParseAugmenter(object):
     """
     Holds the data for a particular parse.
@@ -559,3 +559,83 @@ class EvaluatorTest(unittest.TestCase):
             calc.evaluator({'r1': 5}, {}, "r1+r2")
         with self.assertRaisesRegexp(calc.UndefinedVariable, 'r1 r3'):
             calc.evaluator(variables, {}, "r1*r3", case_sensitive=True)
+
+
+class EvaluatorBatchTest(unittest.TestCase):
+    """
+    Run tests for calc.evaluator_batch, which should give the same results as
+    calc.evaluator for each set of variables.
+    """
+    VARIABLES_LIST = [{'x': -2.0, 'Y': 0.5}, {'x': 0.0, 'Y': 1.0}, {'x': 3.0, 'Y': 2.5}]
+
+    def assert_same_results(self, math_expr, variables_list=None, functions=None, case_sensitive=False):
+        """
+        Assert that `evaluator_batch` evaluates the expression to the same
+        values as `evaluator`, sample by sample.
+        """
+        variables_list = self.VARIABLES_LIST if variables_list is None else variables_list
+        functions = functions or {}
+        try:
+            expected_results = [
+                calc.evaluator(variables, functions, math_expr, case_sensitive=case_sensitive)
+                for variables in variables_list
+            ]
+        except Exception as error:  # pylint: disable=broad-except
+            with self.assertRaises(type(error)):
+                calc.evaluator_batch(variables_list, functions, math_expr, case_sensitive=case_sensitive)
+            return
+
+        results = calc.evaluator_batch(variables_list, functions, math_expr, case_sensitive=case_sensitive)
+        self.assertEqual(len(results), len(expected_results))
+        for result, expected_result in zip(results, expected_results):
+            if numpy.isnan(expected_result):
+                self.assertTrue(numpy.isnan(result))
+            else:
+                self.assertAlmostEqual(result, expected_result)
+
+    def test_expressions(self):
+        for math_expr in [
+                '', '42', '2*pi', 'x', '-x + 3*y - 5', 'x^2^y', '2^x', '(x+1)/(y+1)', 'x || y', 'x*i',
+                'sin(x) + cos(y)^2', 'sec(y) * arcsinh(x)', 'sqrt(y) * 5k', 'abs(x)', 'exp(-x^2/2)',
+        ]:
+            self.assert_same_results(math_expr)
+
+    def test_exceptional_samples(self):
+        """
+        Samples which the vectorized evaluation can't handle, or for which the
+        evaluator gives NaN or raises an exception.
+        """
+        for math_expr in ['x || y - 1', 'sqrt(x)', 'log10(x)', 'arccot(x)', 'arccot(y)', 'x^y', 'fact(y*2)']:
+            self.assert_same_results(math_expr)
+
+        with self.assertRaises(ZeroDivisionError):
+            calc.evaluator_batch(self.VARIABLES_LIST, {}, '1/x')
+        with self.assertRaisesRegexp(ValueError, 'factorial'):
+            calc.evaluator_batch(self.VARIABLES_LIST, {}, 'fact(y)')
+
+    def test_variables_and_functions(self):
+        self.assert_same_results('X*y', case_sensitive=False)
+        self.assert_same_results('x*Y', case_sensitive=True)
+        self.assert_same_results('f(x) + g(y)', functions={'f': numpy.sin, 'g': lambda y: y + 1})
+        self.assert_same_results('x + y', variables_list=[{'x': 1, 'y': 2.0}, {'x': 3, 'y': 1j}])
+        self.assert_same_results('x + y', variables_list=[{'x': 1, 'y': 2.0}, {'x': 3}, {'x': 4, 'y': 5, 'z': 6}])
+        self.assertEqual(calc.evaluator_batch([], {}, 'x'), [])
+
+    def test_undefined_vars(self):
+        with self.assertRaisesRegexp(calc.UndefinedVariable, 'z'):
+            calc.evaluator_batch(self.VARIABLES_LIST, {}, 'x + z')
+        with self.assertRaisesRegexp(calc.UndefinedVariable, 'X'):
+            calc.evaluator_batch(self.VARIABLES_LIST, {}, 'X + Y', case_sensitive=True)
+
+    def test_parse_cache(self):
+        """
+        Expressions are parsed once, for each value of `case_sensitive`.
+        """
+        math_expr = 'x^2 + 2*x*y + y^2'
+        math_interpreter = calc.parse_algebra_cached(math_expr)
+        self.assertIs(calc.parse_algebra_cached(math_expr), math_interpreter)
+        self.assertIsNot(calc.parse_algebra_cached(math_expr, case_sensitive=True), math_interpreter)
+        self.assertEqual(math_interpreter.variables_used, {'x', 'y'})
+
+        with self.assertRaises(ParseException):
+            calc.parse_algebra_cached('x^')
@@ -32,6 +32,7 @@ from capa.util import contextualize_text, convert_files_to_filenames
 import capa.xqueue_interface as xqueue_interface
 from capa.safe_exec import safe_exec
 from openedx.core.djangolib.markup import HTML
+from openedx.core.lib.cache_utils import LRUCache
 from xmodule.stringify import stringify_children
 
 
@@ -72,6 +73,12 @@ html_problem_semantics = [
 
 log = logging.getLogger(__name__)
 
+# Maximum number of problems whose parsed trees and script contexts are kept in
+# each process's memory, so that they needn't be parsed and executed again.
+PREPROCESSED_PROBLEM_CACHE_MAX_ITEMS = 500
+
+_preprocessed_problem_cache = LRUCache(max_items=PREPROCESSED_PROBLEM_CACHE_MAX_ITEMS)  # pylint: disable=invalid-name
+
 #-----------------------------------------------------------------------------
 # main class for this module
 
@@ -177,19 +184,30 @@ class LoncapaProblem(object):
         problem_text = re.sub(r"endouttext\s*/", "/text", problem_text)
         self.problem_text = problem_text
 
-        # parse problem XML file into an element tree
-        self.tree = etree.XML(problem_text)
+        cache_key = None if minimal_init else self._preprocessed_problem_cache_key()
+        cached_problem = _preprocessed_problem_cache.get(cache_key) if cache_key else None
+        if cached_problem is not None:
+            # Both the tree and the context are modified by the responses, so
+            # each problem gets its own copy of them.
+            self.tree, self.context = deepcopy(cached_problem)
+            self.context['anonymous_student_id'] = self.capa_system.anonymous_student_id
+        else:
+            # parse problem XML file into an element tree
+            self.tree = etree.XML(problem_text)
+
+            self.make_xml_compatible(self.tree)
 
-        self.make_xml_compatible(self.tree)
+            # handle any <include file="foo"> tags
+            self._process_includes()
 
-        # handle any <include file="foo"> tags
-        self._process_includes()
+            # construct script processor context (eg for customresponse problems)
+            if minimal_init:
+                self.context = {}
+            else:
+                self.context = self._extract_context(self.tree)
 
-        # construct script processor context (eg for customresponse problems)
-        if minimal_init:
-            self.context = {}
-        else:
-            self.context = self._extract_context(self.tree)
+            if cache_key:
+                _preprocessed_problem_cache.set(cache_key, deepcopy((self.tree, self.context)))
 
         # Pre-parse the XML tree: modifies it to add ID's and perform some in-place
         # transformations.  This also creates the dict (self.responders) of Response
@@ -611,6 +629,24 @@ class LoncapaProblem(object):
 
     # ======= Private Methods Below ========
 
+    def _preprocessed_problem_cache_key(self):
+        """
+        Returns the key under which the parsed tree and the script context of
+        this problem are cached, or None if they are not to be cached.
+
+        They are only cached when the runtime allows caching the execution of
+        scripts, and when they don't depend on files included in the problem.
+        The anonymous student id is part of the key only if the problem refers
+        to it, so that problems are otherwise shared by all students.
+        """
+        if not self.capa_system.cache or '<include' in self.problem_text:
+            return None
+
+        anonymous_student_id = None
+        if 'anonymous_student_id' in self.problem_text:
+            anonymous_student_id = self.capa_system.anonymous_student_id
+        return (self.problem_id, self.problem_text, self.seed, anonymous_student_id)
+
     def _process_includes(self):
         """
         Handle any <include file="foo"> tags by reading in the specified file and inserting it
@@ -4,9 +4,11 @@ Test capa problem.
 import ddt
 import textwrap
 from lxml import etree
+from mock import Mock, patch
 import unittest
 
-from capa.tests.helpers import new_loncapa_problem
+from capa import capa_problem
+from capa.tests.helpers import new_loncapa_problem, test_capa_system
 
 
 @ddt.ddt
@@ -590,3 +592,62 @@ class CAPAMultiInputProblemTest(unittest.TestCase):
             description_element = multi_inputs_group.xpath('//p[@id="{}"]'.format(description_id))
             self.assertEqual(len(description_element), 1)
             self.assertEqual(description_element[0].text, descriptions[index])
+
+
+@ddt.ddt
+class CAPAProblemCacheTest(unittest.TestCase):
+    """
+    Tests for the cache of parsed problem trees and script contexts.
+    """
+    XML = textwrap.dedent("""
+        <problem>
+            <script type="loncapa/python">
+            answer = random.randint(0, 1000)
+            </script>
+            <p>Enter $answer</p>
+            <numericalresponse answer="$answer">
+                <textline />
+            </numericalresponse>
+        </problem>
+    """)
+
+    def setUp(self):
+        super(CAPAProblemCacheTest, self).setUp()
+        capa_problem._preprocessed_problem_cache.clear()  # pylint: disable=protected-access
+        self.addCleanup(capa_problem._preprocessed_problem_cache.clear)  # pylint: disable=protected-access
+
+    def new_problem(self, xml=XML, cache=True, anonymous_student_id='student', seed=723):
+        """
+        Returns a new problem, with the given xml and seed, for the given student.
+        """
+        capa_system = test_capa_system()
+        capa_system.cache = Mock(**{'get.return_value': None}) if cache else None
+        capa_system.anonymous_student_id = anonymous_student_id
+        return new_loncapa_problem(xml, capa_system=capa_system, seed=seed)
+
+    def test_cached_problem(self):
+        with patch('capa.capa_problem.safe_exec', wraps=capa_problem.safe_exec) as mock_safe_exec:
+            problem = self.new_problem()
+            cached_problem = self.new_problem(anonymous_student_id='another student')
+            self.assertEqual(mock_safe_exec.call_count, 1)
+
+        self.assertEqual(cached_problem.context['answer'], problem.context['answer'])
+        self.assertEqual(cached_problem.context['anonymous_student_id'], 'another student')
+        self.assertEqual(cached_problem.get_html(), problem.get_html())
+
+        # Each problem has its own tree and context.
+        self.assertIsNot(cached_problem.tree, problem.tree)
+        cached_problem.context['answer'] = -1
+        self.assertNotEqual(self.new_problem().context['answer'], -1)
+
+    @ddt.data(
+        {'cache': False},
+        {'seed': 1},
+        {'xml': XML.replace('randint(0, 1000)', 'randint(0, 100)')},
+        {'xml': XML.replace('<p>Enter', '<p>Hello $anonymous_student_id, enter'), 'anonymous_student_id': 'other'},
+    )
+    def test_uncached_problem(self, problem_kwargs):
+        self.new_problem(xml=problem_kwargs.get('xml', self.XML))
+        with patch('capa.capa_problem.safe_exec') as mock_safe_exec:
+            self.new_problem(**problem_kwargs)
+            self.assertEqual(mock_safe_exec.call_count, 1)
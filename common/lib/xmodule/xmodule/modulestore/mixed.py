@@ -593,6 +593,29 @@ class MixedModuleStore(ModuleStoreDraftAndPublished, ModuleStoreWriteBase):
         except NotImplementedError:
             return None, None
 
+    def get_structure_changes(self, course_key, from_version, to_version):
+        """
+        Compares two versions of the structure of the given course or library.
+
+        Returns a (changed, removed) tuple of the sets of usage keys of the
+        blocks that were added or updated since from_version in to_version,
+        and of the blocks that were removed; or None if the changes can't be
+        determined, including when the store of the course doesn't keep
+        versions of its structures.
+        """
+        try:
+            store = self._verify_modulestore_support(course_key, 'get_structure_changes')
+        except NotImplementedError:
+            return None
+
+        changes = store.get_structure_changes(course_key, from_version, to_version)
+        if changes is None:
+            return None
+        return tuple(
+            {usage_key.version_agnostic().for_branch(None) for usage_key in usage_keys}
+            for usage_keys in changes
+        )
+
     def get_modulestore_type(self, course_id):
         """
         Returns a type which identifies which modulestore is servicing the given course_id.
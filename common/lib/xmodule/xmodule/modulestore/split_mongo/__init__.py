@@ -2,7 +2,7 @@
 General utilities
 """
 
-from collections import namedtuple
+from collections import defaultdict, namedtuple
 from contracts import contract, check
 from opaque_keys.edx.locator import BlockUsageLocator
 
@@ -21,3 +21,55 @@ class BlockKey(namedtuple('BlockKey', 'type id')):
 
 
 CourseEnvelope = namedtuple('CourseEnvelope', 'course_key structure')
+
+
+class StructureIndex(object):
+    """
+    Lookups over the blocks of a structure: the blocks of each block type,
+    the parents of each block, and whether each block has a path to the root.
+
+    The lookups are built from the structure when the index is created, and
+    the structure itself isn't kept, so that indexes can be cached without
+    keeping their structures in memory.  They are only valid as long as the
+    structure isn't modified.
+    """
+    def __init__(self, structure):
+        blocks_by_type = defaultdict(list)
+        parents = defaultdict(list)
+        for block_key, value in structure['blocks'].iteritems():
+            blocks_by_type[block_key.type].append(block_key)
+            for child_key in value.fields.get('children', []):
+                parents[child_key].append(block_key)
+        self._blocks_by_type = dict(blocks_by_type)
+        self._parents = dict(parents)
+        self._has_path_to_root = {}
+        # The number of blocks in the structure, as a measure of the index's size.
+        self.size = len(structure['blocks'])
+
+    def blocks_of_type(self, block_type):
+        """
+        Returns the keys of the blocks of the given block type, in the
+        structure's order.
+        """
+        return self._blocks_by_type.get(block_type, [])
+
+    def parents(self, block_key):
+        """
+        Returns the keys of the blocks which have the given block as a child.
+        """
+        return self._parents.get(block_key, [])
+
+    def has_path_to_root(self, block_key):
+        """
+        Returns whether the given block is the root course or library block,
+        or a descendant of it.
+        """
+        has_path = self._has_path_to_root.get(block_key)
+        if has_path is None:
+            parents = self.parents(block_key)
+            if len(parents) == 0 and block_key.type in ["course", "library"]:
+                has_path = True
+            else:
+                has_path = any(self.has_path_to_root(parent) for parent in parents)
+            self._has_path_to_root[block_key] = has_path
+        return has_path
@@ -2,9 +2,7 @@
 Segregation of pymongo functions from the data modeling mechanisms for split modulestore.
 """
 import datetime
-import cPickle as pickle
 import math
-import zlib
 import pymongo
 import pytz
 import re
@@ -15,6 +13,7 @@ from time import time
 from pymongo.errors import DuplicateKeyError  # pylint: disable=unused-import
 
 try:
+    from django.conf import settings
     from django.core.cache import caches, InvalidCacheBackendError
     DJANGO_AVAILABLE = True
 except ImportError:
@@ -25,6 +24,8 @@ import logging
 
 from contracts import check, new_contract
 from mongodb_proxy import autoretry_read
+from openedx.core.lib import cache_codecs
+from openedx.core.lib.cache_utils import LRUCache
 from xmodule.exceptions import HeartbeatFailure
 from xmodule.modulestore import BlockData
 from xmodule.modulestore.split_mongo import BlockKey
@@ -44,6 +45,22 @@ def get_cache(alias):
     return caches[alias]
 
 
+_local_structure_cache = None  # pylint: disable=invalid-name
+
+
+def get_local_cache():
+    """
+    Return the process-local cache of serialized course structures, or None
+    if it is disabled by the COURSE_STRUCTURE_LOCAL_CACHE_MAX_SIZE setting.
+    """
+    global _local_structure_cache  # pylint: disable=global-statement, invalid-name
+    if _local_structure_cache is None:
+        max_size = getattr(settings, 'COURSE_STRUCTURE_LOCAL_CACHE_MAX_SIZE', 0)
+        if max_size:
+            _local_structure_cache = LRUCache(max_size=max_size)
+    return _local_structure_cache
+
+
 def round_power_2(value):
     """
     Return value rounded up to the nearest power of 2.
@@ -228,55 +245,162 @@ def structure_to_mongo(structure, course_context=None):
 class CourseStructureCache(object):
     """
     Wrapper around django cache object to cache course structure objects.
-    The course structures are pickled and compressed when cached.
+    The course structures are serialized and compressed by the default
+    cache codec when cached, under keys prefixed for that format.
 
     If the 'course_structure_cache' doesn't exist, then don't do anything for
     for set and get.
+
+    Structures read from the cache are also kept, decompressed, in a size-bounded
+    process-local cache, so that repeated reads of the same structure skip the
+    round trip to the cache and the decompression.  Since structures are immutable,
+    those copies never need to be invalidated.  They are kept serialized, rather
+    than decoded, since callers are free to modify the structures they are given.
     """
     def __init__(self):
         self.cache = None
+        self.local_cache = None
         if DJANGO_AVAILABLE:
             try:
                 self.cache = get_cache('course_structure_cache')
             except InvalidCacheBackendError:
                 pass
+            else:
+                self.local_cache = get_local_cache()
 
     def get(self, key, course_context=None):
-        """Pull the compressed, pickled struct data from cache and deserialize."""
+        """Pull the compressed, serialized struct data from cache and deserialize."""
         if self.cache is None:
             return None
 
         with TIMER.timer("CourseStructureCache.get", course_context) as tagger:
-            compressed_pickled_data = self.cache.get(key)
-            tagger.tag(from_cache=str(compressed_pickled_data is not None).lower())
+            codec, serialized_data = None, None
+            if self.local_cache is not None:
+                codec, serialized_data = self.local_cache.get(key, (None, None))
+                tagger.tag(from_local_cache=str(serialized_data is not None).lower())
 
-            if compressed_pickled_data is None:
-                # Always log cache misses, because they are unexpected
-                tagger.sample_rate = 1
-                return None
+            if serialized_data is None:
+                compressed_data = self.cache.get(cache_codecs.encode_cache_key(key))
+                tagger.tag(from_cache=str(compressed_data is not None).lower())
+
+                if compressed_data is None:
+                    # Always log cache misses, because they are unexpected
+                    tagger.sample_rate = 1
+                    return None
+
+                tagger.measure('compressed_size', len(compressed_data))
 
-            tagger.measure('compressed_size', len(compressed_pickled_data))
+                codec, serialized_data = self._decompress(key, compressed_data, tagger)
+                if codec is None:
+                    return None
+                tagger.tag(codec=codec.NAME)
 
-            pickled_data = zlib.decompress(compressed_pickled_data)
-            tagger.measure('uncompressed_size', len(pickled_data))
+            tagger.measure('uncompressed_size', len(serialized_data))
 
-            return pickle.loads(pickled_data)
+            return codec.deserialize(serialized_data)
+
+    def get_many(self, keys, course_context=None):
+        """
+        Pull the compressed, serialized struct data for all of the given keys
+        from cache at once, and deserialize it.
+
+        Returns a dict of the structures found, keyed by their keys.
+        """
+        if self.cache is None:
+            return {}
+
+        with TIMER.timer("CourseStructureCache.get_many", course_context) as tagger:
+            keys = set(keys)
+            tagger.measure('requested', len(keys))
+
+            serialized_data_by_key = {}
+            if self.local_cache is not None:
+                for key in keys:
+                    codec, serialized_data = self.local_cache.get(key, (None, None))
+                    if serialized_data is not None:
+                        serialized_data_by_key[key] = (codec, serialized_data)
+                tagger.measure('from_local_cache', len(serialized_data_by_key))
+
+            missing_keys = keys.difference(serialized_data_by_key)
+            if missing_keys:
+                keys_by_cache_key = {cache_codecs.encode_cache_key(key): key for key in missing_keys}
+                compressed_data_by_cache_key = self.cache.get_many(keys_by_cache_key.keys())
+                tagger.measure('from_cache', len(compressed_data_by_cache_key))
+                if len(compressed_data_by_cache_key) < len(missing_keys):
+                    # Always log cache misses, because they are unexpected
+                    tagger.sample_rate = 1
+
+                for cache_key, compressed_data in compressed_data_by_cache_key.iteritems():
+                    key = keys_by_cache_key[cache_key]
+                    codec, serialized_data = self._decompress(key, compressed_data, tagger)
+                    if codec is not None:
+                        serialized_data_by_key[key] = (codec, serialized_data)
+
+            return {
+                key: codec.deserialize(serialized_data)
+                for key, (codec, serialized_data) in serialized_data_by_key.iteritems()
+            }
 
     def set(self, key, structure, course_context=None):
-        """Given a structure, will pickle, compress, and write to cache."""
+        """Given a structure, will serialize, compress, and write to cache."""
         if self.cache is None:
             return None
 
         with TIMER.timer("CourseStructureCache.set", course_context) as tagger:
-            pickled_data = pickle.dumps(structure, pickle.HIGHEST_PROTOCOL)
-            tagger.measure('uncompressed_size', len(pickled_data))
+            codec = cache_codecs.get_default_codec()
+            tagger.tag(codec=codec.NAME)
+
+            serialized_data = codec.serialize(structure)
+            tagger.measure('uncompressed_size', len(serialized_data))
+
+            compressed_data = cache_codecs.compress(serialized_data, codec)
+            tagger.measure('compressed_size', len(compressed_data))
+
+            # Stuctures are immutable, so we set a timeout of "never"
+            self.cache.set(cache_codecs.encode_cache_key(key), compressed_data, None)
+
+    def set_many(self, structures, course_context=None):
+        """
+        Given a dict of structures keyed by their keys, will serialize,
+        compress, and write them all to cache at once.
+        """
+        if self.cache is None:
+            return None
+
+        with TIMER.timer("CourseStructureCache.set_many", course_context) as tagger:
+            codec = cache_codecs.get_default_codec()
+            tagger.tag(codec=codec.NAME)
 
-            # 1 = Fastest (slightly larger results)
-            compressed_pickled_data = zlib.compress(pickled_data, 1)
-            tagger.measure('compressed_size', len(compressed_pickled_data))
+            compressed_data_by_key = {
+                cache_codecs.encode_cache_key(key): cache_codecs.encode(structure, codec)
+                for key, structure in structures.iteritems()
+            }
+            tagger.measure('structures', len(compressed_data_by_key))
+            tagger.measure('compressed_size', sum(len(data) for data in compressed_data_by_key.itervalues()))
 
             # Stuctures are immutable, so we set a timeout of "never"
-            self.cache.set(key, compressed_pickled_data, None)
+            self.cache.set_many(compressed_data_by_key, None)
+
+    def _decompress(self, key, compressed_data, tagger):
+        """
+        Decompresses the given data read from the cache, keeping the result
+        in the local cache, if there is one.
+
+        Returns a (codec, serialized_data) tuple, or (None, None) if the data
+        was stored in an unknown format.
+        """
+        codec, serialized_data = cache_codecs.decompress(compressed_data)
+        if codec is None:
+            # Data written in an older or unavailable format is treated as a miss.
+            tagger.tag(unknown_format='true')
+            tagger.sample_rate = 1
+            return None, None
+
+        if self.local_cache is not None:
+            evictions = self.local_cache.evictions
+            self.local_cache.set(key, (codec, serialized_data), size=len(serialized_data))
+            tagger.measure('local_cache_evictions', self.local_cache.evictions - evictions)
+        return codec, serialized_data
 
 
 class MongoConnection(object):
@@ -349,17 +473,30 @@ class MongoConnection(object):
         """
         Return all structures that specified in ``ids``.
 
+        Structures found in the cache are used, and only the rest are
+        retrieved from the persistence mechanism (and then cached).
+
         Arguments:
             ids (list): A list of structure ids
         """
         with TIMER.timer("find_structures_by_id", course_context) as tagger:
             tagger.measure("requested_ids", len(ids))
-            docs = [
-                structure_from_mongo(structure, course_context)
-                for structure in self.structures.find({'_id': {'$in': ids}})
-            ]
-            tagger.measure("structures", len(docs))
-            return docs
+            cache = CourseStructureCache()
+
+            structures = cache.get_many(ids, course_context)
+            tagger.measure("cached_structures", len(structures))
+
+            missing_ids = list(set(ids).difference(structures))
+            if missing_ids:
+                docs = {
+                    structure['_id']: structure_from_mongo(structure, course_context)
+                    for structure in self.structures.find({'_id': {'$in': missing_ids}})
+                }
+                cache.set_many(docs, course_context)
+                structures.update(docs)
+
+            tagger.measure("structures", len(structures))
+            return structures.values()
 
     @autoretry_read()
     def find_course_blocks_by_id(self, ids, course_context=None):
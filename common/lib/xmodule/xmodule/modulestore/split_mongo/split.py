@@ -83,12 +83,13 @@ from xmodule.modulestore import (
 from ..exceptions import ItemNotFoundError
 from .caching_descriptor_system import CachingDescriptorSystem
 from xmodule.modulestore.split_mongo.mongo_connection import MongoConnection, DuplicateKeyError
-from xmodule.modulestore.split_mongo import BlockKey, CourseEnvelope
+from xmodule.modulestore.split_mongo import BlockKey, CourseEnvelope, StructureIndex
 from xmodule.modulestore.store_utilities import DETACHED_XBLOCK_TYPES
 from xmodule.error_module import ErrorDescriptor
 from collections import defaultdict
 from types import NoneType
 from xmodule.assetstore import AssetMetadata
+from openedx.core.lib.cache_utils import LRUCache
 
 
 log = logging.getLogger(__name__)
@@ -653,6 +654,11 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
     # version) but those functions will have an optional arg for setting these.
     SEARCH_TARGET_DICT = ['wiki_slug']
 
+    # The maximum number of structures whose StructureIndex is kept, and the
+    # maximum total number of blocks of those structures.
+    STRUCTURE_INDEX_CACHE_SIZE = 100
+    STRUCTURE_INDEX_CACHE_MAX_BLOCKS = 100000
+
     def __init__(self, contentstore, doc_store_config, fs_root, render_template,
                  default_class=None,
                  error_tracker=null_error_tracker,
@@ -689,6 +695,10 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
             self.services["request_cache"] = self.request_cache
 
         self.signal_handler = signal_handler
+        self._structure_indexes = LRUCache(
+            max_items=self.STRUCTURE_INDEX_CACHE_SIZE,
+            max_size=self.STRUCTURE_INDEX_CACHE_MAX_BLOCKS,
+        )
 
     def close_connections(self):
         """
@@ -1216,20 +1226,20 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
         if 'children' in qualifiers:
             settings['children'] = qualifiers.pop('children')
 
-        # No need of these caches unless include_orphans is set to False
-        path_cache = None
-        parents_cache = None
-
-        if not include_orphans:
-            path_cache = {}
-            parents_cache = self.build_block_key_to_parents_mapping(course.structure)
+        structure_index = self._get_structure_index(course)
+        blocks = course.structure['blocks']
+        if isinstance(qualifiers.get('block_type'), basestring):
+            # only look at the blocks of the requested type
+            block_ids = structure_index.blocks_of_type(qualifiers['block_type'])
+        else:
+            block_ids = blocks.iterkeys()
 
-        for block_id, value in course.structure['blocks'].iteritems():
-            if _block_matches_all(value):
+        for block_id in block_ids:
+            if _block_matches_all(blocks[block_id]):
                 if not include_orphans:
                     if (  # pylint: disable=bad-continuation
                         block_id.type in DETACHED_XBLOCK_TYPES or
-                        self.has_path_to_root(block_id, course, path_cache, parents_cache)
+                        structure_index.has_path_to_root(block_id)
                     ):
                         items.append(block_id)
                 else:
@@ -1269,6 +1279,8 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
 
         :return Bool: whether or not component has path to the root
         """
+        if path_cache is None and parents_cache is None:
+            return self._get_structure_index(course).has_path_to_root(block_key)
 
         if path_cache and block_key in path_cache:
             return path_cache[block_key]
@@ -1308,14 +1320,15 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
             raise ItemNotFoundError(locator)
 
         course = self._lookup_course(locator.course_key)
-        all_parent_ids = self._get_parents_from_structure(BlockKey.from_usage_key(locator), course.structure)
+        structure_index = self._get_structure_index(course)
+        all_parent_ids = structure_index.parents(BlockKey.from_usage_key(locator))
 
         # Check and verify the found parent_ids are not orphans; Remove parent which has no valid path
         # to the course root
         parent_ids = [
             valid_parent
             for valid_parent in all_parent_ids
-            if self.has_path_to_root(valid_parent, course)
+            if structure_index.has_path_to_root(valid_parent)
         ]
 
         if len(parent_ids) == 0:
@@ -1527,6 +1540,66 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
             return usage_key, block.edit_info.original_usage_version
         return None, None
 
+    def get_structure_changes(self, course_key, from_version, to_version):
+        """
+        Compares two versions of the structure of the given course or library.
+
+        A block is considered changed if it was added, if it was updated (as
+        told by the version in which it was last updated) other than in its
+        list of children, or if it was moved to another parent.
+
+        Returns a (changed, removed) tuple of the sets of usage keys of the
+        blocks that changed since from_version in to_version, and of the blocks
+        that were removed; or None if either version of the structure can't be
+        found.
+        """
+        from_structure = self.get_structure(course_key, course_key.as_object_id(from_version))
+        to_structure = self.get_structure(course_key, course_key.as_object_id(to_version))
+        if from_structure is None or to_structure is None:
+            return None
+
+        def get_parents(blocks):
+            """
+            Returns a dict of the parent of each of the given blocks that has one.
+            """
+            return {
+                child_key: block_key
+                for block_key, block in blocks.iteritems()
+                for child_key in block.fields.get('children', [])
+            }
+
+        def has_changed(from_block, to_block):
+            """
+            Returns whether the given block was updated, other than in its children.
+            """
+            if from_block.edit_info.update_version == to_block.edit_info.update_version:
+                return False
+            return from_block.definition != to_block.definition or any(
+                from_block.fields.get(field_name) != to_block.fields.get(field_name)
+                for field_name in set(from_block.fields) | set(to_block.fields)
+                if field_name != 'children'
+            )
+
+        from_blocks = from_structure['blocks']
+        to_blocks = to_structure['blocks']
+        from_parents = get_parents(from_blocks)
+        to_parents = get_parents(to_blocks)
+        changed = {
+            course_key.make_usage_key(block_key.type, block_key.id)
+            for block_key, block in to_blocks.iteritems()
+            if (
+                block_key not in from_blocks or
+                has_changed(from_blocks[block_key], block) or
+                from_parents.get(block_key) != to_parents.get(block_key)
+            )
+        }
+        removed = {
+            course_key.make_usage_key(block_key.type, block_key.id)
+            for block_key in from_blocks
+            if block_key not in to_blocks
+        }
+        return changed, removed
+
     def create_definition_from_data(self, course_key, new_def_data, category, user_id):
         """
         Pull the definition fields out of descriptor and save to the db as a new definition
@@ -3114,6 +3187,30 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
             'schema_version': self.SCHEMA_VERSION,
         }
 
+    def _get_structure_index(self, course):
+        """
+        Returns the StructureIndex of the given course's structure.
+
+        Since stored structures are never modified, their indexes are kept,
+        up to a total number of blocks, and reused, keyed by structure
+        version.  The structures still being
+        modified by an active bulk operation get a new index on each call.
+        """
+        structure_id = course.structure['_id']
+        bulk_write_record = self._get_bulk_ops_record(course.course_key)
+        if (  # pylint: disable=bad-continuation
+            bulk_write_record.active and
+            structure_id in bulk_write_record.structures and
+            structure_id not in bulk_write_record.structures_in_db
+        ):
+            return StructureIndex(course.structure)
+
+        structure_index = self._structure_indexes.get(structure_id)
+        if structure_index is None:
+            structure_index = StructureIndex(course.structure)
+            self._structure_indexes.set(structure_id, structure_index, size=structure_index.size)
+        return structure_index
+
     @contract(block_key=BlockKey)
     def _get_parents_from_structure(self, block_key, structure):
         """
@@ -15,7 +15,8 @@ from contracts import contract
 from nose.plugins.attrib import attr
 from django.core.cache import caches, InvalidCacheBackendError
 
-from openedx.core.lib import tempdir
+from openedx.core.lib import cache_codecs, tempdir
+from openedx.core.lib.cache_utils import LRUCache
 from xblock.fields import Reference, ReferenceList, ReferenceValueDict
 from xmodule.course_module import CourseDescriptor
 from xmodule.modulestore import ModuleStoreEnum
@@ -963,6 +964,67 @@ class TestCourseStructureCache(SplitModuleTest):
         # now make sure that you get the same structure
         self.assertEqual(cached_structure, not_cached_structure)
 
+    @patch('xmodule.modulestore.split_mongo.mongo_connection.get_cache')
+    def test_course_structure_cache_key(self, mock_get_cache):
+        mock_get_cache.return_value = self.cache
+        structure_id = self.new_course.location.as_object_id(self.new_course.location.version_guid)
+        self._get_structure(self.new_course)
+
+        # the structure is cached under a key that code unaware of the
+        # format versions of the cache codecs doesn't read
+        self.assertIsNone(self.cache.get(structure_id))
+        cached_data = self.cache.get(cache_codecs.encode_cache_key(structure_id))
+        self.assertEqual(ord(cached_data[0]), cache_codecs.PickleZlibCodec.FORMAT_VERSION)
+
+    @patch('xmodule.modulestore.split_mongo.mongo_connection.get_local_cache')
+    @patch('xmodule.modulestore.split_mongo.mongo_connection.get_cache')
+    def test_course_structure_local_cache(self, mock_get_cache, mock_get_local_cache):
+        mock_get_cache.return_value = self.cache
+        local_cache = mock_get_local_cache.return_value = LRUCache(max_size=10 * 1024 * 1024)
+
+        with check_mongo_calls(1):
+            not_cached_structure = self._get_structure(self.new_course)
+
+        # reading the structure from the cache also keeps it in the local cache
+        with check_mongo_calls(0):
+            cached_structure = self._get_structure(self.new_course)
+        self.assertEqual(len(local_cache), 1)
+        self.assertEqual(local_cache.hits, 0)
+
+        # which then serves it without the cache
+        self.cache.clear()
+        with check_mongo_calls(0):
+            locally_cached_structure = self._get_structure(self.new_course)
+        self.assertEqual(local_cache.hits, 1)
+
+        # each read returns its own copy of the structure
+        self.assertEqual(locally_cached_structure, not_cached_structure)
+        self.assertIsNot(locally_cached_structure, cached_structure)
+
+    @patch('xmodule.modulestore.split_mongo.mongo_connection.get_cache')
+    def test_find_structures_by_id_cache(self, mock_get_cache):
+        mock_get_cache.return_value = self.cache
+        other_course = modulestore().create_course(
+            'org', 'other_course', 'test_run', self.user, BRANCH_NAME_DRAFT,
+        )
+        self.cache.clear()
+        structure_ids = [
+            course.location.as_object_id(course.location.version_guid)
+            for course in (self.new_course, other_course)
+        ]
+
+        # only the structure missing from the cache is read from mongo
+        cached_structure = self._get_structure(self.new_course)
+        with check_mongo_calls(1):
+            structures = modulestore().db_connection.find_structures_by_id(structure_ids)
+        self.assertItemsEqual([structure['_id'] for structure in structures], structure_ids)
+        self.assertIn(cached_structure, structures)
+
+        # after which both are cached
+        with check_mongo_calls(0):
+            cached_structures = modulestore().db_connection.find_structures_by_id(structure_ids)
+        self.assertItemsEqual(cached_structures, structures)
+
     @patch('xmodule.modulestore.split_mongo.mongo_connection.get_cache')
     def test_course_structure_cache_no_cache_configured(self, mock_get_cache):
         mock_get_cache.side_effect = InvalidCacheBackendError
@@ -1232,6 +1294,57 @@ class SplitModuleItemTests(SplitModuleTest):
         parent = modulestore().get_parent_location(locator)
         self.assertIsNone(parent)
 
+    def test_structure_index_reused(self):
+        """
+        The indexes of a stored structure are built once, and not reused for its next versions
+        """
+        course_key = CourseLocator(org='testx', course='GreekHero', run="run", branch=BRANCH_NAME_DRAFT)
+        chapter_locator = course_key.make_usage_key('chapter', 'chapter1')
+        modulestore().get_parent_location(chapter_locator)
+        course = modulestore()._lookup_course(course_key)
+        structure_index = modulestore()._get_structure_index(course)
+        self.assertEqual(structure_index.size, len(course.structure['blocks']))
+        self.assertIn(course.structure['_id'], modulestore()._structure_indexes)
+        self.assertIs(
+            modulestore()._get_structure_index(modulestore()._lookup_course(course_key)),
+            structure_index
+        )
+
+        new_chapter = modulestore().create_child(
+            'testuser', course_key.make_usage_key('course', 'head12345'), 'chapter',
+            fields={'display_name': 'new chapter'},
+        )
+        self.assertIsNot(
+            modulestore()._get_structure_index(modulestore()._lookup_course(course_key)),
+            structure_index
+        )
+        self.assertEqual(modulestore().get_parent_location(new_chapter.location).block_id, 'head12345')
+        self.assertEqual(len(modulestore().get_items(course_key, qualifiers={'category': 'chapter'})), 4)
+
+    def test_get_parents_in_bulk_operation(self):
+        """
+        The structure being modified by a bulk operation is indexed as it is modified
+        """
+        course_key = CourseLocator(org='testx', course='GreekHero', run="run", branch=BRANCH_NAME_DRAFT)
+        with modulestore().bulk_operations(course_key):
+            new_chapter = modulestore().create_child(
+                'testuser', course_key.make_usage_key('course', 'head12345'), 'chapter',
+                fields={'display_name': 'new chapter'},
+            )
+            self.assertEqual(modulestore().get_parent_location(new_chapter.location).block_id, 'head12345')
+            new_sequential = modulestore().create_child(
+                'testuser', new_chapter.location, 'sequential',
+                fields={'display_name': 'new sequential'},
+            )
+            self.assertEqual(
+                modulestore().get_parent_location(new_sequential.location).block_id,
+                new_chapter.location.block_id
+            )
+            self.assertEqual(
+                len(modulestore().get_items(course_key, qualifiers={'category': 'sequential'}, include_orphans=False)),
+                len(modulestore().get_items(course_key, qualifiers={'category': 'sequential'}))
+            )
+
     @patch('xmodule.tabs.CourseTab.from_json', side_effect=mock_tab_from_json)
     def test_get_children(self, _from_json):
         """
@@ -208,6 +208,21 @@ class ContentTest(unittest.TestCase):
 
         self.assertEqual(total_length, last_byte - first_byte + 1)
 
+    def test_static_content_stream_chunk_size(self):
+        """
+        Test that StaticContentStream streams its data in chunks of the requested size.
+        """
+        item = FakeGridFsItem(SAMPLE_STRING)
+        static_content_stream = StaticContentStream('loc', 'name', 'type', item, length=item.length)
+
+        chunks = list(static_content_stream.stream_data(chunk_size=100))
+        self.assertEqual(''.join(chunks), SAMPLE_STRING)
+        self.assertTrue(all(len(chunk) == 100 for chunk in chunks[:-1]))
+
+        chunks = list(static_content_stream.stream_data_in_range(150, 1500, chunk_size=500))
+        self.assertEqual(''.join(chunks), SAMPLE_STRING[150:1501])
+        self.assertEqual([len(chunk) for chunk in chunks], [500, 500, 351])
+
     def test_static_content_write_js(self):
         """
         Test that only one filename starts with 000.
@@ -0,0 +1,156 @@
+"""
+Command to compare the cache codecs used for course structures and block structures.
+"""
+from datetime import datetime
+import logging
+import os
+import timeit
+
+from bson.objectid import ObjectId
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from pytz import UTC
+from xblock.fields import Scope
+
+from openedx.core.lib import cache_codecs
+from openedx.core.lib.block_structure.factory import BlockStructureFactory
+from xmodule.modulestore import BlockData
+from xmodule.modulestore.split_mongo import BlockKey
+from xmodule.modulestore.xml import XMLModuleStore
+
+
+# xBlock fields collected into the block structures that are benchmarked,
+# as typically requested by the course_blocks transformers.
+COLLECTED_XBLOCK_FIELDS = (
+    'category', 'display_name', 'format', 'graded', 'due', 'start', 'visible_to_staff_only', 'weight', 'has_score',
+)
+
+
+class Command(BaseCommand):
+    """
+    Encodes and decodes the course structure and the block structure of each
+    of the given XML courses (by default, the test courses in common/test/data)
+    with every available cache codec, and reports the encoded sizes and the
+    average encoding and decoding times.
+
+    Example usage:
+        $ ./manage.py lms benchmark_cache_codecs --settings=test
+        $ ./manage.py lms benchmark_cache_codecs toy graded --iterations 1000 --settings=test
+    """
+    args = '<course_dir course_dir ...>'
+    help = 'Compares the size and speed of the cache codecs for course structures and block structures.'
+
+    def add_arguments(self, parser):
+        """
+        Entry point for subclassed commands to add custom arguments.
+        """
+        parser.add_argument(
+            '--data-dir',
+            help='Directory containing the XML course directories.',
+            default=None,
+        )
+        parser.add_argument(
+            '--iterations',
+            help='Number of times each structure is encoded and decoded with each codec.',
+            default=100,
+            type=int,
+        )
+
+    def handle(self, *args, **options):
+        data_dir = options.get('data_dir') or getattr(settings, 'COMMON_TEST_DATA_ROOT', None)
+        if not data_dir or not os.path.isdir(data_dir):
+            raise CommandError('A valid --data-dir must be specified.')
+
+        # Importing the courses is noisy, and not what is being measured.
+        logging.disable(logging.WARNING)
+        try:
+            store = XMLModuleStore(data_dir, source_dirs=list(args) or None, load_error_modules=False)
+        finally:
+            logging.disable(logging.NOTSET)
+
+        iterations = options['iterations']
+        self.stdout.write(
+            '{:<28} {:<17} {:<12} {:>7} {:>11} {:>11} {:>11}'.format(
+                'course', 'structure', 'codec', 'blocks', 'size', 'encode ms', 'decode ms',
+            )
+        )
+        for course in sorted(store.get_courses(), key=lambda course: unicode(course.id)):
+            structures = [
+                ('course structure', _course_structure(store, course)),
+                ('block structure', _block_structure_data(store, course)),
+            ]
+            for structure_name, (num_blocks, structure) in structures:
+                for codec in sorted(cache_codecs.CODECS.values(), key=lambda codec: codec.FORMAT_VERSION):
+                    encoded_data = cache_codecs.encode(structure, codec)
+                    encode_time = timeit.timeit(lambda: cache_codecs.encode(structure, codec), number=iterations)
+                    decode_time = timeit.timeit(lambda: cache_codecs.decode(encoded_data), number=iterations)
+                    self.stdout.write(
+                        '{:<28} {:<17} {:<12} {:>7} {:>11} {:>11.3f} {:>11.3f}'.format(
+                            unicode(course.id)[:28],
+                            structure_name,
+                            codec.NAME,
+                            num_blocks,
+                            len(encoded_data),
+                            encode_time * 1000 / iterations,
+                            decode_time * 1000 / iterations,
+                        )
+                    )
+
+
+def _course_structure(store, course):
+    """
+    Returns the number of blocks in the given course, and a structure of the
+    course in the form in which split modulestore caches its structures.
+    """
+    def block_key(location):
+        """
+        Returns the split BlockKey for the given location.
+        """
+        return BlockKey(location.block_type, location.block_id)
+
+    edit_info = {
+        'edited_by': 1,
+        'edited_on': datetime.now(UTC),
+        'previous_version': ObjectId(),
+        'update_version': ObjectId(),
+        'source_version': None,
+        'original_usage': None,
+        'original_usage_version': None,
+    }
+    blocks = {}
+    for xblock in store.get_items(course.id):
+        fields = xblock.get_explicitly_set_fields_by_scope(Scope.settings)
+        if xblock.has_children:
+            fields['children'] = [block_key(child) for child in xblock.children]
+        blocks[block_key(xblock.location)] = BlockData(
+            block_type=xblock.location.block_type,
+            fields=fields,
+            definition=ObjectId(),
+            defaults={},
+            edit_info=edit_info,
+        )
+    return len(blocks), {
+        '_id': ObjectId(),
+        'root': block_key(course.location),
+        'blocks': blocks,
+        'previous_version': ObjectId(),
+        'original_version': ObjectId(),
+        'edited_by': 1,
+        'edited_on': datetime.now(UTC),
+        'schema_version': 1,
+    }
+
+
+def _block_structure_data(store, course):
+    """
+    Returns the number of blocks in the given course, and the data that
+    BlockStructureCache caches for a block structure of the course.
+    """
+    block_structure = BlockStructureFactory.create_from_modulestore(course.location, store)
+    block_structure.request_xblock_fields(*COLLECTED_XBLOCK_FIELDS)
+    block_structure._collect_requested_xblock_fields()  # pylint: disable=protected-access
+    return len(block_structure), (
+        block_structure._block_relations,  # pylint: disable=protected-access
+        block_structure.transformer_data,
+        block_structure._block_data_map,  # pylint: disable=protected-access
+    )
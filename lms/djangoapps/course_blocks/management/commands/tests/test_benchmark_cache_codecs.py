@@ -0,0 +1,29 @@
+"""
+Tests for benchmark_cache_codecs management command.
+"""
+from StringIO import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from openedx.core.lib import cache_codecs
+
+
+class TestBenchmarkCacheCodecs(TestCase):
+    """
+    Tests benchmark cache codecs management command.
+    """
+    def test_benchmark(self):
+        out = StringIO()
+        call_command('benchmark_cache_codecs', 'toy', iterations=1, stdout=out)
+        lines = out.getvalue().splitlines()
+
+        # A header, then a line for each structure of the course, with each codec.
+        self.assertEqual(len(lines), 1 + 2 * len(cache_codecs.CODECS))
+        for codec in cache_codecs.CODECS.itervalues():
+            self.assertEqual(len([line for line in lines if codec.NAME in line]), 2)
+
+    def test_invalid_data_dir(self):
+        with self.assertRaises(CommandError):
+            call_command('benchmark_cache_codecs', data_dir='/nonexistent')
@@ -18,6 +18,10 @@ class UserPartitionTransformer(FilteringTransformerMixin, BlockStructureTransfor
     """
     VERSION = 1
 
+    # The split test transformer sets the group access of the children
+    # of split test blocks, which is merged here.
+    COLLECT_DEPENDENCIES = ('split_test',)
+
     @classmethod
     def name(cls):
         """
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 import datetime
+from functools import partial
 import json
+import threading
 import ddt
 import mock
 from mock import patch, Mock
@@ -10,13 +12,20 @@ from django.utils.timezone import UTC as django_utc
 
 from django.core.urlresolvers import reverse
 from django.test import TestCase, RequestFactory
+from django.utils import translation
 from edxmako import add_lookup
 
 from django_comment_client.tests.factories import RoleFactory
 from django_comment_client.tests.unicode import UnicodeTestMixin
 from django_comment_client.constants import TYPE_ENTRY, TYPE_SUBCATEGORY
 import django_comment_client.utils as utils
-from lms.lib.comment_client.utils import perform_request, CommentClientMaintenanceError
+from lms.lib.comment_client.utils import (
+    CommentClientMaintenanceError,
+    CommentClientRequestError,
+    get_session,
+    perform_concurrently,
+    perform_request,
+)
 from django_comment_common.models import ForumsConfig
 
 from courseware.tests.factories import InstructorFactory
@@ -205,6 +214,39 @@ class CoursewareContextTestCase(ModuleStoreTestCase):
         self.assertEqual(len(utils.get_accessible_discussion_xblocks(course, self.user)), expected_discussion_xblocks)
 
 
+    def test_get_accessible_discussion_blocks(self):
+        """
+        Tests that the discussion blocks read from the course's block structure are the accessible discussion xblocks.
+        """
+        ItemFactory.create(
+            parent_location=self.course.location,
+            category="discussion",
+            discussion_id="staff_only_discussion",
+            discussion_category="Chapter",
+            discussion_target="Staff Only",
+            visible_to_staff_only=True,
+        )
+        student = UserFactory.create()
+
+        discussion_blocks = utils.get_accessible_discussion_blocks(self.course, student)
+        self.assertEqual(
+            [(block.location, block.discussion_category, block.discussion_target) for block in discussion_blocks],
+            [
+                (self.discussion1.location, "Chapter", "Discussion 1"),
+                (self.discussion2.location, "Chapter / Section / Subsection", "Discussion 2"),
+            ],
+        )
+        for user, include_all in ((student, False), (student, True), (self.user, False)):
+            self.assertEqual(
+                sorted(block.discussion_id for block in utils.get_accessible_discussion_blocks(
+                    self.course, user, include_all=include_all
+                )),
+                sorted(xblock.discussion_id for xblock in utils.get_accessible_discussion_xblocks(
+                    self.course, user, include_all=include_all
+                )),
+            )
+
+
 @attr(shard=3)
 class CachedDiscussionIdMapTestCase(ModuleStoreTestCase):
     """
@@ -1441,7 +1483,7 @@ class ClientConfigurationTestCase(TestCase):
         with self.assertRaises(CommentClientMaintenanceError):
             perform_request('GET', 'http://www.google.com')
 
-    @patch('requests.request')
+    @patch('lms.lib.comment_client.utils.session_request')
     def test_enabled(self, mock_request):
         """Ensures that requests proceed normally when forums are enabled."""
         config = ForumsConfig.current()
@@ -1456,3 +1498,44 @@ class ClientConfigurationTestCase(TestCase):
 
         result = perform_request('GET', 'http://www.google.com')
         self.assertEqual(result, {})
+
+
+@patch('lms.lib.comment_client.settings.CONCURRENT_REQUESTS', 4)
+class ConcurrentRequestsTestCase(TestCase):
+    """Tests for making requests to the comment service over pooled connections, concurrently."""
+
+    def setUp(self):
+        super(ConcurrentRequestsTestCase, self).setUp()
+        config = ForumsConfig.current()
+        config.enabled = True
+        config.save()
+
+    def test_session_reused(self):
+        self.assertIs(get_session(), get_session())
+
+    @patch('lms.lib.comment_client.utils.session_request')
+    def test_results_in_order(self, mock_request):
+        """Ensures that the results of the calls are returned in order, with the caller's language."""
+        mock_request.side_effect = lambda method, url, **kwargs: Mock(status_code=200, json=lambda: {'url': url})
+        urls = ['http://www.google.com/{}'.format(index) for index in range(5)]
+
+        with translation.override('eo'):
+            results = perform_concurrently(*[partial(perform_request, 'GET', url) for url in urls])
+
+        self.assertEqual(results, [{'url': url} for url in urls])
+        for request_call in mock_request.call_args_list:
+            self.assertEqual(request_call[1]['headers']['Accept-Language'], 'eo')
+
+    def test_exception_raised(self):
+        def _fail():
+            """Fails as a request to the comments service would."""
+            raise CommentClientRequestError('Not found', 404)
+
+        with self.assertRaises(CommentClientRequestError):
+            perform_concurrently(lambda: 1, _fail)
+
+    @patch('lms.lib.comment_client.settings.CONCURRENT_REQUESTS', 1)
+    def test_sequential(self):
+        current_thread = threading.current_thread()
+        results = perform_concurrently(threading.current_thread, threading.current_thread)
+        self.assertEqual(results, [current_thread, current_thread])
@@ -0,0 +1,74 @@
+"""
+Discussions Transformer
+"""
+from openedx.core.lib.block_structure.transformer import BlockStructureTransformer
+
+
+class DiscussionsTransformer(BlockStructureTransformer):
+    """
+    The DiscussionsTransformer collects the discussion xblocks of a course,
+    and the fields from which its discussion category map is built, so that
+    the map can be built for a user from the course's block structure,
+    which is collected once per published version of the course, instead of
+    from the discussion xblocks loaded from the modulestore on each request.
+
+    No runtime transformations are performed: the blocks that the user has
+    no access to are removed by the access transformers applied with it.
+
+    The following values are stored as xblock_fields on their respective blocks
+    in the block structure:
+
+        discussion_id: (string)
+        discussion_category: (string)
+        discussion_target: (string)
+        sort_key: (string)
+        start: (datetime)
+
+    Additionally, the usage keys of the discussion blocks are stored as
+    transformer data for the block structure.
+    """
+    VERSION = 1
+    FIELDS_TO_COLLECT = [u'discussion_id', u'discussion_category', u'discussion_target', u'sort_key', u'start']
+
+    DISCUSSION_BLOCKS = 'discussion_blocks'
+
+    @classmethod
+    def name(cls):
+        """
+        Unique identifier for the transformer's class;
+        same identifier used in setup.py.
+        """
+        return u'discussions'
+
+    @classmethod
+    def collect(cls, block_structure):
+        """
+        Collects any information that's necessary to execute this
+        transformer's transform method.
+        """
+        block_structure.request_xblock_fields(*cls.FIELDS_TO_COLLECT)
+        block_structure.set_transformer_data(
+            cls,
+            cls.DISCUSSION_BLOCKS,
+            [
+                block_key for block_key in block_structure.topological_traversal()
+                if block_key.block_type == 'discussion'
+            ],
+        )
+
+    @classmethod
+    def get_discussion_blocks(cls, block_structure):
+        """
+        Returns the usage keys of the discussion blocks in the given block
+        structure, in topological order.
+        """
+        return [
+            block_key for block_key in block_structure.get_transformer_data(cls, cls.DISCUSSION_BLOCKS, [])
+            if block_key in block_structure
+        ]
+
+    def transform(self, usage_info, block_structure):
+        """
+        Perform no transformations.
+        """
+        pass
@@ -1,4 +1,4 @@
-from collections import defaultdict
+from collections import defaultdict, namedtuple
 from datetime import datetime
 import json
 import logging
@@ -19,15 +19,20 @@ from django_comment_common.models import Role, FORUM_ROLE_STUDENT
 from django_comment_client.permissions import check_permissions_by_view, has_permission, get_team
 from django_comment_client.settings import MAX_COMMENT_DEPTH
 from django_comment_client.constants import TYPE_ENTRY, TYPE_SUBCATEGORY
+from django_comment_client.transformer import DiscussionsTransformer
 from edxmako import lookup_template
 
 from courseware import courses
 from courseware.access import has_access
+from lms.djangoapps.course_blocks.api import get_course_blocks
+from lms.djangoapps.course_blocks.transformers import start_date, user_partitions, visibility
 from openedx.core.djangoapps.content.course_structures.models import CourseStructure
 from openedx.core.djangoapps.course_groups.cohorts import (
     get_course_cohort_settings, get_cohort_by_id, get_cohort_id, is_course_cohorted
 )
 from openedx.core.djangoapps.course_groups.models import CourseUserGroup
+from openedx.core.djangoapps.self_paced.models import SelfPacedConfiguration
+from openedx.core.lib.block_structure.transformers import BlockStructureTransformers
 from request_cache.middleware import request_cached
 
 
@@ -138,6 +143,43 @@ def get_accessible_discussion_xblocks(course, user, include_all=False):  # pylin
     ]
 
 
+# The fields of a discussion xblock from which the discussion category map is
+# built, as collected in the course's block structure by DiscussionsTransformer.
+DiscussionBlock = namedtuple(
+    'DiscussionBlock',
+    ['location', 'discussion_id', 'discussion_category', 'discussion_target', 'sort_key', 'start'],
+)
+
+
+def get_accessible_discussion_blocks(course, user, include_all=False):
+    """
+    Return a list of all valid discussion blocks in this course that are
+    accessible to the given user, as DiscussionBlock tuples.
+
+    Unlike get_accessible_discussion_xblocks, the blocks are read from the
+    course's collected block structure, and the user's access to them is
+    determined by the course block access transformers, so that no xblocks
+    are loaded from the modulestore.
+    """
+    transformers = [DiscussionsTransformer()]
+    if not include_all:
+        transformers += [user_partitions.UserPartitionTransformer(), visibility.VisibilityTransformer()]
+        # The release dates of the content of self-paced courses are
+        # removed, as by the SelfPacedDateOverrideProvider.
+        if not (course.self_paced and SelfPacedConfiguration.current().enabled):
+            transformers.append(start_date.StartDateTransformer())
+
+    block_structure = get_course_blocks(user, course.location, BlockStructureTransformers(transformers))
+    discussion_blocks = [
+        DiscussionBlock(
+            block_key,
+            *[block_structure.get_xblock_field(block_key, field_name) for field_name in DiscussionBlock._fields[1:]]
+        )
+        for block_key in DiscussionsTransformer.get_discussion_blocks(block_structure)
+    ]
+    return [block for block in discussion_blocks if has_required_keys(block)]
+
+
 def get_discussion_id_map_entry(xblock):
     """
     Returns a tuple of (discussion_id, metadata) suitable for inclusion in the results of get_discussion_id_map().
@@ -198,7 +240,7 @@ def get_discussion_id_map(course, user):
     Transform the list of this course's discussion xblocks (visible to a given user) into a dictionary of metadata keyed
     by discussion_id.
     """
-    return dict(map(get_discussion_id_map_entry, get_accessible_discussion_xblocks(course, user)))
+    return dict(map(get_discussion_id_map_entry, get_accessible_discussion_blocks(course, user)))
 
 
 def _filter_unstarted_categories(category_map, course):
@@ -307,7 +349,7 @@ def get_discussion_category_map(course, user, cohorted_if_in_list=False, exclude
     """
     unexpanded_category_map = defaultdict(list)
 
-    xblocks = get_accessible_discussion_xblocks(course, user)
+    xblocks = get_accessible_discussion_blocks(course, user)
 
     course_cohort_settings = get_course_cohort_settings(course.id)
 
@@ -426,7 +468,7 @@ def get_discussion_categories_ids(course, user, include_all=False):
 
     """
     accessible_discussion_ids = [
-        xblock.discussion_id for xblock in get_accessible_discussion_xblocks(course, user, include_all=include_all)
+        block.discussion_id for block in get_accessible_discussion_blocks(course, user, include_all=include_all)
     ]
     return course.top_level_discussion_topic_ids + accessible_discussion_ids
 
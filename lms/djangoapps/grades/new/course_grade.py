@@ -3,6 +3,7 @@ CourseGrade Class
 """
 
 from collections import defaultdict, namedtuple, OrderedDict
+from itertools import islice
 from logging import getLogger
 
 from django.conf import settings
@@ -12,11 +13,13 @@ from lazy import lazy
 
 from lms.djangoapps.course_blocks.api import get_course_blocks
 from lms.djangoapps.grades.config.models import PersistentGradesEnabledFlag
+from openedx.core.djangoapps.content.block_structure.api import get_block_structure_manager
 from openedx.core.djangoapps.signals.signals import COURSE_GRADE_CHANGED
 from xmodule import block_metadata_utils
 
 from ..models import PersistentCourseGrade
-from .subsection_grade import SubsectionGradeFactory
+from ..scores import possibly_scored
+from .subsection_grade import prefetch_scores, SubsectionGradeFactory
 from ..transformer import GradesTransformer
 
 
@@ -27,7 +30,7 @@ class CourseGrade(object):
     """
     Course Grade class
     """
-    def __init__(self, student, course, course_structure):
+    def __init__(self, student, course, course_structure, prefetched_scores=None):
         self.student = student
         self.course = course
         self.course_version = getattr(course, 'course_version', None)
@@ -35,7 +38,9 @@ class CourseGrade(object):
         self.course_structure = course_structure
         self._percent = None
         self._letter_grade = None
-        self._subsection_grade_factory = SubsectionGradeFactory(self.student, self.course, self.course_structure)
+        self._subsection_grade_factory = SubsectionGradeFactory(
+            self.student, self.course, self.course_structure, prefetched_scores,
+        )
 
     @lazy
     def graded_subsections_by_format(self):
@@ -215,7 +220,7 @@ class CourseGrade(object):
         )
 
     @classmethod
-    def load_persisted_grade(cls, user, course, course_structure):
+    def load_persisted_grade(cls, user, course, course_structure, prefetched_scores=None):
         """
         Initializes a CourseGrade object, filling its members with persisted values from the database.
 
@@ -227,7 +232,7 @@ class CourseGrade(object):
             persistent_grade = PersistentCourseGrade.read_course_grade(user.id, course.id)
         except PersistentCourseGrade.DoesNotExist:
             return None
-        course_grade = CourseGrade(user, course, course_structure)
+        course_grade = CourseGrade(user, course, course_structure, prefetched_scores)
 
         current_grading_policy_hash = course_grade.get_grading_policy_hash(course.location, course_structure)
         if current_grading_policy_hash != persistent_grade.grading_policy_hash:
@@ -323,20 +328,28 @@ class CourseGradeFactory(object):
     """
     Factory class to create Course Grade objects
     """
-    def create(self, student, course, read_only=True):
+    # Number of students whose scores are read together by iter.
+    BULK_GRADE_BATCH_SIZE = 100
+
+    def create(self, student, course, read_only=True, collected_block_structure=None, prefetched_scores=None):
         """
         Returns the CourseGrade object for the given student and course.
 
         If read_only is True, doesn't save any updates to the grades.
         Raises a PermissionDenied if the user does not have course access.
+
+        collected_block_structure and prefetched_scores may be given
+        when already available, as when grading many students at once.
         """
-        course_structure = get_course_blocks(student, course.location)
+        course_structure = get_course_blocks(
+            student, course.location, collected_block_structure=collected_block_structure,
+        )
         # if user does not have access to this course, throw an exception
         if not self._user_has_access_to_course(course_structure):
             raise PermissionDenied("User does not have access to this course")
         return (
-            self._get_saved_grade(student, course, course_structure) or
-            self._compute_and_update_grade(student, course, course_structure, read_only)
+            self._get_saved_grade(student, course, course_structure, prefetched_scores) or
+            self._compute_and_update_grade(student, course, course_structure, read_only, prefetched_scores)
         )
 
     GradeResult = namedtuple('GradeResult', ['student', 'course_grade', 'err_msg'])
@@ -350,12 +363,59 @@ class CourseGradeFactory(object):
 
         If an error occurred, course_grade will be None and err_msg will be an
         exception message. If there was no error, err_msg is an empty string.
-        """
+
+        The course's collected block structure is loaded only once, and the
+        students' scores are read in bulk, BULK_GRADE_BATCH_SIZE students at
+        a time, rather than with separate queries for each student.  If either
+        fails, the students are graded separately instead.
+        """
+        collected_block_structure = None
+        scorable_locations = None
+        is_collected_block_structure_loaded = False
+        students = iter(students)
+        while True:
+            batch = list(islice(students, self.BULK_GRADE_BATCH_SIZE))
+            if not batch:
+                break
+            if not is_collected_block_structure_loaded:
+                is_collected_block_structure_loaded = True
+                try:
+                    collected_block_structure = get_block_structure_manager(course.id).get_collected()
+                    scorable_locations = [
+                        block_key for block_key in collected_block_structure if possibly_scored(block_key)
+                    ]
+                except Exception:  # pylint: disable=broad-except
+                    log.exception('Cannot load the block structure of course %s to grade its students', course.id)
+                    collected_block_structure = None
+            for result in self._iter_batch(course, batch, collected_block_structure, scorable_locations):
+                yield result
+
+    def _iter_batch(self, course, students, collected_block_structure, scorable_locations):
+        """
+        Yields a GradeResult for each of the given students, after reading
+        the scores of all of them at the given locations in bulk, if given.
+        """
+        students_to_scores = {}
+        if scorable_locations is not None:
+            try:
+                with dog_stats_api.timer(
+                        'lms.grades.CourseGradeFactory.prefetch_scores', tags=[u'action:{}'.format(course.id)]
+                ):
+                    students_to_scores = prefetch_scores(course.id, students, scorable_locations)
+            except Exception:  # pylint: disable=broad-except
+                # The scores of each student are then read separately.
+                log.exception('Cannot read the scores of %d students in course %s in bulk', len(students), course.id)
+
         for student in students:
             with dog_stats_api.timer('lms.grades.CourseGradeFactory.iter', tags=[u'action:{}'.format(course.id)]):
 
                 try:
-                    course_grade = CourseGradeFactory().create(student, course)
+                    course_grade = self.create(
+                        student,
+                        course,
+                        collected_block_structure=collected_block_structure,
+                        prefetched_scores=students_to_scores.get(student.id),
+                    )
                     yield self.GradeResult(student, course_grade, "")
 
                 except Exception as exc:  # pylint: disable=broad-except
@@ -386,7 +446,7 @@ class CourseGradeFactory(object):
 
         return CourseGrade.get_persisted_grade(student, course)
 
-    def _get_saved_grade(self, student, course, course_structure):
+    def _get_saved_grade(self, student, course, course_structure, prefetched_scores=None):
         """
         Returns the saved grade for the given course and student.
         """
@@ -396,16 +456,17 @@ class CourseGradeFactory(object):
         return CourseGrade.load_persisted_grade(
             student,
             course,
-            course_structure
+            course_structure,
+            prefetched_scores,
         )
 
-    def _compute_and_update_grade(self, student, course, course_structure, read_only=False):
+    def _compute_and_update_grade(self, student, course, course_structure, read_only=False, prefetched_scores=None):
         """
         Freshly computes and updates the grade for the student and course.
 
         If read_only is True, doesn't save any updates to the grades.
         """
-        course_grade = CourseGrade(student, course, course_structure)
+        course_grade = CourseGrade(student, course, course_structure, prefetched_scores)
         course_grade.compute_and_update(read_only)
         return course_grade
 
@@ -1,7 +1,7 @@
 """
 SubsectionGrade Class
 """
-from collections import OrderedDict
+from collections import namedtuple, OrderedDict
 from lazy import lazy
 from logging import getLogger
 from courseware.model_data import ScoresClient
@@ -11,6 +11,7 @@ from lms.djangoapps.grades.config.models import PersistentGradesEnabledFlag
 from openedx.core.lib.grade_utils import is_score_higher
 from student.models import anonymous_id_for_user
 from submissions import api as submissions_api
+from submissions.models import ScoreSummary
 from xmodule import block_metadata_utils, graders
 from xmodule.graders import AggregatedScore
 
@@ -18,6 +19,45 @@ from xmodule.graders import AggregatedScore
 log = getLogger(__name__)
 
 
+PrefetchedScores = namedtuple('PrefetchedScores', ['submissions_scores', 'csm_scores'])
+
+
+def prefetch_scores(course_key, students, scorable_locations):
+    """
+    Bulk reads the scores of the given students in the course, from both
+    the Submissions API storage and the courseware student module (CSM),
+    using a constant number of queries regardless of the number of students.
+
+    Returns a dict mapping each student's id to a PrefetchedScores tuple,
+    which can be given to a SubsectionGradeFactory in place of the per-student
+    queries it would otherwise make.
+    """
+    anonymous_user_ids = {
+        anonymous_id_for_user(student, course_key, save=False): student.id
+        for student in students
+    }
+    submissions_scores = {student.id: {} for student in students}
+
+    # Mirrors submissions_api.get_scores, for many students at once.
+    score_summaries = ScoreSummary.objects.filter(
+        student_item__course_id=unicode(course_key),
+        student_item__student_id__in=anonymous_user_ids.keys(),
+    ).select_related('latest', 'student_item')
+    for summary in score_summaries:
+        if not summary.latest.is_hidden():
+            student_id = anonymous_user_ids[summary.student_item.student_id]
+            submissions_scores[student_id][summary.student_item.item_id] = (
+                summary.latest.points_earned,
+                summary.latest.points_possible,
+            )
+
+    csm_scores = ScoresClient.create_for_users(course_key, submissions_scores.keys(), scorable_locations)
+    return {
+        student_id: PrefetchedScores(submissions_scores[student_id], csm_scores[student_id])
+        for student_id in submissions_scores
+    }
+
+
 class SubsectionGrade(object):
     """
     Class for Subsection Grades.
@@ -203,10 +243,15 @@ class SubsectionGradeFactory(object):
     """
     Factory for Subsection Grades.
     """
-    def __init__(self, student, course, course_structure):
+    def __init__(self, student, course, course_structure, prefetched_scores=None):
+        """
+        If prefetched_scores (PrefetchedScores) is given, it is used
+        instead of querying the student's scores in the course.
+        """
         self.student = student
         self.course = course
         self.course_structure = course_structure
+        self._prefetched_scores = prefetched_scores
 
         self._cached_subsection_grades = None
         self._unsaved_subsection_grades = []
@@ -283,6 +328,8 @@ class SubsectionGradeFactory(object):
         Lazily queries and returns all the scores stored in the user
         state (in CSM) for the course, while caching the result.
         """
+        if self._prefetched_scores is not None:
+            return self._prefetched_scores.csm_scores
         scorable_locations = [block_key for block_key in self.course_structure if possibly_scored(block_key)]
         return ScoresClient.create_for_locations(self.course.id, self.student.id, scorable_locations)
 
@@ -292,6 +339,8 @@ class SubsectionGradeFactory(object):
         Lazily queries and returns the scores stored by the
         Submissions API for the course, while caching the result.
         """
+        if self._prefetched_scores is not None:
+            return self._prefetched_scores.submissions_scores
         anonymous_user_id = anonymous_id_for_user(self.student, self.course.id)
         return submissions_api.get_scores(unicode(self.course.id), anonymous_user_id)
 
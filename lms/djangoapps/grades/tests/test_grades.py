@@ -12,6 +12,7 @@ from courseware.model_data import set_score
 from courseware.tests.helpers import LoginEnrollmentTestCase
 
 from lms.djangoapps.course_blocks.api import get_course_blocks
+from openedx.core.djangoapps.content.block_structure.api import get_block_structure_manager
 from openedx.core.djangolib.testing.utils import get_mock_request
 from student.tests.factories import UserFactory
 from student.models import CourseEnrollment
@@ -23,7 +24,7 @@ from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
 from .utils import answer_problem
 from ..module_grades import get_module_score
 from ..new.course_grade import CourseGradeFactory
-from ..new.subsection_grade import SubsectionGradeFactory
+from ..new.subsection_grade import prefetch_scores, SubsectionGradeFactory
 
 
 @attr(shard=1)
@@ -113,6 +114,39 @@ class TestGradeIteration(SharedModuleStoreTestCase):
         self.assertIsNotNone(all_course_grades[student2])
         self.assertIsNotNone(all_course_grades[student5])
 
+    @patch('lms.djangoapps.grades.new.course_grade.prefetch_scores', wraps=prefetch_scores)
+    def test_scores_read_in_batches(self, mock_prefetch_scores):
+        with patch.object(CourseGradeFactory, 'BULK_GRADE_BATCH_SIZE', 2):
+            with patch(
+                'openedx.core.lib.block_structure.manager.BlockStructureManager.get_collected',
+                side_effect=get_block_structure_manager(self.course.id).get_collected,
+            ) as mock_get_collected:
+                all_course_grades, all_errors = self._course_grades_and_errors_for(self.course, self.students)
+
+        self.assertEqual(len(all_errors), 0)
+        self.assertEqual(len(all_course_grades), 5)
+        self.assertEqual(mock_get_collected.call_count, 1)
+        self.assertEqual(
+            [list(call[0][1]) for call in mock_prefetch_scores.call_args_list],
+            [self.students[0:2], self.students[2:4], self.students[4:5]],
+        )
+
+    @patch('lms.djangoapps.grades.new.course_grade.prefetch_scores')
+    def test_prefetch_scores_exception(self, mock_prefetch_scores):
+        # The students of a batch whose scores can't be read in bulk are graded separately
+        mock_prefetch_scores.side_effect = Exception('Cannot read scores')
+        all_course_grades, all_errors = self._course_grades_and_errors_for(self.course, self.students)
+        self.assertEqual(len(all_errors), 0)
+        self.assertEqual(len(all_course_grades), 5)
+
+    @patch('openedx.core.lib.block_structure.manager.BlockStructureManager.get_collected')
+    def test_collected_block_structure_exception(self, mock_get_collected):
+        # Each student is graded separately, and fails to be if the block structure can't be loaded
+        mock_get_collected.side_effect = Exception('Cannot load block structure')
+        all_course_grades, all_errors = self._course_grades_and_errors_for(self.course, self.students)
+        self.assertEqual(all_errors, {student: 'Cannot load block structure' for student in self.students})
+        self.assertEqual(len(all_course_grades), 5)
+
     def _course_grades_and_errors_for(self, course, students):
         """
         Simple helper method to iterate through student grades and give us
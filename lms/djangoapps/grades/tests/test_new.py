@@ -14,6 +14,7 @@ from mock import patch
 import pytz
 
 from capa.tests.response_xml_factory import MultipleChoiceResponseXMLFactory
+from courseware.model_data import set_score
 from courseware.tests.test_submitting_problems import ProblemSubmissionTestMixin
 from lms.djangoapps.course_blocks.api import get_course_blocks
 from lms.djangoapps.grades.config.tests.utils import persistent_grades_feature_flags
@@ -27,7 +28,7 @@ from xmodule.modulestore.xml_importer import import_course_from_xml
 
 from ..models import PersistentSubsectionGrade
 from ..new.course_grade import CourseGradeFactory
-from ..new.subsection_grade import SubsectionGrade, SubsectionGradeFactory
+from ..new.subsection_grade import prefetch_scores, SubsectionGrade, SubsectionGradeFactory
 from .utils import mock_get_score, mock_get_submissions_score
 
 
@@ -100,6 +101,28 @@ class TestCourseGradeFactory(GradeTestBase):
         }
         self.course.set_grading_policy(grading_policy)
 
+    def test_create_with_prefetched_scores(self):
+        other_student = UserFactory()
+        set_score(self.request.user.id, self.problem.location, 1, 2)
+        set_score(other_student.id, self.problem.location, 2, 2)
+
+        with self.assertNumQueries(2):
+            students_to_scores = prefetch_scores(
+                self.course.id, [self.request.user, other_student], [self.problem.location],
+            )
+        self.assertEqual(students_to_scores[other_student.id].csm_scores.get(self.problem.location).correct, 2)
+        self.assertEqual(students_to_scores[other_student.id].submissions_scores, {})
+
+        subsection_grade_factory = SubsectionGradeFactory(
+            self.request.user, self.course, self.course_structure, students_to_scores[self.request.user.id],
+        )
+        with patch('lms.djangoapps.grades.new.subsection_grade.ScoresClient.create_for_locations') as mock_csm:
+            with patch('lms.djangoapps.grades.new.subsection_grade.submissions_api.get_scores') as mock_submissions:
+                grade = subsection_grade_factory.create(self.sequence)
+        self.assertFalse(mock_csm.called)
+        self.assertFalse(mock_submissions.called)
+        self.assert_grade(grade, 1, 2)
+
     @patch.dict(settings.FEATURES, {'PERSISTENT_GRADES_ENABLED_FOR_ALL_TESTS': False})
     @ddt.data(
         (True, True),
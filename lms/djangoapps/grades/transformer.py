@@ -128,8 +128,13 @@ class GradesTransformer(BlockStructureTransformer):
         """
         Collect the `max_score` from the given module, storing it as a
         `transformer_block_field` associated with the `GradesTransformer`.
+
+        The max score collected for a previous version of the module is
+        reused when neither the module nor its ancestors changed since.
         """
-        max_score = module.max_score()
+        max_score = block_structure.get_previous_transformer_block_field(module.location, cls, 'max_score')
+        if max_score is None:
+            max_score = module.max_score()
         block_structure.set_transformer_block_field(module.location, cls, 'max_score', max_score)
         if max_score is None:
             log.warning("GradesTransformer: max_score is None for {}".format(module.location))
@@ -136,6 +136,19 @@ class TestECommerceDashboardViews(SiteMixin, SharedModuleStoreTestCase):
 
         self.assertIn('Course price per seat: <span>$' + str(price) + '</span>', response.content)
 
+    def test_set_course_price_cached_modes(self):
+        # The course modes are cached once read
+        paid_modes = CourseMode.paid_modes_for_course(self.course.id)
+        self.assertEqual([mode.min_price for mode in paid_modes], [10])
+
+        set_course_price_url = reverse('set_course_mode_price', kwargs={'course_id': self.course.id.to_deprecated_string()})
+        response = self.client.post(set_course_price_url, {'course_price': 150, 'currency': 'usd'})
+        self.assertIn('CourseMode price updated successfully', response.content)
+
+        # so they must be read again once the price is set
+        paid_modes = CourseMode.paid_modes_for_course(self.course.id)
+        self.assertEqual([mode.min_price for mode in paid_modes], [150])
+
     def test_user_admin_set_course_price(self):
         """
         test to set the course price related functionality.
@@ -410,10 +410,11 @@ def set_course_mode_price(request, course_id):
         min_price=course_honor_mode[0].min_price, currency=course_honor_mode[0].currency,
         expiration_datetime=datetime.datetime.now(pytz.utc), expiration_date=datetime.date.today()
     )
-    course_honor_mode.update(
-        min_price=course_price,
-        currency=currency
-    )
+    # Save each mode, rather than updating them in bulk, so that the cached course modes are invalidated.
+    for mode in course_honor_mode:
+        mode.min_price = course_price
+        mode.currency = currency
+        mode.save()
     return JsonResponse({'message': _("CourseMode price updated successfully")})
 
 
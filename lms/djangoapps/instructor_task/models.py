@@ -17,10 +17,12 @@ import csv
 import json
 import hashlib
 import os.path
+import shutil
+from tempfile import NamedTemporaryFile
 
 from django.conf import settings
 from django.contrib.auth.models import User
-from django.core.files.base import ContentFile
+from django.core.files.base import File
 from django.db import models, transaction
 
 from openedx.core.storage import get_storage
@@ -177,9 +179,9 @@ class InstructorTask(models.Model):
 class ReportStore(object):
     """
     Simple abstraction layer that can fetch and store CSV files for reports
-    download. Should probably refactor later to create a ReportFile object that
-    can simply be appended to for the sake of memory efficiency, rather than
-    passing in the whole dataset. Doing that for now just because it's simpler.
+    download. Rows may be passed in as any iterable (including a generator),
+    and are written out to a temporary file as they are produced, so the whole
+    dataset never needs to be held in memory.
     """
     @classmethod
     def from_config(cls, config_name):
@@ -271,12 +273,50 @@ class DjangoStorageReportStore(ReportStore):
         """
         Given a course_id, filename, and rows (each row is an iterable of
         strings), write the rows to the storage backend in csv format.
+
+        The rows are consumed one at a time and spooled to a temporary file
+        on disk before being handed to the storage backend.
+        """
+        with NamedTemporaryFile() as output_file:
+            csvwriter = csv.writer(output_file)
+            csvwriter.writerows(self._get_utf8_encoded_rows(rows))
+            output_file.seek(0)
+            self.store(course_id, filename, File(output_file))
+
+    def store_concatenated(self, course_id, filename, part_filenames, header=None):
+        """
+        Given a course_id, filename, and the filenames of CSV files previously
+        stored for the course, write the optional `header` row followed by the
+        contents of each of those files, in order, as a single CSV file.
+        """
+        with NamedTemporaryFile() as output_file:
+            if header is not None:
+                csvwriter = csv.writer(output_file)
+                csvwriter.writerows(self._get_utf8_encoded_rows([header]))
+            for part_filename in part_filenames:
+                with self.storage.open(self.path_to(course_id, part_filename)) as part_file:
+                    shutil.copyfileobj(part_file, output_file)
+            output_file.seek(0)
+            self.store(course_id, filename, File(output_file))
+
+    def filenames_in(self, course_id, directory):
+        """
+        For a given `course_id`, return the sorted names of the files in the
+        given directory, relative to the course's directory.
+        """
+        try:
+            _, filenames = self.storage.listdir(self.path_to(course_id, directory))
+        except OSError:
+            # Django's FileSystemStorage fails with an OSError if the
+            # directory does not exist.
+            return []
+        return sorted(filenames)
+
+    def delete(self, course_id, filename):
+        """
+        Delete the file with the given filename for the given course.
         """
-        output_buffer = ContentFile('')
-        csvwriter = csv.writer(output_buffer)
-        csvwriter.writerows(self._get_utf8_encoded_rows(rows))
-        output_buffer.seek(0)
-        self.store(course_id, filename, output_buffer)
+        self.storage.delete(self.path_to(course_id, filename))
 
     def links_for(self, course_id):
         """
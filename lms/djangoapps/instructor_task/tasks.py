@@ -30,7 +30,11 @@ from bulk_email.tasks import perform_delegate_email_batches
 from lms.djangoapps.instructor_task.tasks_helper import (
     run_main_task,
     BaseInstructorTask,
+    perform_delegate_grade_report_batches,
+    perform_grade_report_subtask,
+    perform_delegate_module_state_update_batches,
     perform_module_state_update,
+    perform_module_state_update_subtask,
     rescore_problem_module_state,
     reset_attempts_module_state,
     delete_problem_module_state,
@@ -52,6 +56,11 @@ from lms.djangoapps.instructor_task.tasks_helper import (
 TASK_LOG = logging.getLogger('edx.celery.task')
 
 
+def _filter_done_problems(modules_to_update):
+    """Filter that matches problems which are marked as being done"""
+    return modules_to_update.filter(state__contains='"done": true')
+
+
 @task(base=BaseInstructorTask)  # pylint: disable=not-callable
 def rescore_problem(entry_id, xmodule_instance_args):
     """Rescores a problem in a course, for all students or one specific student.
@@ -74,13 +83,33 @@ def rescore_problem(entry_id, xmodule_instance_args):
     # Translators: This is a past-tense verb that is inserted into task progress messages as {action}.
     action_name = ugettext_noop('rescored')
     update_fcn = partial(rescore_problem_module_state, xmodule_instance_args)
+    visit_fcn = partial(perform_module_state_update, update_fcn, _filter_done_problems)
+    if settings.RESCORE_STUDENT_MODULES_PER_TASK:
+        visit_fcn = partial(
+            perform_delegate_module_state_update_batches,
+            rescore_problem_subtask,
+            xmodule_instance_args,
+            _filter_done_problems,
+            visit_fcn,
+        )
+    return run_main_task(entry_id, visit_fcn, action_name)
 
-    def filter_fcn(modules_to_update):
-        """Filter that matches problems which are marked as being done"""
-        return modules_to_update.filter(state__contains='"done": true')
 
-    visit_fcn = partial(perform_module_state_update, update_fcn, filter_fcn)
-    return run_main_task(entry_id, visit_fcn, action_name)
+@task  # pylint: disable=not-callable
+def rescore_problem_subtask(entry_id, student_module_ids, xmodule_instance_args, subtask_status_dict):
+    """
+    Rescore a chunk of the student modules of a problem, as one of the
+    subtasks of a rescore_problem task.
+
+    `student_module_ids` lists the ids of the StudentModules to rescore, and
+    `subtask_status_dict` is the initial `SubtaskStatus` of this subtask, as a dict.
+    """
+    # Translators: This is a past-tense verb that is inserted into task progress messages as {action}.
+    action_name = ugettext_noop('rescored')
+    update_fcn = partial(rescore_problem_module_state, xmodule_instance_args)
+    return perform_module_state_update_subtask(
+        update_fcn, _filter_done_problems, entry_id, student_module_ids, action_name, subtask_status_dict
+    )
 
 
 @task(base=BaseInstructorTask)  # pylint: disable=not-callable
@@ -173,6 +202,10 @@ def calculate_grades_csv(entry_id, xmodule_instance_args):
     )
 
     task_fn = partial(upload_grades_csv, xmodule_instance_args)
+    if settings.GRADES_DOWNLOAD_STUDENTS_PER_TASK:
+        task_fn = partial(
+            perform_delegate_grade_report_batches, 'grade_report', calculate_grade_report_subtask, task_fn
+        )
     return run_main_task(entry_id, task_fn, action_name)
 
 
@@ -190,9 +223,26 @@ def calculate_problem_grade_report(entry_id, xmodule_instance_args):
     )
 
     task_fn = partial(upload_problem_grade_report, xmodule_instance_args)
+    if settings.GRADES_DOWNLOAD_STUDENTS_PER_TASK:
+        task_fn = partial(
+            perform_delegate_grade_report_batches, 'problem_grade_report', calculate_grade_report_subtask, task_fn
+        )
     return run_main_task(entry_id, task_fn, action_name)
 
 
+@task  # pylint: disable=not-callable
+def calculate_grade_report_subtask(entry_id, report_name, student_ids, subtask_status_dict):
+    """
+    Grade a range of the students enrolled in a course, as one of the subtasks
+    of a grade report task, and merge the report if it is the last to finish.
+
+    `report_name` identifies the grade report being generated, `student_ids`
+    lists the ids of the students to grade, and `subtask_status_dict` is the
+    initial `SubtaskStatus` of this subtask, as a dict.
+    """
+    return perform_grade_report_subtask(entry_id, report_name, student_ids, subtask_status_dict)
+
+
 @task(base=BaseInstructorTask, routing_key=settings.GRADES_DOWNLOAD_ROUTING_KEY)  # pylint: disable=not-callable
 def calculate_students_features_csv(entry_id, xmodule_instance_args):
     """
@@ -5,7 +5,9 @@ running state of a course.
 """
 import json
 import logging
+import os
 from StringIO import StringIO
+import traceback
 from collections import OrderedDict
 from datetime import datetime
 from itertools import chain
@@ -59,6 +61,12 @@ from shoppingcart.models import (
 )
 from openassessment.data import OraAggregateData
 from lms.djangoapps.instructor_task.models import ReportStore, InstructorTask, PROGRESS
+from lms.djangoapps.instructor_task.subtasks import (
+    SubtaskStatus,
+    check_subtask_is_valid,
+    queue_subtasks_for_query,
+    update_subtask_status,
+)
 from lms.djangoapps.lms_xblock.runtime import LmsPartitionService
 from openedx.core.djangoapps.course_groups.cohorts import get_cohort
 from openedx.core.djangoapps.course_groups.models import CourseUserGroup
@@ -175,6 +183,14 @@ class BaseInstructorTask(Task):
             entry.save_now()
 
 
+class GradeReportMergeError(Exception):
+    """
+    Error signaling that the partial CSVs of a grade report generated by
+    subtasks could not be merged into the final report.
+    """
+    pass
+
+
 class UpdateProblemModuleStateError(Exception):
     """
     Error signaling a fatal condition while updating problem modules.
@@ -304,41 +320,13 @@ def run_main_task(entry_id, task_fcn, action_name):
     return task_progress
 
 
-def perform_module_state_update(update_fcn, filter_fcn, _entry_id, course_id, task_input, action_name):
+def _get_modules_to_update(course_id, task_input, filter_fcn):
     """
-    Performs generic update by visiting StudentModule instances with the update_fcn provided.
-
-    StudentModule instances are those that match the specified `course_id` and `module_state_key`.
-    If `student_identifier` is not None, it is used as an additional filter to limit the modules to those belonging
-    to that student. If `student_identifier` is None, performs update on modules for all students on the specified problem.
-
-    If a `filter_fcn` is not None, it is applied to the query that has been constructed.  It takes one
-    argument, which is the query being filtered, and returns the filtered version of the query.
-
-    The `update_fcn` is called on each StudentModule that passes the resulting filtering.
-    It is passed four arguments:  the module_descriptor for the module pointed to by the
-    module_state_key, the particular StudentModule to update, the xmodule_instance_args, and the task_input
-    being passed through.  If the value returned by the update function evaluates to a boolean True,
-    the update is successful; False indicates the update on the particular student module failed.
-    A raised exception indicates a fatal condition -- that no other student modules should be considered.
-
-    The return value is a dict containing the task's results, with the following keys:
-
-          'attempted': number of attempts made
-          'succeeded': number of attempts that "succeeded"
-          'skipped': number of attempts that "skipped"
-          'failed': number of attempts that "failed"
-          'total': number of possible updates to attempt
-          'action_name': user-visible verb to use in status messages.  Should be past-tense.
-              Pass-through of input `action_name`.
-          'duration_ms': how long the task has (or had) been running.
-
-    Because this is run internal to a task, it does not catch exceptions.  These are allowed to pass up to the
-    next level, so that it can set the failure modes and capture the error trace in the InstructorTask and the
-    result object.
-
+    Returns a (problems, modules_to_update) tuple for the StudentModule
+    instances to be visited by a module state update of the given course,
+    as described by `perform_module_state_update`: a dict of the problem
+    descriptors by usage key string, and the query of the StudentModules.
     """
-    start_time = time()
     usage_keys = []
     problem_url = task_input.get('problem_url')
     entrance_exam_url = task_input.get('entrance_exam_url')
@@ -379,6 +367,46 @@ def perform_module_state_update(update_fcn, filter_fcn, _entry_id, course_id, ta
     if filter_fcn is not None:
         modules_to_update = filter_fcn(modules_to_update)
 
+    return problems, modules_to_update
+
+
+def perform_module_state_update(update_fcn, filter_fcn, _entry_id, course_id, task_input, action_name):
+    """
+    Performs generic update by visiting StudentModule instances with the update_fcn provided.
+
+    StudentModule instances are those that match the specified `course_id` and `module_state_key`.
+    If `student_identifier` is not None, it is used as an additional filter to limit the modules to those belonging
+    to that student. If `student_identifier` is None, performs update on modules for all students on the specified problem.
+
+    If a `filter_fcn` is not None, it is applied to the query that has been constructed.  It takes one
+    argument, which is the query being filtered, and returns the filtered version of the query.
+
+    The `update_fcn` is called on each StudentModule that passes the resulting filtering.
+    It is passed four arguments:  the module_descriptor for the module pointed to by the
+    module_state_key, the particular StudentModule to update, the xmodule_instance_args, and the task_input
+    being passed through.  If the value returned by the update function evaluates to a boolean True,
+    the update is successful; False indicates the update on the particular student module failed.
+    A raised exception indicates a fatal condition -- that no other student modules should be considered.
+
+    The return value is a dict containing the task's results, with the following keys:
+
+          'attempted': number of attempts made
+          'succeeded': number of attempts that "succeeded"
+          'skipped': number of attempts that "skipped"
+          'failed': number of attempts that "failed"
+          'total': number of possible updates to attempt
+          'action_name': user-visible verb to use in status messages.  Should be past-tense.
+              Pass-through of input `action_name`.
+          'duration_ms': how long the task has (or had) been running.
+
+    Because this is run internal to a task, it does not catch exceptions.  These are allowed to pass up to the
+    next level, so that it can set the failure modes and capture the error trace in the InstructorTask and the
+    result object.
+
+    """
+    start_time = time()
+    problems, modules_to_update = _get_modules_to_update(course_id, task_input, filter_fcn)
+
     task_progress = TaskProgress(action_name, modules_to_update.count(), start_time)
     task_progress.update_task_state()
 
@@ -403,6 +431,125 @@ def perform_module_state_update(update_fcn, filter_fcn, _entry_id, course_id, ta
     return task_progress.update_task_state()
 
 
+def perform_delegate_module_state_update_batches(
+        subtask,
+        xmodule_instance_args,
+        filter_fcn,
+        visit_fcn,
+        entry_id,
+        course_id,
+        task_input,
+        action_name,
+):
+    """
+    Performs a module state update by partitioning the StudentModule instances
+    to update into chunks of `RESCORE_STUDENT_MODULES_PER_TASK` modules, ordered
+    by id, and queueing a `subtask` to update each chunk in parallel.  The
+    subtasks report their progress into the InstructorTask, which combines it.
+
+    Updates of no more modules than fit in a single subtask are performed in
+    this task by calling `visit_fcn` instead.
+    """
+    entry = InstructorTask.objects.get(pk=entry_id)
+
+    # Check to see if the subtasks have already been defined, which happens
+    # if this task is requeued, as for bulk email.
+    if len(entry.subtasks) > 0 and len(entry.task_output) > 0:
+        TASK_LOG.warning(u"Task %s has already been processed!  InstructorTask = %s", entry.task_id, entry)
+        return json.loads(entry.task_output)
+
+    _problems, modules_to_update = _get_modules_to_update(course_id, task_input, filter_fcn)
+    modules_to_update = modules_to_update.order_by('id')
+    total_modules = modules_to_update.count()
+    modules_per_task = settings.RESCORE_STUDENT_MODULES_PER_TASK
+    if total_modules <= modules_per_task:
+        return visit_fcn(entry_id, course_id, task_input, action_name)
+
+    def _create_module_state_update_subtask(module_list, initial_subtask_status):
+        """Creates a subtask to update a given list of student modules."""
+        return subtask.subtask(
+            (
+                entry_id,
+                [module['pk'] for module in module_list],
+                xmodule_instance_args,
+                initial_subtask_status.to_dict(),
+            ),
+            task_id=initial_subtask_status.task_id,
+        )
+
+    return queue_subtasks_for_query(
+        entry,
+        action_name,
+        _create_module_state_update_subtask,
+        [modules_to_update],
+        [],
+        modules_per_task,
+        total_modules,
+    )
+
+
+def perform_module_state_update_subtask(
+        update_fcn,
+        filter_fcn,
+        entry_id,
+        student_module_ids,
+        action_name,
+        subtask_status_dict,
+):
+    """
+    Updates the StudentModule instances with the given ids, for one chunk of a
+    module state update queued by `perform_delegate_module_state_update_batches`,
+    and records the results in the InstructorTask.
+
+    The problem descriptors and the course are loaded once for the chunk, and
+    the modules are updated within a single bulk operation, so that the
+    modulestore is not queried again for each student.  Modules that no longer
+    match the task's filter since the chunk was queued are counted as skipped.
+    """
+    subtask_status = SubtaskStatus.from_dict(subtask_status_dict)
+    current_task_id = subtask_status.task_id
+    TASK_LOG.info(
+        u"Preparing to update %d student modules as subtask %s for instructor task %d",
+        len(student_module_ids), current_task_id, entry_id,
+    )
+    check_subtask_is_valid(entry_id, current_task_id, subtask_status)
+
+    try:
+        entry = InstructorTask.objects.get(pk=entry_id)
+        course_id = entry.course_id
+        task_input = json.loads(entry.task_input)
+        with modulestore().bulk_operations(course_id):
+            problems, modules_to_update = _get_modules_to_update(course_id, task_input, filter_fcn)
+            modules_to_update = modules_to_update.filter(id__in=student_module_ids).select_related('student')
+            for module_to_update in modules_to_update:
+                module_descriptor = problems[unicode(module_to_update.module_state_key)]
+                with dog_stats_api.timer(
+                    'instructor_tasks.module.time.step', tags=[u'action:{name}'.format(name=action_name)]
+                ):
+                    update_status = update_fcn(module_descriptor, module_to_update, task_input)
+                if update_status not in (UPDATE_STATUS_SUCCEEDED, UPDATE_STATUS_FAILED, UPDATE_STATUS_SKIPPED):
+                    raise UpdateProblemModuleStateError("Unexpected update_status returned: {}".format(update_status))
+                subtask_status.increment(**{update_status: 1})
+
+        subtask_status.increment(
+            skipped=len(student_module_ids) - subtask_status.attempted - subtask_status.skipped
+        )
+    except Exception:
+        # Unexpected exception.  Count the modules not yet updated as failed,
+        # and write out the failure to the entry before failing.
+        TASK_LOG.exception(u"Module state update subtask %s: failed unexpectedly!", current_task_id)
+        subtask_status.increment(
+            failed=len(student_module_ids) - subtask_status.attempted - subtask_status.skipped,
+            state=FAILURE,
+        )
+        update_subtask_status(entry_id, current_task_id, subtask_status)
+        raise
+
+    subtask_status.increment(state=SUCCESS)
+    update_subtask_status(entry_id, current_task_id, subtask_status)
+    return subtask_status.to_dict()
+
+
 def _get_task_id_from_xmodule_args(xmodule_instance_args):
     """Gets task_id from `xmodule_instance_args` dict, or returns default value if missing."""
     return xmodule_instance_args.get('task_id', UNKNOWN_TASK_ID) if xmodule_instance_args is not None else UNKNOWN_TASK_ID
@@ -655,16 +802,48 @@ def upload_csv_to_report_store(rows, csv_name, course_id, timestamp, config_name
     report_store = ReportStore.from_config(config_name)
     report_store.store_rows(
         course_id,
-        u"{course_prefix}_{csv_name}_{timestamp_str}.csv".format(
-            course_prefix=course_filename_prefix_generator(course_id),
-            csv_name=csv_name,
-            timestamp_str=timestamp.strftime("%Y-%m-%d-%H%M")
-        ),
+        _report_filename(csv_name, course_id, timestamp),
         rows
     )
     tracker.emit(REPORT_REQUESTED_EVENT_NAME, {"report_type": csv_name, })
 
 
+def upload_csv_parts_to_report_store(part_filenames, header, csv_name, course_id, timestamp,
+                                     config_name='GRADES_DOWNLOAD'):
+    """
+    Upload a CSV using ReportStore, consisting of the given header row
+    followed by the rows of the given CSV files previously stored in the
+    ReportStore.
+
+    Arguments:
+        part_filenames: Paths of the stored CSV files, relative to the
+            course's directory in the ReportStore
+        header: The header row of the resulting CSV
+        csv_name: Name of the resulting CSV
+        course_id: ID of the course
+    """
+    report_store = ReportStore.from_config(config_name)
+    report_store.store_concatenated(
+        course_id,
+        _report_filename(csv_name, course_id, timestamp),
+        part_filenames,
+        header=header,
+    )
+    tracker.emit(REPORT_REQUESTED_EVENT_NAME, {"report_type": csv_name, })
+
+
+def _report_filename(csv_name, course_id, timestamp):
+    """
+    Returns the filename of the CSV report with the given name for the given
+    course, generated at the given time.
+    """
+    return u"{course_prefix}_{csv_name}_{timestamp_str}.csv".format(
+        course_prefix=course_filename_prefix_generator(course_id),
+        csv_name=csv_name,
+        timestamp_str=timestamp.strftime("%Y-%m-%d-%H%M")
+    )
+
+
 def upload_exec_summary_to_store(data_dict, report_name, course_id, generated_at, config_name='FINANCIAL_REPORTS'):
     """
     Upload Executive Summary Html file using ReportStore.
@@ -691,7 +870,7 @@ def upload_exec_summary_to_store(data_dict, report_name, course_id, generated_at
     tracker.emit(REPORT_REQUESTED_EVENT_NAME, {"report_type": report_name})
 
 
-def upload_grades_csv(_xmodule_instance_args, _entry_id, course_id, _task_input, action_name):  # pylint: disable=too-many-statements
+def upload_grades_csv(_xmodule_instance_args, _entry_id, course_id, _task_input, action_name):
     """
     For a given `course_id`, generate a grades CSV file for all students that
     are enrolled, and store using a `ReportStore`. Once created, the files can
@@ -700,9 +879,9 @@ def upload_grades_csv(_xmodule_instance_args, _entry_id, course_id, _task_input,
     buffered, so we'll never write part of a CSV file to S3 -- i.e. any files
     that are visible in ReportStore will be complete ones.
 
-    As we start to add more CSV downloads, it will probably be worthwhile to
-    make a more general CSVDoc class instead of building out the rows like we
-    do here.
+    Students are graded in chunks of `GRADES_DOWNLOAD_STUDENTS_PER_CHUNK`,
+    ordered by user id, and each row is streamed to the `ReportStore` as soon
+    as it is computed, so memory use does not grow with the enrollment size.
     """
     start_time = time()
     start_date = datetime.now(UTC)
@@ -720,25 +899,10 @@ def upload_grades_csv(_xmodule_instance_args, _entry_id, course_id, _task_input,
     )
     TASK_LOG.info(u'%s, Task type: %s, Starting task execution', task_info_string, action_name)
 
-    course = get_course_by_id(course_id)
-    course_is_cohorted = is_course_cohorted(course.id)
-    teams_enabled = course.teams_enabled
-    cohorts_header = ['Cohort Name'] if course_is_cohorted else []
-    teams_header = ['Team Name'] if teams_enabled else []
-
-    experiment_partitions = get_split_user_partitions(course.user_partitions)
-    group_configs_header = [u'Experiment Group ({})'.format(partition.name) for partition in experiment_partitions]
-
-    certificate_info_header = ['Certificate Eligible', 'Certificate Delivered', 'Certificate Type']
-    certificate_whitelist = CertificateWhitelist.objects.filter(course_id=course_id, whitelist=True)
-    whitelisted_user_ids = [entry.user_id for entry in certificate_whitelist]
-
-    # Loop over all our students and build our CSV lists in memory
-    rows = []
-    err_rows = [["id", "username", "error_msg"]]
+    report = CourseGradeReport(course_id)
+    err_rows = [report.error_header]
     current_step = {'step': 'Calculating Grades'}
 
-    student_counter = 0
     TASK_LOG.info(
         u'%s, Task type: %s, Current step: %s, Starting grade calculation for total students: %s',
         task_info_string,
@@ -747,62 +911,136 @@ def upload_grades_csv(_xmodule_instance_args, _entry_id, course_id, _task_input,
         total_enrolled_students,
     )
 
-    graded_assignments = _graded_assignments(course_id)
-    grade_header = []
-    for assignment_info in graded_assignments.itervalues():
-        if assignment_info['use_subsection_headers']:
-            grade_header.extend(assignment_info['subsection_headers'].itervalues())
-        grade_header.append(assignment_info['average_header'])
-
-    rows.append(
-        ["Student ID", "Email", "Username", "Grade"] +
-        grade_header +
-        cohorts_header +
-        group_configs_header +
-        teams_header +
-        ['Enrollment Track', 'Verification Status'] +
-        certificate_info_header
+    def rows():
+        """
+        Yields the header row followed by a row for each successfully
+        graded student, grading the enrolled students chunk by chunk.
+        """
+        yield report.header
+
+        students_per_chunk = settings.GRADES_DOWNLOAD_STUDENTS_PER_CHUNK
+        for students in _enrolled_students_in_chunks(enrolled_students, students_per_chunk):
+            for row, err_row in report.rows(students):
+                # Periodically update task status (this is a cache write)
+                if task_progress.attempted % status_interval == 0:
+                    task_progress.update_task_state(extra_meta=current_step)
+                task_progress.attempted += 1
+
+                # Now add a log entry after each student is graded to get a sense
+                # of the task's progress
+                TASK_LOG.info(
+                    u'%s, Task type: %s, Current step: %s, Grade calculation in-progress for students: %s/%s',
+                    task_info_string,
+                    action_name,
+                    current_step,
+                    task_progress.attempted,
+                    total_enrolled_students
+                )
+
+                if err_row:
+                    task_progress.failed += 1
+                    err_rows.append(err_row)
+                else:
+                    task_progress.succeeded += 1
+                    yield row
+
+    # Perform the actual upload, computing the rows as they are written out.
+    upload_csv_to_report_store(rows(), report.report_name, course_id, start_date)
+
+    TASK_LOG.info(
+        u'%s, Task type: %s, Current step: %s, Grade calculation completed for students: %s/%s',
+        task_info_string,
+        action_name,
+        current_step,
+        task_progress.attempted,
+        total_enrolled_students
     )
 
-    for student, course_grade, err_msg in CourseGradeFactory().iter(course, enrolled_students):
-        # Periodically update task status (this is a cache write)
-        if task_progress.attempted % status_interval == 0:
-            task_progress.update_task_state(extra_meta=current_step)
-        task_progress.attempted += 1
+    # By this point, the grade report has been written out.
+    current_step = {'step': 'Uploading CSVs'}
+    task_progress.update_task_state(extra_meta=current_step)
+    TASK_LOG.info(u'%s, Task type: %s, Current step: %s', task_info_string, action_name, current_step)
 
-        # Now add a log entry after each student is graded to get a sense
-        # of the task's progress
-        student_counter += 1
-        TASK_LOG.info(
-            u'%s, Task type: %s, Current step: %s, Grade calculation in-progress for students: %s/%s',
-            task_info_string,
-            action_name,
-            current_step,
-            student_counter,
-            total_enrolled_students
+    # If there are any error rows (don't count the header), write them out as well
+    if len(err_rows) > 1:
+        upload_csv_to_report_store(err_rows, report.report_name + '_err', course_id, start_date)
+
+    # One last update before we close out...
+    TASK_LOG.info(u'%s, Task type: %s, Finalizing grade task', task_info_string, action_name)
+    return task_progress.update_task_state(extra_meta=current_step)
+
+
+class CourseGradeReport(object):
+    """
+    Builds the rows of the grade report for a course: one row per student with
+    the student's overall and per-assignment grades, along with their cohort,
+    experiment groups, team, enrollment track and certificate information.
+    """
+    report_name = 'grade_report'
+    error_header = ["id", "username", "error_msg"]
+
+    def __init__(self, course_id):
+        self.course_id = course_id
+        self.course = get_course_by_id(course_id)
+        self.course_is_cohorted = is_course_cohorted(self.course.id)
+        self.teams_enabled = self.course.teams_enabled
+        self.experiment_partitions = get_split_user_partitions(self.course.user_partitions)
+        certificate_whitelist = CertificateWhitelist.objects.filter(course_id=course_id, whitelist=True)
+        self.whitelisted_user_ids = set(entry.user_id for entry in certificate_whitelist)
+        self.graded_assignments = _graded_assignments(course_id)
+
+    @property
+    def header(self):
+        """
+        Returns the header row of the report.
+        """
+        grade_header = []
+        for assignment_info in self.graded_assignments.itervalues():
+            if assignment_info['use_subsection_headers']:
+                grade_header.extend(assignment_info['subsection_headers'].itervalues())
+            grade_header.append(assignment_info['average_header'])
+
+        return (
+            ["Student ID", "Email", "Username", "Grade"] +
+            grade_header +
+            (['Cohort Name'] if self.course_is_cohorted else []) +
+            [u'Experiment Group ({})'.format(partition.name) for partition in self.experiment_partitions] +
+            (['Team Name'] if self.teams_enabled else []) +
+            ['Enrollment Track', 'Verification Status'] +
+            ['Certificate Eligible', 'Certificate Delivered', 'Certificate Type']
         )
 
-        if not course_grade:
-            # An empty gradeset means we failed to grade a student.
-            task_progress.failed += 1
-            err_rows.append([student.id, student.username, err_msg])
-            continue
+    def rows(self, students):
+        """
+        Grades the given students, yielding a `(row, err_row)` tuple for each
+        of them.  `row` is None if the student could not be graded, in which
+        case `err_row` describes the error; otherwise `err_row` is None.
+        """
+        for student, course_grade, err_msg in CourseGradeFactory().iter(self.course, students):
+            if not course_grade:
+                # An empty gradeset means we failed to grade a student.
+                yield None, [student.id, student.username, err_msg]
+            else:
+                yield self._row(student, course_grade), None
 
-        # We were able to successfully grade this student for this course.
-        task_progress.succeeded += 1
+    def _row(self, student, course_grade):
+        """
+        Returns the report row for the given successfully graded student.
+        """
+        course_id = self.course_id
 
         cohorts_group_name = []
-        if course_is_cohorted:
+        if self.course_is_cohorted:
             group = get_cohort(student, course_id, assign=False)
             cohorts_group_name.append(group.name if group else '')
 
         group_configs_group_names = []
-        for partition in experiment_partitions:
+        for partition in self.experiment_partitions:
             group = LmsPartitionService(student, course_id).get_group(partition, assign=False)
             group_configs_group_names.append(group.name if group else '')
 
         team_name = []
-        if teams_enabled:
+        if self.teams_enabled:
             try:
                 membership = CourseTeamMembership.objects.get(user=student, team__course_id=course_id)
                 team_name.append(membership.team.name)
@@ -819,11 +1057,11 @@ def upload_grades_csv(_xmodule_instance_args, _entry_id, course_id, _task_input,
             student,
             course_id,
             course_grade.letter_grade,
-            student.id in whitelisted_user_ids
+            student.id in self.whitelisted_user_ids
         )
 
         grade_results = []
-        for assignment_type, assignment_info in graded_assignments.iteritems():
+        for assignment_type, assignment_info in self.graded_assignments.iteritems():
             for subsection_location in assignment_info['subsection_headers']:
                 try:
                     subsection_grade = course_grade.graded_subsections_by_format[assignment_type][subsection_location]
@@ -842,36 +1080,270 @@ def upload_grades_csv(_xmodule_instance_args, _entry_id, course_id, _task_input,
 
         grade_results = list(chain.from_iterable(grade_results))
 
-        rows.append(
+        return (
             [student.id, student.email, student.username, course_grade.percent] +
             grade_results + cohorts_group_name + group_configs_group_names + team_name +
             [enrollment_mode] + [verification_status] + certificate_info
         )
 
-    TASK_LOG.info(
-        u'%s, Task type: %s, Current step: %s, Grade calculation completed for students: %s/%s',
-        task_info_string,
+
+class ProblemGradeReport(object):
+    """
+    Builds the rows of the problem grade report for a course: one row per
+    student with the student's overall grade and their earned and possible
+    scores on each graded problem.
+    """
+    report_name = 'problem_grade_report'
+
+    # This struct encapsulates both the display names of each static item in the
+    # header row as values as well as the django User field names of those items
+    # as the keys.  It is structured in this way to keep the values related.
+    header_row = OrderedDict([('id', 'Student ID'), ('email', 'Email'), ('username', 'Username')])
+
+    def __init__(self, course_id):
+        self.course = get_course_by_id(course_id)
+        self.graded_scorable_blocks = _graded_scorable_blocks_to_header(course_id)
+
+    @property
+    def header(self):
+        """
+        Returns the header row of the report.
+        """
+        return (
+            list(self.header_row.values()) + ['Grade'] +
+            list(chain.from_iterable(self.graded_scorable_blocks.values()))
+        )
+
+    @property
+    def error_header(self):
+        """
+        Returns the header row of the error report.
+        """
+        return list(self.header_row.values()) + ['error_msg']
+
+    def rows(self, students):
+        """
+        Grades the given students, yielding a `(row, err_row)` tuple for each
+        of them.  `row` is None if the student could not be graded, in which
+        case `err_row` describes the error; otherwise `err_row` is None.
+        """
+        for student, course_grade, err_msg in CourseGradeFactory().iter(self.course, students):
+            student_fields = [getattr(student, field_name) for field_name in self.header_row]
+
+            if not course_grade:
+                # There was an error grading this student.
+                yield None, student_fields + [err_msg or u'Unknown error']
+                continue
+
+            earned_possible_values = []
+            for block_location in self.graded_scorable_blocks:
+                try:
+                    problem_score = course_grade.locations_to_scores[block_location]
+                except KeyError:
+                    earned_possible_values.append([u'Not Available', u'Not Available'])
+                else:
+                    if problem_score.attempted:
+                        earned_possible_values.append([problem_score.earned, problem_score.possible])
+                    else:
+                        earned_possible_values.append([u'Not Attempted', problem_score.possible])
+
+            yield student_fields + [course_grade.percent] + list(chain.from_iterable(earned_possible_values)), None
+
+
+# Grade reports that can be generated by fanning out to subtasks, by report name.
+GRADE_REPORT_CLASSES = {
+    report_class.report_name: report_class
+    for report_class in (CourseGradeReport, ProblemGradeReport)
+}
+
+# Prefix of the names of the partial error report files written by grade report subtasks.
+GRADE_REPORT_PART_ERR_PREFIX = 'err_'
+
+
+def _enrolled_students_in_chunks(enrolled_students, chunk_size):
+    """
+    Given a queryset of enrolled students (User), yield lists of at most
+    `chunk_size` students, ordered by id.  Each chunk is fetched with its own
+    query, paginating on the user id, so only one chunk is held in memory
+    at a time.
+    """
+    last_id = 0
+    while True:
+        students = list(enrolled_students.filter(id__gt=last_id).order_by('id')[:chunk_size])
+        if not students:
+            return
+        yield students
+        last_id = students[-1].id
+
+
+def perform_delegate_grade_report_batches(
+        report_name,
+        subtask,
+        upload_fcn,
+        entry_id,
+        course_id,
+        task_input,
         action_name,
-        current_step,
-        student_counter,
-        total_enrolled_students
+):
+    """
+    Generates the grade report named `report_name` by partitioning the
+    enrolled students into ranges of `GRADES_DOWNLOAD_STUDENTS_PER_TASK`
+    students, ordered by user id, and queueing a `subtask` to grade each
+    range in parallel.  The last subtask to complete merges the partial
+    CSVs into the final report.
+
+    Courses with no more students than fit in a single subtask are graded
+    in this task by calling `upload_fcn` instead.
+    """
+    entry = InstructorTask.objects.get(pk=entry_id)
+
+    # Check to see if the subtasks have already been defined, which happens
+    # if this task is requeued, as for bulk email.
+    if len(entry.subtasks) > 0 and len(entry.task_output) > 0:
+        TASK_LOG.warning(u"Task %s has already been processed!  InstructorTask = %s", entry.task_id, entry)
+        return json.loads(entry.task_output)
+
+    enrolled_students = CourseEnrollment.objects.users_enrolled_in(course_id).order_by('id')
+    total_enrolled_students = enrolled_students.count()
+    students_per_task = settings.GRADES_DOWNLOAD_STUDENTS_PER_TASK
+    if total_enrolled_students <= students_per_task:
+        return upload_fcn(entry_id, course_id, task_input, action_name)
+
+    def _create_grade_report_subtask(student_list, initial_subtask_status):
+        """Creates a subtask to grade a given list of students."""
+        return subtask.subtask(
+            (
+                entry_id,
+                report_name,
+                [student['pk'] for student in student_list],
+                initial_subtask_status.to_dict(),
+            ),
+            task_id=initial_subtask_status.task_id,
+            routing_key=settings.GRADES_DOWNLOAD_ROUTING_KEY,
+        )
+
+    return queue_subtasks_for_query(
+        entry,
+        action_name,
+        _create_grade_report_subtask,
+        [enrolled_students],
+        [],
+        students_per_task,
+        total_enrolled_students,
     )
 
-    # By this point, we've got the rows we're going to stuff into our CSV files.
-    current_step = {'step': 'Uploading CSVs'}
-    task_progress.update_task_state(extra_meta=current_step)
-    TASK_LOG.info(u'%s, Task type: %s, Current step: %s', task_info_string, action_name, current_step)
 
-    # Perform the actual upload
-    upload_csv_to_report_store(rows, 'grade_report', course_id, start_date)
+def perform_grade_report_subtask(entry_id, report_name, student_ids, subtask_status_dict):
+    """
+    Grades the students with the given ids for one range of a grade report
+    generated by `perform_delegate_grade_report_batches`, storing their rows
+    (and error rows) as partial CSVs in the `ReportStore`.  If this is the
+    last subtask of the task to complete, the partial CSVs are merged, and
+    only then is the task marked as completed.
+    """
+    subtask_status = SubtaskStatus.from_dict(subtask_status_dict)
+    current_task_id = subtask_status.task_id
+    TASK_LOG.info(
+        u"Preparing to grade %d students for %s as subtask %s for instructor task %d",
+        len(student_ids), report_name, current_task_id, entry_id,
+    )
+    check_subtask_is_valid(entry_id, current_task_id, subtask_status)
 
-    # If there are any error rows (don't count the header), write them out as well
-    if len(err_rows) > 1:
-        upload_csv_to_report_store(err_rows, 'grade_report_err', course_id, start_date)
+    report = None
+    try:
+        course_id = InstructorTask.objects.get(pk=entry_id).course_id
+        report = GRADE_REPORT_CLASSES[report_name](course_id)
+        students = User.objects.filter(id__in=student_ids).order_by('id')
+        err_rows = []
+
+        def rows():
+            """
+            Yields a row for each successfully graded student.
+            """
+            for row, err_row in report.rows(students):
+                if err_row:
+                    subtask_status.increment(failed=1)
+                    err_rows.append(err_row)
+                else:
+                    subtask_status.increment(succeeded=1)
+                    yield row
+
+        report_store = ReportStore.from_config(config_name='GRADES_DOWNLOAD')
+        part_name = u'{:012d}.csv'.format(min(student_ids))
+        report_store.store_rows(course_id, _grade_report_part_path(entry_id, part_name), rows())
+        if err_rows:
+            err_part_name = GRADE_REPORT_PART_ERR_PREFIX + part_name
+            report_store.store_rows(course_id, _grade_report_part_path(entry_id, err_part_name), err_rows)
+    except Exception:
+        # Unexpected exception.  Count the students not yet graded as failed,
+        # and write out the failure to the entry before failing.
+        TASK_LOG.exception(u"Grade report subtask %s for %s: failed unexpectedly!", current_task_id, report_name)
+        subtask_status.increment(failed=len(student_ids) - subtask_status.attempted, state=FAILURE)
+        if update_subtask_status(entry_id, current_task_id, subtask_status, complete_parent=False):
+            # Doesn't raise, so that this subtask's exception is the one raised.
+            _merge_grade_report_parts(entry_id, report)
+        raise
+
+    subtask_status.increment(state=SUCCESS)
+    if update_subtask_status(entry_id, current_task_id, subtask_status, complete_parent=False):
+        _merge_grade_report_parts(entry_id, report)
+    return subtask_status.to_dict()
+
+
+def _grade_report_part_path(entry_id, part_name=''):
+    """
+    Returns the path, relative to the course's `ReportStore` directory, of the
+    given partial CSV written by a grade report subtask of the given task.
+    """
+    return os.path.join('partial', unicode(entry_id), part_name)
 
-    # One last update before we close out...
-    TASK_LOG.info(u'%s, Task type: %s, Finalizing grade task', task_info_string, action_name)
-    return task_progress.update_task_state(extra_meta=current_step)
+
+def _merge_grade_report_parts(entry_id, report):
+    """
+    Concatenates the partial CSVs written by the subtasks of the given task
+    into the final grade report and error report, deletes them, and marks
+    the task as completed.  If any subtask failed, no report is written,
+    since it would be incomplete, and the task is marked as failed, as it
+    is if the report can't be written.  Doesn't raise.
+    """
+    entry = InstructorTask.objects.get(pk=entry_id)
+    course_id = entry.course_id
+    report_store = ReportStore.from_config(config_name='GRADES_DOWNLOAD')
+    part_paths = []
+    try:
+        part_paths = [
+            _grade_report_part_path(entry_id, part_name)
+            for part_name in report_store.filenames_in(course_id, _grade_report_part_path(entry_id))
+        ]
+        if json.loads(entry.subtasks)['failed'] or report is None:
+            raise GradeReportMergeError(u"The grade report is incomplete, since some students couldn't be graded.")
+
+        err_part_paths = [
+            part_path for part_path in part_paths
+            if os.path.basename(part_path).startswith(GRADE_REPORT_PART_ERR_PREFIX)
+        ]
+        row_part_paths = [part_path for part_path in part_paths if part_path not in err_part_paths]
+
+        TASK_LOG.info(u"Merging %d partial grade reports for instructor task %d", len(row_part_paths), entry_id)
+        timestamp = entry.created or datetime.now(UTC)
+        upload_csv_parts_to_report_store(row_part_paths, report.header, report.report_name, course_id, timestamp)
+        if err_part_paths:
+            upload_csv_parts_to_report_store(
+                err_part_paths, report.error_header, report.report_name + '_err', course_id, timestamp
+            )
+    except Exception as exception:  # pylint: disable=broad-except
+        TASK_LOG.exception(u"Failed to merge grade report for instructor task %d", entry_id)
+        entry.task_output = InstructorTask.create_output_for_failure(exception, traceback.format_exc())
+        entry.task_state = FAILURE
+    else:
+        entry.task_state = SUCCESS
+    entry.save_now()
+
+    for part_path in part_paths:
+        try:
+            report_store.delete(course_id, part_path)
+        except Exception:  # pylint: disable=broad-except
+            TASK_LOG.exception(u"Failed to delete partial grade report %s of instructor task %d", part_path, entry_id)
 
 
 def _graded_assignments(course_key):
@@ -976,55 +1448,33 @@ def upload_problem_grade_report(_xmodule_instance_args, _entry_id, course_id, _t
     enrolled_students = CourseEnrollment.objects.users_enrolled_in(course_id)
     task_progress = TaskProgress(action_name, enrolled_students.count(), start_time)
 
-    # This struct encapsulates both the display names of each static item in the
-    # header row as values as well as the django User field names of those items
-    # as the keys.  It is structured in this way to keep the values related.
-    header_row = OrderedDict([('id', 'Student ID'), ('email', 'Email'), ('username', 'Username')])
-
-    graded_scorable_blocks = _graded_scorable_blocks_to_header(course_id)
-
-    # Just generate the static fields for now.
-    rows = [list(header_row.values()) + ['Grade'] + list(chain.from_iterable(graded_scorable_blocks.values()))]
-    error_rows = [list(header_row.values()) + ['error_msg']]
+    report = ProblemGradeReport(course_id)
+    rows = [report.header]
+    error_rows = [report.error_header]
     current_step = {'step': 'Calculating Grades'}
 
-    course = get_course_by_id(course_id)
-    for student, course_grade, err_msg in CourseGradeFactory().iter(course, enrolled_students):
-        student_fields = [getattr(student, field_name) for field_name in header_row]
-        task_progress.attempted += 1
-
-        if not course_grade:
-            # There was an error grading this student.
-            if not err_msg:
-                err_msg = u'Unknown error'
-            error_rows.append(student_fields + [err_msg])
-            task_progress.failed += 1
-            continue
+    students_per_chunk = settings.GRADES_DOWNLOAD_STUDENTS_PER_CHUNK
+    for students in _enrolled_students_in_chunks(enrolled_students, students_per_chunk):
+        for row, err_row in report.rows(students):
+            task_progress.attempted += 1
 
-        earned_possible_values = []
-        for block_location in graded_scorable_blocks:
-            try:
-                problem_score = course_grade.locations_to_scores[block_location]
-            except KeyError:
-                earned_possible_values.append([u'Not Available', u'Not Available'])
-            else:
-                if problem_score.attempted:
-                    earned_possible_values.append([problem_score.earned, problem_score.possible])
-                else:
-                    earned_possible_values.append([u'Not Attempted', problem_score.possible])
+            if err_row:
+                error_rows.append(err_row)
+                task_progress.failed += 1
+                continue
 
-        rows.append(student_fields + [course_grade.percent] + list(chain.from_iterable(earned_possible_values)))
+            rows.append(row)
 
-        task_progress.succeeded += 1
-        if task_progress.attempted % status_interval == 0:
-            task_progress.update_task_state(extra_meta=current_step)
+            task_progress.succeeded += 1
+            if task_progress.attempted % status_interval == 0:
+                task_progress.update_task_state(extra_meta=current_step)
 
     # Perform the upload if any students have been successfully graded
     if len(rows) > 1:
-        upload_csv_to_report_store(rows, 'problem_grade_report', course_id, start_date)
+        upload_csv_to_report_store(rows, report.report_name, course_id, start_date)
     # If there are any error rows, write them out as well
     if len(error_rows) > 1:
-        upload_csv_to_report_store(error_rows, 'problem_grade_report_err', course_id, start_date)
+        upload_csv_to_report_store(error_rows, report.report_name + '_err', course_id, start_date)
 
     return task_progress.update_task_state(extra_meta={'step': 'Uploading CSV'})
 
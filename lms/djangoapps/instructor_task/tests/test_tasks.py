@@ -12,6 +12,7 @@ from mock import Mock, MagicMock, patch
 from nose.plugins.attrib import attr
 
 from celery.states import SUCCESS, FAILURE
+from django.test.utils import override_settings
 from django.utils.translation import ugettext_noop
 from functools import partial
 
@@ -330,6 +331,41 @@ class TestRescoreInstructorTask(TestInstructorTasks):
             action_name='rescored'
         )
 
+    @override_settings(RESCORE_STUDENT_MODULES_PER_TASK=3)
+    def test_rescoring_in_subtasks(self):
+        """
+        Tests rescoring a problem in chunks of students, in parallel subtasks.
+        """
+        input_state = json.dumps({'done': True})
+        num_students = 10
+        self._create_students_with_state(num_students, input_state)
+        task_entry = self._create_input_entry()
+        mock_instance = Mock()
+        mock_instance.rescore_problem = Mock(
+            return_value={
+                'success': 'correct',
+                'new_raw_earned': 1,
+                'new_raw_possible': 1,
+            }
+        )
+        with patch('lms.djangoapps.instructor_task.tasks_helper.get_module_for_descriptor_internal') as mock_get_module:
+            mock_get_module.return_value = mock_instance
+            self._run_task_with_mock_celery(rescore_problem, task_entry.id, task_entry.task_id)
+
+        entry = InstructorTask.objects.get(id=task_entry.id)
+        self.assertEqual(entry.task_state, SUCCESS)
+        self.assertEqual(json.loads(entry.subtasks)['total'], 4)
+        self.assert_task_output(
+            output=self.get_task_output(task_entry.id),
+            total=num_students,
+            attempted=num_students,
+            succeeded=num_students,
+            skipped=0,
+            failed=0,
+            action_name='rescored'
+        )
+        self.assertEqual(mock_instance.rescore_problem.call_count, num_students)
+
     def test_rescoring_bad_result(self):
         """
         Tests and confirm that rescoring does not succeed if "success" key is not an expected value.
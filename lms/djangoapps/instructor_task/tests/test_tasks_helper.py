@@ -8,12 +8,15 @@ Unit tests for LMS instructor-initiated background tasks helper functions.
 
 """
 
+import json
 import os
 import shutil
 from datetime import datetime
 import urllib
+from uuid import uuid4
 
 import ddt
+from celery.states import SUCCESS, FAILURE
 from freezegun import freeze_time
 from mock import Mock, patch, MagicMock
 from nose.plugins.attrib import attr
@@ -27,6 +30,8 @@ from certificates.models import CertificateStatuses, GeneratedCertificate
 from certificates.tests.factories import GeneratedCertificateFactory, CertificateWhitelistFactory
 from course_modes.models import CourseMode
 from courseware.tests.factories import InstructorFactory
+from lms.djangoapps.grades.new.course_grade import CourseGradeFactory
+from lms.djangoapps.instructor_task.tests.factories import InstructorTaskFactory
 from lms.djangoapps.instructor_task.tests.test_base import (
     InstructorTaskCourseTestCase,
     TestReportMixin,
@@ -48,10 +53,12 @@ from student.models import CourseEnrollment, CourseEnrollmentAllowed, ManualEnro
 from lms.djangoapps.verify_student.tests.factories import SoftwareSecurePhotoVerificationFactory
 from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory
 from xmodule.partitions.partitions import Group, UserPartition
-from lms.djangoapps.instructor_task.models import ReportStore
+from lms.djangoapps.instructor_task.models import InstructorTask, ReportStore
+from lms.djangoapps.instructor_task.tasks import calculate_grade_report_subtask
 from survey.models import SurveyForm, SurveyAnswer
 from lms.djangoapps.instructor_task.tasks_helper import (
     cohort_students_and_upload,
+    perform_delegate_grade_report_batches,
     upload_problem_responses_csv,
     upload_grades_csv,
     upload_problem_grade_report,
@@ -130,6 +137,30 @@ class TestInstructorGradeReport(InstructorGradeReportTestCase):
         report_store = ReportStore.from_config(config_name='GRADES_DOWNLOAD')
         self.assertTrue(any('grade_report_err' in item[0] for item in report_store.links_for(self.course.id)))
 
+    @override_settings(GRADES_DOWNLOAD_STUDENTS_PER_CHUNK=2)
+    @patch('lms.djangoapps.instructor_task.tasks_helper._get_current_task')
+    def test_grading_in_chunks(self, _mock_current_task):
+        """
+        Test that students are graded in chunks of the configured size
+        and that every student appears in the uploaded report.
+        """
+        students = [self.create_student('student{0}'.format(i)) for i in range(5)]
+        with patch(
+            'lms.djangoapps.grades.new.course_grade.CourseGradeFactory.iter',
+            side_effect=CourseGradeFactory().iter,
+        ) as mock_grades_iter:
+            result = upload_grades_csv(None, None, self.course.id, None, 'graded')
+        self.assertDictContainsSubset({'attempted': 5, 'succeeded': 5, 'failed': 0}, result)
+        self.assertEqual(
+            [len(call[0][1]) for call in mock_grades_iter.call_args_list],
+            [2, 2, 1],
+        )
+        self.verify_rows_in_csv(
+            [{'Username': student.username} for student in students],
+            verify_order=False,
+            ignore_other_columns=True,
+        )
+
     def test_cohort_data_in_grading(self):
         """
         Test that cohort data is included in grades csv if cohort configuration is enabled for course.
@@ -349,6 +380,115 @@ class TestTeamGradeReport(InstructorGradeReportTestCase):
         self._verify_cell_data_for_user(self.student2.username, self.course.id, 'Team Name', team2.name)
 
 
+class TestGradeReportFanOut(InstructorGradeReportTestCase):
+    """
+    Tests that grade reports can be generated in parallel subtasks.
+    """
+    def setUp(self):
+        super(TestGradeReportFanOut, self).setUp()
+        self.course = CourseFactory.create()
+        self.students = [self.create_student('student{0}'.format(i)) for i in range(5)]
+        self.entry = InstructorTaskFactory.create(
+            course_id=self.course.id,
+            task_id=str(uuid4()),
+            task_type='grade_course',
+        )
+
+    def _delegate(self, report_name, upload_fcn=None):
+        """
+        Generates the report with the given name by fanning out to subtasks.
+        """
+        perform_delegate_grade_report_batches(
+            report_name,
+            calculate_grade_report_subtask,
+            upload_fcn or Mock(),
+            self.entry.id,
+            self.course.id,
+            {},
+            'graded',
+        )
+        return InstructorTask.objects.get(pk=self.entry.id)
+
+    @override_settings(GRADES_DOWNLOAD_STUDENTS_PER_TASK=2)
+    def test_grade_report(self):
+        entry = self._delegate('grade_report')
+        self.assertEqual(entry.task_state, SUCCESS)
+        self.assertDictContainsSubset(
+            {'attempted': 5, 'succeeded': 5, 'failed': 0, 'total': 5},
+            json.loads(entry.task_output),
+        )
+        self.assertEqual(json.loads(entry.subtasks)['total'], 3)
+
+        # Only the merged report remains, with a row for each student in order.
+        report_store = ReportStore.from_config(config_name='GRADES_DOWNLOAD')
+        self.assertEqual(len(report_store.links_for(self.course.id)), 1)
+        self.verify_rows_in_csv(
+            [{'Username': student.username} for student in self.students],
+            ignore_other_columns=True,
+        )
+
+    @override_settings(GRADES_DOWNLOAD_STUDENTS_PER_TASK=2)
+    @patch('lms.djangoapps.grades.new.course_grade.CourseGradeFactory.iter')
+    def test_problem_grade_report_errors(self, mock_grades_iter):
+        mock_grades_iter.side_effect = lambda course, students: [
+            (student, None, 'Cannot grade student') for student in students
+        ]
+        entry = self._delegate('problem_grade_report')
+        self.assertDictContainsSubset(
+            {'attempted': 5, 'succeeded': 0, 'failed': 5},
+            json.loads(entry.task_output),
+        )
+        report_store = ReportStore.from_config(config_name='GRADES_DOWNLOAD')
+        filenames = [filename for filename, __ in report_store.links_for(self.course.id)]
+        err_file_index = [index for index, filename in enumerate(filenames) if 'problem_grade_report_err' in filename]
+        self.assertEqual(len(err_file_index), 1)
+        self.verify_rows_in_csv(
+            [
+                {'Student ID': unicode(student.id), 'Email': student.email, 'Username': student.username,
+                 'error_msg': 'Cannot grade student'}
+                for student in self.students
+            ],
+            file_index=err_file_index[0],
+        )
+
+    def _assert_failed_without_report(self, entry):
+        """
+        Asserts that the given task failed, leaving neither a report nor partial reports.
+        """
+        self.assertEqual(entry.task_state, FAILURE)
+        self.assertIn('message', json.loads(entry.task_output))
+        report_store = ReportStore.from_config(config_name='GRADES_DOWNLOAD')
+        self.assertEqual(report_store.links_for(self.course.id), [])
+        self.assertEqual(report_store.filenames_in(self.course.id, os.path.join('partial', unicode(entry.id))), [])
+
+    @override_settings(GRADES_DOWNLOAD_STUDENTS_PER_TASK=2)
+    @patch('lms.djangoapps.grades.new.course_grade.CourseGradeFactory.iter')
+    def test_subtask_failure(self, mock_grades_iter):
+        def grades_iter(course, students):
+            """Fails to grade the first range of students."""
+            if self.students[0] in students:
+                raise Exception('Subtask failure')
+            return [(student, None, 'Cannot grade student') for student in students]
+
+        mock_grades_iter.side_effect = grades_iter
+        self._assert_failed_without_report(self._delegate('grade_report'))
+
+    @override_settings(GRADES_DOWNLOAD_STUDENTS_PER_TASK=2)
+    @patch('lms.djangoapps.instructor_task.tasks_helper.upload_csv_parts_to_report_store')
+    def test_merge_failure(self, mock_upload_csv_parts):
+        mock_upload_csv_parts.side_effect = IOError('Merge failure')
+        entry = self._delegate('grade_report')
+        self._assert_failed_without_report(entry)
+        self.assertEqual(json.loads(entry.task_output)['message'], 'Merge failure')
+
+    @override_settings(GRADES_DOWNLOAD_STUDENTS_PER_TASK=10)
+    def test_single_task(self):
+        upload_fcn = Mock()
+        entry = self._delegate('grade_report', upload_fcn)
+        upload_fcn.assert_called_once_with(self.entry.id, self.course.id, {}, 'graded')
+        self.assertEqual(entry.subtasks, '')
+
+
 class TestProblemResponsesReport(TestReportMixin, InstructorTaskCourseTestCase):
     """
     Tests that generation of CSV files listing student answers to a
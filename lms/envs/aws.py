@@ -334,6 +334,11 @@ VIRTUAL_UNIVERSITIES = ENV_TOKENS.get('VIRTUAL_UNIVERSITIES', [])
 META_UNIVERSITIES = ENV_TOKENS.get('META_UNIVERSITIES', {})
 COMMENTS_SERVICE_URL = ENV_TOKENS.get("COMMENTS_SERVICE_URL", '')
 COMMENTS_SERVICE_KEY = ENV_TOKENS.get("COMMENTS_SERVICE_KEY", '')
+COMMENTS_SERVICE_POOL_SIZE = ENV_TOKENS.get("COMMENTS_SERVICE_POOL_SIZE", COMMENTS_SERVICE_POOL_SIZE)
+COMMENTS_SERVICE_MAX_RETRIES = ENV_TOKENS.get("COMMENTS_SERVICE_MAX_RETRIES", COMMENTS_SERVICE_MAX_RETRIES)
+COMMENTS_SERVICE_CONCURRENT_REQUESTS = ENV_TOKENS.get(
+    "COMMENTS_SERVICE_CONCURRENT_REQUESTS", COMMENTS_SERVICE_CONCURRENT_REQUESTS
+)
 CERT_QUEUE = ENV_TOKENS.get("CERT_QUEUE", 'test-pull')
 ZENDESK_URL = ENV_TOKENS.get('ZENDESK_URL', ZENDESK_URL)
 FEEDBACK_SUBMISSION_EMAIL = ENV_TOKENS.get("FEEDBACK_SUBMISSION_EMAIL")
@@ -552,6 +557,22 @@ XQUEUE_INTERFACE = AUTH_TOKENS['XQUEUE_INTERFACE']
 # Get the MODULESTORE from auth.json, but if it doesn't exist,
 # use the one from common.py
 MODULESTORE = convert_module_store_setting_if_needed(AUTH_TOKENS.get('MODULESTORE', MODULESTORE))
+COURSE_STRUCTURE_LOCAL_CACHE_MAX_SIZE = ENV_TOKENS.get(
+    'COURSE_STRUCTURE_LOCAL_CACHE_MAX_SIZE', COURSE_STRUCTURE_LOCAL_CACHE_MAX_SIZE
+)
+CONTENTSERVER_LOCAL_CACHE_MAX_SIZE = ENV_TOKENS.get(
+    'CONTENTSERVER_LOCAL_CACHE_MAX_SIZE', CONTENTSERVER_LOCAL_CACHE_MAX_SIZE
+)
+CONTENTSERVER_LOCAL_CACHE_TIMEOUT = ENV_TOKENS.get(
+    'CONTENTSERVER_LOCAL_CACHE_TIMEOUT', CONTENTSERVER_LOCAL_CACHE_TIMEOUT
+)
+CONTENTSERVER_STREAM_CHUNK_SIZE = ENV_TOKENS.get('CONTENTSERVER_STREAM_CHUNK_SIZE', CONTENTSERVER_STREAM_CHUNK_SIZE)
+COURSE_OVERVIEW_LOCAL_CACHE_MAX_ITEMS = ENV_TOKENS.get(
+    'COURSE_OVERVIEW_LOCAL_CACHE_MAX_ITEMS', COURSE_OVERVIEW_LOCAL_CACHE_MAX_ITEMS
+)
+COURSE_OVERVIEW_LOCAL_CACHE_TIMEOUT = ENV_TOKENS.get(
+    'COURSE_OVERVIEW_LOCAL_CACHE_TIMEOUT', COURSE_OVERVIEW_LOCAL_CACHE_TIMEOUT
+)
 CONTENTSTORE = AUTH_TOKENS.get('CONTENTSTORE', CONTENTSTORE)
 DOC_STORE_CONFIG = AUTH_TOKENS.get('DOC_STORE_CONFIG', DOC_STORE_CONFIG)
 MONGODB_LOG = AUTH_TOKENS.get('MONGODB_LOG', {})
@@ -629,6 +650,15 @@ VERIFY_STUDENT = AUTH_TOKENS.get("VERIFY_STUDENT", VERIFY_STUDENT)
 GRADES_DOWNLOAD_ROUTING_KEY = ENV_TOKENS.get('GRADES_DOWNLOAD_ROUTING_KEY', HIGH_MEM_QUEUE)
 
 GRADES_DOWNLOAD = ENV_TOKENS.get("GRADES_DOWNLOAD", GRADES_DOWNLOAD)
+GRADES_DOWNLOAD_STUDENTS_PER_CHUNK = ENV_TOKENS.get(
+    "GRADES_DOWNLOAD_STUDENTS_PER_CHUNK", GRADES_DOWNLOAD_STUDENTS_PER_CHUNK
+)
+GRADES_DOWNLOAD_STUDENTS_PER_TASK = ENV_TOKENS.get(
+    "GRADES_DOWNLOAD_STUDENTS_PER_TASK", GRADES_DOWNLOAD_STUDENTS_PER_TASK
+)
+RESCORE_STUDENT_MODULES_PER_TASK = ENV_TOKENS.get(
+    "RESCORE_STUDENT_MODULES_PER_TASK", RESCORE_STUDENT_MODULES_PER_TASK
+)
 
 # financial reports
 FINANCIAL_REPORTS = ENV_TOKENS.get("FINANCIAL_REPORTS", FINANCIAL_REPORTS)
@@ -61,6 +61,15 @@ DISCUSSION_SETTINGS = {
     'MAX_COMMENT_DEPTH': 2,
 }
 
+# Number of keep-alive connections to the comments service that each process
+# keeps open, and the number of times that failed requests to it are retried.
+COMMENTS_SERVICE_POOL_SIZE = 10
+COMMENTS_SERVICE_MAX_RETRIES = 2
+
+# Maximum number of independent requests to the comments service that a view
+# makes concurrently.  Set to 1 to make them one after the other.
+COMMENTS_SERVICE_CONCURRENT_REQUESTS = 4
+
 LMS_ROOT_URL = "http://localhost:8000"
 
 # Features
@@ -772,6 +781,39 @@ MODULESTORE = {
     }
 }
 
+# Maximum total size, in bytes, of the serialized split modulestore course
+# structures kept in each process's memory in front of the
+# 'course_structure_cache'.  Set to 0 to disable this in-process cache.
+COURSE_STRUCTURE_LOCAL_CACHE_MAX_SIZE = 32 * 1024 * 1024
+
+# Name of the codec with which serialized data is compressed in caches: either
+# 'pickle+zlib' or, if the lz4 package is installed, the faster 'pickle+lz4'.
+# All the processes sharing the caches should use the same codec, since values
+# written by a codec that is unavailable in a process are ignored there.
+CACHE_CODEC = 'pickle+zlib'
+
+# Maximum total size, in bytes, of the course assets kept in each process's
+# memory in front of the 'course_assets' cache, and the number of seconds for
+# which each asset is kept there.  Other processes can't invalidate this cache
+# when an asset is updated, so the timeout bounds how long an outdated asset may
+# be served, including an asset that was just locked, which is then served without
+# checking access to it.  Disabled by default, with a size of 0.
+CONTENTSERVER_LOCAL_CACHE_MAX_SIZE = 0
+CONTENTSERVER_LOCAL_CACHE_TIMEOUT = 60
+
+# Maximum number of course overviews kept in each process's memory in front of
+# the database, and the number of seconds for which each is kept there.  Only
+# the process that handles a course's publish signal invalidates its cached
+# overview, so the timeout bounds how long other processes may return an
+# outdated one.  Set the number to 0 to disable this in-process cache.
+COURSE_OVERVIEW_LOCAL_CACHE_MAX_ITEMS = 0
+COURSE_OVERVIEW_LOCAL_CACHE_TIMEOUT = 60
+
+# Size, in bytes, of the chunks in which assets that are read from the
+# contentstore are streamed to clients.  It matches the default GridFS chunk
+# size, so that each chunk sent is read from a single GridFS chunk.
+CONTENTSERVER_STREAM_CHUNK_SIZE = 255 * 1024
+
 #################### Python sandbox ############################################
 
 CODE_JAIL = {
@@ -1828,6 +1870,39 @@ BLOCK_STRUCTURES_SETTINGS = dict(
 
     # Maximum number of retries per task.
     BLOCK_STRUCTURES_TASK_MAX_RETRIES=5,
+
+    # Maximum total size, in bytes, of the serialized block structures
+    # kept in each process's local cache in front of the shared cache.
+    # Set to 0 to disable the local cache.
+    BLOCK_STRUCTURES_LOCAL_CACHE_MAX_SIZE=64 * 1024 * 1024,
+
+    # Whether to persist the collected block structures in the database,
+    # behind the cache, so that they survive the loss of cached data
+    # without being recollected from the modulestore.
+    BLOCK_STRUCTURES_PERSISTENT_STORE=False,
+
+    # Number of seconds after which the lock taken by a process while
+    # collecting a block structure expires (e.g. 5 * 60).  While the lock
+    # is held, the other processes serve the previously collected block
+    # structure, if any, or wait for the collection to finish.  Taking
+    # the lock costs an additional read of the course's root block, so
+    # it is disabled by default, letting every process collect concurrently.
+    BLOCK_STRUCTURES_COLLECT_LOCK_TIMEOUT=None,
+
+    # Maximum number of seconds a process waits for another process to
+    # collect a block structure, before collecting it as well.
+    BLOCK_STRUCTURES_COLLECT_WAIT_TIMEOUT=10,
+
+    # Maximum number of threads collecting the data of the transformers
+    # that don't depend on each other concurrently, when collecting a
+    # block structure.  Set to 1 to collect the transformers one at a time.
+    BLOCK_STRUCTURES_COLLECT_MAX_WORKERS=1,
+
+    # Whether to reuse the data collected for the previous version of a
+    # course's blocks, for the blocks that didn't change since, and whose
+    # ancestors didn't either, when recollecting its block structure.
+    # Only courses in the split modulestore can be collected incrementally.
+    BLOCK_STRUCTURES_INCREMENTAL_COLLECT=False,
 )
 
 ################################ Bulk Email ###################################
@@ -2431,6 +2506,22 @@ GRADES_DOWNLOAD = {
     'ROOT_PATH': '/tmp/edx-s3/grades',
 }
 
+# Number of enrolled students to load and grade at a time when generating
+# grade reports.
+GRADES_DOWNLOAD_STUDENTS_PER_CHUNK = 1000
+
+# Number of enrolled students graded by each subtask when grade reports are
+# generated in parallel across celery subtasks, whose partial reports are then
+# merged.  Courses with no more enrolled students than this are graded in a
+# single task.  Set to None to always grade in a single task.
+GRADES_DOWNLOAD_STUDENTS_PER_TASK = None
+
+# Number of student modules rescored by each subtask when a problem is rescored
+# in parallel across celery subtasks.  Problems with no more student modules to
+# rescore than this are rescored in a single task.  Set to None to always rescore
+# in a single task.
+RESCORE_STUDENT_MODULES_PER_TASK = None
+
 FINANCIAL_REPORTS = {
     'STORAGE_TYPE': 'localfs',
     'BUCKET': 'edx-financial-reports',
@@ -230,6 +230,9 @@ CACHES = {
     },
 }
 
+# Requests to the comments service are mocked in order, so make them one at a time.
+COMMENTS_SERVICE_CONCURRENT_REQUESTS = 1
+
 # Dummy secret key for dev
 SECRET_KEY = '85920908f28904ed733fe576320db18cabd7b6cd'
 
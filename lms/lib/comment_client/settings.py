@@ -6,3 +6,12 @@ else:
     SERVICE_HOST = 'http://localhost:4567'
 
 PREFIX = SERVICE_HOST + '/api/v1'
+
+# Number of keep-alive connections to the comments service that each process
+# keeps open, and the number of times that failed requests to it are retried.
+POOL_SIZE = getattr(settings, 'COMMENTS_SERVICE_POOL_SIZE', 10)
+MAX_RETRIES = getattr(settings, 'COMMENTS_SERVICE_MAX_RETRIES', 2)
+
+# Maximum number of independent requests to the comments service that are
+# performed concurrently by perform_concurrently.
+CONCURRENT_REQUESTS = getattr(settings, 'COMMENTS_SERVICE_CONCURRENT_REQUESTS', 4)
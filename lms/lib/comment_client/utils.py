@@ -2,14 +2,31 @@
 from contextlib import contextmanager
 import dogstats_wrapper as dog_stats_api
 import logging
+from multiprocessing.pool import ThreadPool
+import os
 import requests
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry
+import threading
 from django.conf import settings
 from time import time
 from uuid import uuid4
+from django.utils import translation
 from django.utils.translation import get_language
 
+from lms.lib.comment_client import settings as cc_settings
+
 log = logging.getLogger(__name__)
 
+# The requests session and thread pool of each process, by (pid, name).  They
+# are created lazily, and again in any process forked after they were created.
+_process_objects = {}
+_process_objects_lock = threading.Lock()
+
+# Forums configuration shared by the requests that perform_concurrently
+# performs in the threads of the pool.
+_thread_local = threading.local()
+
 
 def strip_none(dic):
     return dict([(k, v) for k, v in dic.iteritems() if v is not None])
@@ -51,11 +68,102 @@ def request_timer(request_id, method, url, tags=None):
     )
 
 
+def _get_process_object(name, create):
+    """
+    Returns the object of this process with the given name, calling `create`
+    to create it if needed.
+    """
+    key = (os.getpid(), name)
+    with _process_objects_lock:
+        if key not in _process_objects:
+            _process_objects[key] = create()
+        return _process_objects[key]
+
+
+def _create_session():
+    """
+    Returns a requests session that keeps up to POOL_SIZE connections to the
+    comments service alive, and retries requests that fail to connect, and
+    idempotent requests that fail to be read, up to MAX_RETRIES times.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_maxsize=cc_settings.POOL_SIZE,
+        max_retries=Retry(total=cc_settings.MAX_RETRIES, backoff_factor=0.1),
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def get_session():
+    """
+    Returns the requests session of this process, through which all requests
+    to the comments service are made so that their connections are reused.
+    """
+    return _get_process_object('session', _create_session)
+
+
+def session_request(method, url, **kwargs):
+    """
+    Performs an HTTP request with the requests session of this process.
+    Takes the same arguments as requests.request.
+    """
+    return get_session().request(method, url, **kwargs)
+
+
+def _get_forums_config():
+    """
+    Returns the current forums configuration, or the one shared with this
+    thread by perform_concurrently.
+    """
+    config = getattr(_thread_local, 'forums_config', None)
+    if config is None:
+        # To avoid dependency conflict
+        from django_comment_common.models import ForumsConfig
+        config = ForumsConfig.current()
+    return config
+
+
+def perform_concurrently(*calls):
+    """
+    Calls the given functions, which each make independent requests to the
+    comments service, concurrently in a pool of up to CONCURRENT_REQUESTS
+    threads, and returns the list of their results in the same order.
+
+    The forums configuration and the language of the calling thread are
+    shared with the calls.  The calls should do little else than make
+    requests to the comments service: in particular, they should not use
+    the database, whose connections are not shared with the pool's threads.
+    If a call raises an exception, it is raised once all calls complete.
+    """
+    if cc_settings.CONCURRENT_REQUESTS <= 1 or len(calls) <= 1:
+        return [call() for call in calls]
+
+    config = _get_forums_config()
+    language = get_language()
+
+    def _call(call):
+        """
+        Performs the given call with the configuration of the calling thread.
+        """
+        _thread_local.forums_config = config
+        try:
+            with translation.override(language):
+                return call()
+        finally:
+            _thread_local.forums_config = None
+
+    thread_pool = _get_process_object('thread_pool', lambda: ThreadPool(cc_settings.CONCURRENT_REQUESTS))
+    async_results = [thread_pool.apply_async(_call, (call,)) for call in calls]
+    for async_result in async_results:
+        async_result.wait()
+    return [async_result.get() for async_result in async_results]
+
+
 def perform_request(method, url, data_or_params=None, raw=False,
                     metric_action=None, metric_tags=None, paged_results=False):
-    # To avoid dependency conflict
-    from django_comment_common.models import ForumsConfig
-    config = ForumsConfig.current()
+    config = _get_forums_config()
 
     if not config.enabled:
         raise CommentClientMaintenanceError('service disabled')
@@ -83,7 +191,7 @@ def perform_request(method, url, data_or_params=None, raw=False,
         data = None
         params = merge_dict(data_or_params, request_id_dict)
     with request_timer(request_id, method, url, metric_tags):
-        response = requests.request(
+        response = session_request(
             method,
             url,
             data=data,
@@ -1,10 +1,14 @@
 """
 Higher order functions built on the BlockStructureManager to interact with a django cache.
 """
+from django.conf import settings
 from django.core.cache import cache
 from openedx.core.lib.block_structure.manager import BlockStructureManager
+from openedx.core.lib.cache_utils import LRUCache
 from xmodule.modulestore.django import modulestore
 
+from .models import BlockStructureStore
+
 
 def get_course_in_cache(course_key):
     """
@@ -48,7 +52,17 @@ def get_block_structure_manager(course_key):
     """
     store = modulestore()
     course_usage_key = store.make_course_usage_key(course_key)
-    return BlockStructureManager(course_usage_key, store, get_cache())
+    return BlockStructureManager(
+        course_usage_key,
+        store,
+        get_cache(),
+        get_local_cache(),
+        get_persistent_store(),
+        collect_lock_timeout=settings.BLOCK_STRUCTURES_SETTINGS.get('BLOCK_STRUCTURES_COLLECT_LOCK_TIMEOUT'),
+        collect_wait_timeout=settings.BLOCK_STRUCTURES_SETTINGS.get('BLOCK_STRUCTURES_COLLECT_WAIT_TIMEOUT', 0),
+        collect_max_workers=settings.BLOCK_STRUCTURES_SETTINGS.get('BLOCK_STRUCTURES_COLLECT_MAX_WORKERS', 1),
+        incremental_collect=settings.BLOCK_STRUCTURES_SETTINGS.get('BLOCK_STRUCTURES_INCREMENTAL_COLLECT', False),
+    )
 
 
 def get_cache():
@@ -56,3 +70,32 @@ def get_cache():
     Returns the storage for caching Block Structures.
     """
     return cache
+
+
+_local_cache = None  # pylint: disable=invalid-name
+
+
+def get_local_cache():
+    """
+    Returns the per-process storage for caching Block Structures in
+    front of the storage returned by get_cache, or None if disabled
+    via the BLOCK_STRUCTURES_LOCAL_CACHE_MAX_SIZE setting.
+    """
+    global _local_cache  # pylint: disable=global-statement, invalid-name
+    max_size = settings.BLOCK_STRUCTURES_SETTINGS.get('BLOCK_STRUCTURES_LOCAL_CACHE_MAX_SIZE')
+    if not max_size:
+        return None
+    if _local_cache is None or _local_cache.max_size != max_size:
+        _local_cache = LRUCache(max_size=max_size)
+    return _local_cache
+
+
+def get_persistent_store():
+    """
+    Returns the persistent storage for Block Structures behind the
+    storage returned by get_cache, or None if disabled via the
+    BLOCK_STRUCTURES_PERSISTENT_STORE setting.
+    """
+    if not settings.BLOCK_STRUCTURES_SETTINGS.get('BLOCK_STRUCTURES_PERSISTENT_STORE'):
+        return None
+    return BlockStructureStore()
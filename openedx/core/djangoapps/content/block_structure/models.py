@@ -0,0 +1,68 @@
+"""
+Models used by the block structure framework.
+"""
+from django.db import models
+from model_utils.models import TimeStampedModel
+
+from openedx.core.djangoapps.xmodule_django.models import UsageKeyField
+
+
+class BlockStructureModel(TimeStampedModel):
+    """
+    Persisted collected data of a block structure, for the given root
+    usage key, used behind the cache when the BLOCK_STRUCTURES_PERSISTENT_STORE
+    setting is enabled.
+    """
+    class Meta(object):
+        app_label = 'block_structure'
+
+    data_usage_key = UsageKeyField(
+        u'Identifier of the data being collected.',
+        blank=False,
+        max_length=255,
+        unique=True,
+    )
+    data_version = models.CharField(
+        u'Version of the data at the time of collection.',
+        blank=False,
+        max_length=255,
+    )
+    data = models.BinaryField(
+        u'Compressed collected data of the block structure.',
+    )
+
+    def __unicode__(self):
+        return u'BlockStructureModel: {}, version: {}'.format(self.data_usage_key, self.data_version)
+
+
+class BlockStructureStore(object):
+    """
+    Persistent store for the BlockStructureCache, backed by the
+    BlockStructureModel.
+    """
+    def get(self, root_block_usage_key):
+        """
+        Returns the (version, data) tuple stored for the given
+        root_block_usage_key, or None if not found.
+        """
+        try:
+            stored = BlockStructureModel.objects.get(data_usage_key=root_block_usage_key)
+        except BlockStructureModel.DoesNotExist:
+            return None
+        return stored.data_version, bytes(stored.data)
+
+    def set(self, root_block_usage_key, version, data):
+        """
+        Stores the given version and data for the given
+        root_block_usage_key, replacing any previously stored data.
+        """
+        BlockStructureModel.objects.update_or_create(
+            data_usage_key=root_block_usage_key,
+            defaults={'data_version': version, 'data': data},
+        )
+
+    def delete(self, root_block_usage_key):
+        """
+        Deletes the data stored for the given root_block_usage_key.
+        """
+        BlockStructureModel.objects.filter(data_usage_key=root_block_usage_key).delete()
@@ -0,0 +1,33 @@
+"""
+Unit tests for the Block Structure models
+"""
+from django.test import TestCase
+from opaque_keys.edx.locator import CourseLocator
+
+from ..models import BlockStructureModel, BlockStructureStore
+
+
+class BlockStructureStoreTest(TestCase):
+    """
+    Tests for BlockStructureStore
+    """
+    def setUp(self):
+        super(BlockStructureStoreTest, self).setUp()
+        self.store = BlockStructureStore()
+        self.usage_key = CourseLocator(org='org', course='course', run='run').make_usage_key('course', 'course')
+
+    def test_get_none(self):
+        self.assertIsNone(self.store.get(self.usage_key))
+
+    def test_set_and_get(self):
+        self.store.set(self.usage_key, u'v1.version', b'\x00data')
+        self.assertEqual(self.store.get(self.usage_key), (u'v1.version', b'\x00data'))
+
+        self.store.set(self.usage_key, u'v1.new_version', b'\x00new data')
+        self.assertEqual(self.store.get(self.usage_key), (u'v1.new_version', b'\x00new data'))
+        self.assertEqual(BlockStructureModel.objects.count(), 1)
+
+    def test_delete(self):
+        self.store.set(self.usage_key, u'v1.version', b'\x00data')
+        self.store.delete(self.usage_key)
+        self.assertIsNone(self.store.get(self.usage_key))
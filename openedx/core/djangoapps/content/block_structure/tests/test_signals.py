@@ -1,12 +1,15 @@
 """
 Unit tests for the Course Blocks signals
 """
+from django.conf import settings
+from mock import patch
 
 from xmodule.modulestore.exceptions import ItemNotFoundError
 from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
 from xmodule.modulestore.tests.factories import CourseFactory
 
-from ..api import get_block_structure_manager
+from ..api import get_block_structure_manager, get_cache
+from ..models import BlockStructureModel
 from .helpers import is_course_in_block_structure_cache
 
 
@@ -51,3 +54,17 @@ class CourseBlocksSignalTest(ModuleStoreTestCase):
             bs_manager.get_collected()
 
         self.assertFalse(is_course_in_block_structure_cache(self.course.id, self.store))
+
+    @patch.dict(settings.BLOCK_STRUCTURES_SETTINGS, {'BLOCK_STRUCTURES_PERSISTENT_STORE': True})
+    def test_course_update_with_persistent_store(self):
+        bs_manager = get_block_structure_manager(self.course.id)
+        bs_manager.get_collected()
+        self.assertTrue(BlockStructureModel.objects.filter(data_usage_key=self.course_usage_key).exists())
+
+        # The block structure is read back from the store when it's not cached
+        get_cache().clear()
+        with patch.object(bs_manager.modulestore, 'get_item', side_effect=Exception('Unexpected collect')):
+            self.assertIsNotNone(bs_manager.get_collected())
+
+        self.store.delete_course(self.course.id, self.user.id)
+        self.assertFalse(BlockStructureModel.objects.filter(data_usage_key=self.course_usage_key).exists())
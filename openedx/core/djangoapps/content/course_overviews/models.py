@@ -3,8 +3,10 @@ Declaration of CourseOverview model
 """
 import json
 import logging
+import time
 from urlparse import urlparse, urlunparse
 
+from django.conf import settings
 from django.db import models, transaction
 from django.db.models.fields import BooleanField, DateTimeField, DecimalField, TextField, FloatField, IntegerField
 from django.db.utils import IntegrityError
@@ -23,10 +25,69 @@ from xmodule.course_module import CourseDescriptor, DEFAULT_START_DATE
 from xmodule.error_module import ErrorDescriptor
 from xmodule.modulestore.django import modulestore
 from openedx.core.djangoapps.xmodule_django.models import CourseKeyField, UsageKeyField
+from openedx.core.lib.cache_utils import LRUCache
 
 log = logging.getLogger(__name__)
 
 
+_local_course_overview_cache = None  # pylint: disable=invalid-name
+
+
+def get_local_course_overview_cache():
+    """
+    Returns the process-local cache of course overviews, holding up to
+    COURSE_OVERVIEW_LOCAL_CACHE_MAX_ITEMS overviews, or None if it is disabled.
+    """
+    global _local_course_overview_cache  # pylint: disable=global-statement, invalid-name
+    max_items = getattr(settings, 'COURSE_OVERVIEW_LOCAL_CACHE_MAX_ITEMS', 0)
+    if not max_items:
+        return None
+    if _local_course_overview_cache is None or _local_course_overview_cache.max_items != max_items:
+        _local_course_overview_cache = LRUCache(max_items=max_items)
+    return _local_course_overview_cache
+
+
+def set_locally_cached_course_overview(course_overview):
+    """
+    Stores the given course overview in the process-local cache, for
+    COURSE_OVERVIEW_LOCAL_CACHE_TIMEOUT seconds.
+
+    Only the process that handles a course's publish signal can invalidate
+    this cache, so the timeout bounds how long other processes may keep
+    returning an outdated overview.
+    """
+    local_cache = get_local_course_overview_cache()
+    if local_cache is not None:
+        expiration = time.time() + getattr(settings, 'COURSE_OVERVIEW_LOCAL_CACHE_TIMEOUT', 60)
+        local_cache.set(unicode(course_overview.id), (expiration, course_overview))
+
+
+def get_locally_cached_course_overview(course_id):
+    """
+    Retrieves the overview of the given course if cached in the
+    process-local cache, and not yet expired.
+    """
+    local_cache = get_local_course_overview_cache()
+    if local_cache is None:
+        return None
+
+    key = unicode(course_id)
+    expiration, course_overview = local_cache.get(key, (None, None))
+    if course_overview is not None and expiration < time.time():
+        local_cache.delete(key)
+        return None
+    return course_overview
+
+
+def del_locally_cached_course_overview(course_id):
+    """
+    Deletes the overview of the given course from the process-local cache.
+    """
+    local_cache = get_local_course_overview_cache()
+    if local_cache is not None:
+        local_cache.delete(unicode(course_id))
+
+
 class CourseOverview(TimeStampedModel):
     """
     Model for storing and caching basic information about a course.
@@ -240,10 +301,10 @@ class CourseOverview(TimeStampedModel):
         """
         Load a CourseOverview object for a given course ID.
 
-        First, we try to load the CourseOverview from the database. If it
-        doesn't exist, we load the entire course from the modulestore, create a
-        CourseOverview object from it, and then cache it in the database for
-        future use.
+        First, we try to load the CourseOverview from the process-local cache,
+        if it's enabled, and then from the database. If it doesn't exist, we
+        load the entire course from the modulestore, create a CourseOverview
+        object from it, and then cache it in the database for future use.
 
         Arguments:
             course_id (CourseKey): the ID of the course overview to be loaded.
@@ -257,22 +318,100 @@ class CourseOverview(TimeStampedModel):
             - IOError if some other error occurs while trying to load the
                 course from the module store.
         """
+        course_overview = get_locally_cached_course_overview(course_id)
+        if course_overview is not None:
+            return course_overview
+
         try:
-            course_overview = cls.objects.select_related('image_set').get(id=course_id)
-            if course_overview.version < cls.VERSION:
-                # Throw away old versions of CourseOverview, as they might contain stale data.
-                course_overview.delete()
-                course_overview = None
+            course_overview = cls._check_stored_overview(
+                cls.objects.select_related('image_set').get(id=course_id)
+            )
         except cls.DoesNotExist:
             course_overview = None
 
+        course_overview = course_overview or cls.load_from_module_store(course_id)
+        set_locally_cached_course_overview(course_overview)
+        return course_overview
+
+    @classmethod
+    def get_many(cls, course_ids):
+        """
+        Load the CourseOverview objects for the given course IDs.
+
+        All the CourseOverviews that are in the database are loaded with a
+        single query; only the missing or outdated ones are (re)generated from
+        the modulestore, one at a time as in get_from_id.
+
+        Arguments:
+            course_ids (iterable[CourseKey]): the IDs of the course overviews
+                to be loaded.
+
+        Returns:
+            dict[CourseKey, CourseOverview]: overviews of the requested
+                courses, keyed by course ID.  Courses that don't exist, or
+                that could not be loaded from the module store because of an
+                IOError, are left out.
+        """
+        course_overviews, course_ids_to_load = cls._get_many_stored(course_ids)
+        for course_id in course_ids_to_load:
+            try:
+                course_overviews[course_id] = cls.load_from_module_store(course_id)
+            except (cls.DoesNotExist, IOError):
+                pass
+            else:
+                set_locally_cached_course_overview(course_overviews[course_id])
+
+        return course_overviews
+
+    @classmethod
+    def _get_many_stored(cls, course_ids):
+        """
+        Returns a (course_overviews, course_ids_to_load) tuple of the up to
+        date CourseOverviews of the given courses that are cached or in the
+        database, keyed by course ID, and the IDs of the other courses, whose
+        overviews are to be loaded from the module store.
+        """
+        course_overviews = {}
+        course_ids_to_load = {}
+        for course_id in course_ids:
+            course_overview = get_locally_cached_course_overview(course_id)
+            if course_overview is not None:
+                course_overviews[course_id] = course_overview
+            else:
+                # Keyed by string, so that the stored overviews are matched to
+                # the requested course IDs whatever their CourseKey class.
+                course_ids_to_load[unicode(course_id)] = course_id
+
+        if course_ids_to_load:
+            stored_overviews = cls.objects.select_related('image_set').filter(id__in=course_ids_to_load.values())
+            for stored_overview in stored_overviews:
+                course_overview = cls._check_stored_overview(stored_overview)
+                course_id = course_ids_to_load.get(unicode(stored_overview.id))
+                if course_overview is not None and course_id is not None:
+                    course_overviews[course_id] = course_overview
+                    del course_ids_to_load[unicode(course_id)]
+                    set_locally_cached_course_overview(course_overview)
+
+        return course_overviews, course_ids_to_load.values()
+
+    @classmethod
+    def _check_stored_overview(cls, course_overview):
+        """
+        Returns the given CourseOverview that was loaded from the database, or
+        None if it is of an outdated version, in which case it's deleted.
+        """
+        if course_overview.version < cls.VERSION:
+            # Throw away old versions of CourseOverview, as they might contain stale data.
+            course_overview.delete()
+            return None
+
         # Regenerate the thumbnail images if they're missing (either because
         # they were never generated, or because they were flushed out after
         # a change to CourseOverviewImageConfig.
-        if course_overview and not hasattr(course_overview, 'image_set'):
+        if not hasattr(course_overview, 'image_set'):
             CourseOverviewImageSet.create_for_course(course_overview)
 
-        return course_overview or cls.load_from_module_store(course_id)
+        return course_overview
 
     def clean_id(self, padding_char='='):
         """
@@ -426,24 +565,25 @@ class CourseOverview(TimeStampedModel):
         """
         Returns CourseOverview objects for the given course_keys.
         """
-        course_overviews = []
-
         log.info('Generating course overview for %d courses.', len(course_keys))
         log.debug('Generating course overview(s) for the following courses: %s', course_keys)
 
-        for course_key in course_keys:
+        course_overviews, course_keys_to_load = cls._get_many_stored(course_keys)
+        for course_key in course_keys_to_load:
             try:
-                course_overviews.append(CourseOverview.get_from_id(course_key))
+                course_overviews[course_key] = cls.load_from_module_store(course_key)
             except Exception as ex:  # pylint: disable=broad-except
                 log.exception(
                     'An error occurred while generating course overview for %s: %s',
                     unicode(course_key),
                     ex.message,
                 )
+            else:
+                set_locally_cached_course_overview(course_overviews[course_key])
 
         log.info('Finished generating course overviews.')
 
-        return course_overviews
+        return [course_overviews[course_key] for course_key in course_keys if course_key in course_overviews]
 
     @classmethod
     def get_all_courses(cls, org=None, filter_=None):
@@ -9,6 +9,7 @@ import math
 import mock
 from nose.plugins.attrib import attr
 import pytz
+import time
 
 from django.conf import settings
 from django.test.utils import override_settings
@@ -34,7 +35,9 @@ from xmodule.modulestore.django import modulestore
 from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
 from xmodule.modulestore.tests.factories import CourseFactory, check_mongo_calls, check_mongo_calls_range
 
-from .models import CourseOverview, CourseOverviewImageSet, CourseOverviewImageConfig
+from .models import (
+    CourseOverview, CourseOverviewImageSet, CourseOverviewImageConfig, get_local_course_overview_cache
+)
 
 
 @attr(shard=3)
@@ -455,6 +458,58 @@ class CourseOverviewTestCase(ModuleStoreTestCase):
             set(select_course_ids),
         )
 
+    def test_get_many(self):
+        # Generate thumbnails with the overviews, so that they aren't regenerated on load.
+        CourseOverviewImageConfig.objects.create(enabled=True)
+        stored_course_ids = [CourseFactory.create(emit_signals=True).id for __ in range(3)]
+
+        # The stored overviews are all loaded with a single query.
+        with self.assertNumQueries(1):
+            course_overviews = CourseOverview.get_many(stored_course_ids)
+        self.assertEqual(set(course_overviews), set(stored_course_ids))
+        for course_id, course_overview in course_overviews.iteritems():
+            self.assertEqual(course_overview.id, course_id)
+
+        # Missing and outdated overviews are generated from the modulestore,
+        # and courses that don't exist are left out.
+        missing_course_id = CourseFactory.create().id
+        CourseOverview.objects.filter(id=stored_course_ids[0]).update(version=CourseOverview.VERSION - 1)
+        non_existent_course_id = self.store.make_course_key('Non', 'Existent', 'Course')
+        course_overviews = CourseOverview.get_many(stored_course_ids + [missing_course_id, non_existent_course_id])
+        self.assertEqual(set(course_overviews), set(stored_course_ids + [missing_course_id]))
+        self.assertEqual(course_overviews[stored_course_ids[0]].version, CourseOverview.VERSION)
+        self.assertTrue(CourseOverview.objects.filter(id=missing_course_id).exists())
+
+    def test_get_many_unexpected_error(self):
+        course_id = CourseFactory.create().id
+        with mock.patch.object(CourseOverview, 'load_from_module_store', side_effect=ValueError):
+            with self.assertRaises(ValueError):
+                CourseOverview.get_many([course_id])
+
+            # whereas the errors of the select courses are logged, and the courses left out
+            self.assertEqual(CourseOverview.get_select_courses([course_id]), [])
+
+    @override_settings(COURSE_OVERVIEW_LOCAL_CACHE_MAX_ITEMS=10)
+    def test_local_cache(self):
+        get_local_course_overview_cache().clear()
+        course = CourseFactory.create(emit_signals=True)
+        course_overview = CourseOverview.get_from_id(course.id)
+
+        # The overview is served from the process-local cache until it expires.
+        with self.assertNumQueries(0):
+            self.assertIs(CourseOverview.get_from_id(course.id), course_overview)
+            self.assertEqual(CourseOverview.get_many([course.id]), {course.id: course_overview})
+        with mock.patch('time.time', return_value=time.time() + settings.COURSE_OVERVIEW_LOCAL_CACHE_TIMEOUT + 1):
+            self.assertIsNot(CourseOverview.get_from_id(course.id), course_overview)
+
+        # Publishing the course invalidates the cached overview.
+        course_overview = CourseOverview.get_from_id(course.id)
+        course.mobile_available = True
+        self.store.update_item(course, ModuleStoreEnum.UserID.test)
+        updated_overview = CourseOverview.get_from_id(course.id)
+        self.assertIsNot(updated_overview, course_overview)
+        self.assertTrue(updated_overview.mobile_available)
+
     def test_get_all_courses(self):
         course_ids = [CourseFactory.create(emit_signals=True).id for __ in range(3)]
         self.assertEqual(
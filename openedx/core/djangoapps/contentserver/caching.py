@@ -1,9 +1,13 @@
 """
 Helper functions for caching course assets.
 """
+import time
+
+from django.conf import settings
 from django.core.cache import caches
 from django.core.cache.backends.base import InvalidCacheBackendError
 from opaque_keys import InvalidKeyError
+from openedx.core.lib.cache_utils import LRUCache
 from xmodule.contentstore.content import STATIC_CONTENT_VERSION
 
 # See if there's a "course_assets" cache configured, and if not, fallback to the default cache.
@@ -47,3 +51,56 @@ def del_cached_content(location):
         pass
 
     CONTENT_CACHE.delete_many(locations, version=STATIC_CONTENT_VERSION)
+
+    local_cache = get_local_content_cache()
+    if local_cache is not None:
+        for location in locations:
+            local_cache.delete(location)
+
+
+_local_content_cache = None  # pylint: disable=invalid-name
+
+
+def get_local_content_cache():
+    """
+    Returns the process-local cache of course assets, sized according to the
+    CONTENTSERVER_LOCAL_CACHE_MAX_SIZE setting, or None if it is disabled.
+    """
+    global _local_content_cache  # pylint: disable=global-statement, invalid-name
+    max_size = getattr(settings, 'CONTENTSERVER_LOCAL_CACHE_MAX_SIZE', 0)
+    if not max_size:
+        return None
+    if _local_content_cache is None or _local_content_cache.max_size != max_size:
+        _local_content_cache = LRUCache(max_size=max_size)
+    return _local_content_cache
+
+
+def set_locally_cached_content(content):
+    """
+    Stores the given in-memory piece of content in the process-local cache,
+    for CONTENTSERVER_LOCAL_CACHE_TIMEOUT seconds.
+
+    Other processes can't invalidate this cache when an asset changes, so the
+    timeout bounds how long a process may keep serving an outdated asset.
+    """
+    local_cache = get_local_content_cache()
+    if local_cache is not None and content.length is not None:
+        expiration = time.time() + getattr(settings, 'CONTENTSERVER_LOCAL_CACHE_TIMEOUT', 60)
+        local_cache.set(unicode(content.location).encode("utf-8"), (expiration, content), size=content.length)
+
+
+def get_locally_cached_content(location):
+    """
+    Retrieves the given piece of content by its location if cached in the
+    process-local cache, and not yet expired.
+    """
+    local_cache = get_local_content_cache()
+    if local_cache is None:
+        return None
+
+    key = unicode(location).encode("utf-8")
+    expiration, content = local_cache.get(key, (None, None))
+    if content is not None and expiration < time.time():
+        local_cache.delete(key)
+        return None
+    return content
@@ -4,19 +4,25 @@ Middleware to serve assets.
 
 import logging
 import datetime
+from uuid import uuid4
+
 import newrelic.agent
+from django.conf import settings
 from django.http import (
     HttpResponse, HttpResponseNotModified, HttpResponseForbidden,
-    HttpResponseBadRequest, HttpResponseNotFound, HttpResponsePermanentRedirect)
+    HttpResponseBadRequest, HttpResponseNotFound, HttpResponsePermanentRedirect, StreamingHttpResponse)
+from django.utils.http import parse_etags, quote_etag
 from student.models import CourseEnrollment
 
 from xmodule.assetstore.assetmgr import AssetManager
-from xmodule.contentstore.content import StaticContent, XASSET_LOCATION_TAG
+from xmodule.contentstore.content import (
+    StaticContent, StaticContentStream, STREAM_DATA_CHUNK_SIZE, XASSET_LOCATION_TAG
+)
 from xmodule.modulestore import InvalidLocationError
 from opaque_keys import InvalidKeyError
 from opaque_keys.edx.locator import AssetLocator
 from openedx.core.djangoapps.header_control import force_header_for_response
-from .caching import get_cached_content, set_cached_content
+from .caching import get_cached_content, get_locally_cached_content, set_cached_content, set_locally_cached_content
 from xmodule.modulestore.exceptions import ItemNotFoundError
 from xmodule.exceptions import NotFoundError
 
@@ -103,25 +109,32 @@ class StaticContentServer(object):
                 return HttpResponseForbidden('Unauthorized')
 
             # Figure out if the client sent us a conditional request, and let them know
-            # if this asset has changed since then.
-            last_modified_at_str = content.last_modified_at.strftime(HTTP_DATE_FORMAT)
-            if 'HTTP_IF_MODIFIED_SINCE' in request.META:
+            # if this asset has changed since then.  If-None-Match takes precedence over
+            # If-Modified-Since, as per https://tools.ietf.org/html/rfc7232#section-6
+            # A 304 Not Modified carries the caching headers that a full response would,
+            # as per https://tools.ietf.org/html/rfc7232#section-4.1
+            if 'HTTP_IF_NONE_MATCH' in request.META:
+                if self.etag_matches(request.META['HTTP_IF_NONE_MATCH'], actual_digest):
+                    response = HttpResponseNotModified()
+                    self.set_caching_headers(content, response)
+                    return response
+            elif 'HTTP_IF_MODIFIED_SINCE' in request.META:
+                last_modified_at_str = content.last_modified_at.strftime(HTTP_DATE_FORMAT)
                 if_modified_since = request.META['HTTP_IF_MODIFIED_SINCE']
                 if if_modified_since == last_modified_at_str:
-                    return HttpResponseNotModified()
+                    response = HttpResponseNotModified()
+                    self.set_caching_headers(content, response)
+                    return response
 
-            # *** File streaming within a byte range ***
+            # *** File streaming within byte ranges ***
             # If a Range is provided, parse Range attribute of the request
             # Add Content-Range in the response if Range is structurally correct
-            # Request -> Range attribute structure: "Range: bytes=first-[last]"
+            # Request -> Range attribute structure: "Range: bytes=first-[last][, first-[last]...]"
             # Response -> Content-Range attribute structure: "Content-Range: bytes first-last/totalLength"
             # http://www.w3.org/Protocols/rfc2616/rfc2616-sec14.html#sec14.35
+            chunk_size = getattr(settings, 'CONTENTSERVER_STREAM_CHUNK_SIZE', STREAM_DATA_CHUNK_SIZE)
             response = None
             if request.META.get('HTTP_RANGE'):
-                # If we have a StaticContent, get a StaticContentStream.  Can't manipulate the bytes otherwise.
-                if isinstance(content, StaticContent):
-                    content = AssetManager.find(loc, as_stream=True)
-
                 header_value = request.META['HTTP_RANGE']
                 try:
                     unit, ranges = parse_range_header(header_value, content.length)
@@ -134,43 +147,46 @@ class StaticContentServer(object):
                     if unit != 'bytes':
                         # Only accept ranges in bytes
                         log.warning(u"Unknown unit in Range header: %s for content: %s", header_value, unicode(loc))
-                    elif len(ranges) > 1:
-                        # According to Http/1.1 spec content for multiple ranges should be sent as a multipart message.
-                        # http://www.w3.org/Protocols/rfc2616/rfc2616-sec14.html#sec14.16
-                        # But we send back the full content.
-                        log.warning(
-                            u"More than 1 ranges in Range header: %s for content: %s", header_value, unicode(loc)
-                        )
                     else:
-                        first, last = ranges[0]
+                        # Unsatisfiable ranges are ignored, unless none of the ranges can be satisfied.
+                        ranges = coalesce_ranges(
+                            [(first, last) for first, last in ranges if 0 <= first <= last < content.length]
+                        )
+                        if not ranges:
+                            log.warning(
+                                u"Cannot satisfy ranges in Range header: %s for content: %s", header_value, unicode(loc)
+                            )
+                            return HttpResponse(status=416)  # Requested Range Not Satisfiable
 
-                        if 0 <= first <= last < content.length:
-                            # If the byte range is satisfiable
-                            response = HttpResponse(content.stream_data_in_range(first, last))
+                        if len(ranges) == 1:
+                            first, last = ranges[0]
+                            response = self.get_content_response(
+                                content, content.stream_data_in_range(first, last, chunk_size), content.content_type
+                            )
                             response['Content-Range'] = 'bytes {first}-{last}/{length}'.format(
                                 first=first, last=last, length=content.length
                             )
                             response['Content-Length'] = str(last - first + 1)
-                            response.status_code = 206  # Partial Content
-
-                            newrelic.agent.add_custom_parameter('contentserver.ranged', True)
                         else:
-                            log.warning(
-                                u"Cannot satisfy ranges in Range header: %s for content: %s", header_value, unicode(loc)
-                            )
-                            return HttpResponse(status=416)  # Requested Range Not Satisfiable
+                            # According to Http/1.1 spec content for multiple ranges is sent as a multipart message.
+                            # http://www.w3.org/Protocols/rfc2616/rfc2616-sec14.html#sec14.16
+                            response = self.get_multipart_byteranges_response(content, ranges, chunk_size)
+                        response.status_code = 206  # Partial Content
+
+                        newrelic.agent.add_custom_parameter('contentserver.ranged', True)
+                        newrelic.agent.add_custom_parameter('contentserver.range_count', len(ranges))
 
             # If Range header is absent or syntactically invalid return a full content response.
             if response is None:
-                response = HttpResponse(content.stream_data())
+                response = self.get_content_response(content, content.stream_data(chunk_size), content.content_type)
                 response['Content-Length'] = content.length
 
             newrelic.agent.add_custom_parameter('contentserver.content_len', content.length)
             newrelic.agent.add_custom_parameter('contentserver.content_type', content.content_type)
+            newrelic.agent.add_custom_parameter('contentserver.streamed', response.streaming)
 
             # "Accept-Ranges: bytes" tells the user that only "bytes" ranges are allowed
             response['Accept-Ranges'] = 'bytes'
-            response['Content-Type'] = content.content_type
 
             # Set any caching headers, and do any response cleanup needed.  Based on how much
             # middleware we have in place, there's no easy way to use the built-in Django
@@ -180,6 +196,57 @@ class StaticContentServer(object):
 
             return response
 
+    @staticmethod
+    def get_content_response(content, data, content_type):
+        """
+        Returns a response with the given data of the given content.  Content
+        that is read from the contentstore is streamed to the client chunk by
+        chunk, rather than being buffered in memory as a whole.
+        """
+        if isinstance(content, StaticContentStream):
+            return StreamingHttpResponse(data, content_type=content_type)
+        return HttpResponse(data, content_type=content_type)
+
+    def get_multipart_byteranges_response(self, content, ranges, chunk_size):
+        """
+        Returns a multipart/byteranges response with a part for each of the
+        given (first, last) byte ranges of the given content.
+
+        See spec for details: https://tools.ietf.org/html/rfc7233#appendix-A
+        """
+        boundary = uuid4().hex
+        part_headers = [
+            (
+                '\r\n--{boundary}\r\n'
+                'Content-Type: {content_type}\r\n'
+                'Content-Range: bytes {first}-{last}/{length}\r\n\r\n'
+            ).format(
+                boundary=boundary, content_type=content.content_type, first=first, last=last, length=content.length
+            ).encode('utf-8')
+            for first, last in ranges
+        ]
+        closing_boundary = '\r\n--{boundary}--\r\n'.format(boundary=boundary)
+
+        def stream_parts():
+            """
+            Yields the chunks of the multipart message.
+            """
+            for part_header, (first, last) in zip(part_headers, ranges):
+                yield part_header
+                for chunk in content.stream_data_in_range(first, last, chunk_size):
+                    yield chunk
+            yield closing_boundary
+
+        response = self.get_content_response(
+            content, stream_parts(), 'multipart/byteranges; boundary={}'.format(boundary)
+        )
+        response['Content-Length'] = str(
+            sum(len(part_header) for part_header in part_headers) +
+            sum(last - first + 1 for first, last in ranges) +
+            len(closing_boundary)
+        )
+        return response
+
     def set_caching_headers(self, content, response):
         """
         Sets caching headers based on whether or not the asset is locked.
@@ -204,6 +271,8 @@ class StaticContentServer(object):
             response['Cache-Control'] = "private, no-cache, no-store"
 
         response['Last-Modified'] = content.last_modified_at.strftime(HTTP_DATE_FORMAT)
+        if getattr(content, "content_digest", None):
+            response['ETag'] = quote_etag(content.content_digest)
 
         # Force the Vary header to only vary responses on Origin, so that XHR and browser requests get cached
         # separately and don't screw over one another. i.e. a browser request that doesn't send Origin, and
@@ -226,6 +295,20 @@ class StaticContentServer(object):
 
         return False
 
+    @staticmethod
+    def etag_matches(if_none_match, content_digest):
+        """
+        Determines whether the value of an If-None-Match request header matches
+        the ETag of content with the given digest.  Weak comparison is used, as
+        the spec requires for If-None-Match.  Content without a digest has no
+        ETag, so it never matches.
+        """
+        if not content_digest:
+            return False
+        if if_none_match.strip() == '*':
+            return True
+        return content_digest in parse_etags(if_none_match)
+
     @staticmethod
     def get_expiration_value(now, cache_ttl):
         """Generates an RFC1123 datetime string based on a future offset."""
@@ -263,6 +346,12 @@ class StaticContentServer(object):
         or loading it directly from the contentstore.
         """
 
+        # Small, frequently requested assets are served from this process's memory.
+        content = get_locally_cached_content(location)
+        newrelic.agent.add_custom_parameter('contentserver.local_cache_hit', content is not None)
+        if content is not None:
+            return content
+
         # See if we can load this item from cache.
         content = get_cached_content(location)
         if content is None:
@@ -279,9 +368,27 @@ class StaticContentServer(object):
                 content = content.copy_to_in_mem()
                 set_cached_content(content)
 
+        if not isinstance(content, StaticContentStream):
+            set_locally_cached_content(content)
+
         return content
 
 
+def coalesce_ranges(ranges):
+    """
+    Returns the given list of (first, last) byte ranges sorted, with the
+    ranges that overlap or are adjacent merged together, so that no byte
+    is sent more than once.
+    """
+    coalesced_ranges = []
+    for first, last in sorted(ranges):
+        if coalesced_ranges and first <= coalesced_ranges[-1][1] + 1:
+            coalesced_ranges[-1] = (coalesced_ranges[-1][0], max(last, coalesced_ranges[-1][1]))
+        else:
+            coalesced_ranges.append((first, last))
+    return coalesced_ranges
+
+
 def parse_range_header(header_value, content_length):
     """
     Returns the unit and a list of (start, end) tuples of ranges.
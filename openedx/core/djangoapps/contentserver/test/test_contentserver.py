@@ -27,7 +27,8 @@ from xmodule.modulestore.exceptions import ItemNotFoundError
 from student.models import CourseEnrollment
 from student.tests.factories import UserFactory, AdminFactory
 
-from ..middleware import parse_range_header, HTTP_DATE_FORMAT, StaticContentServer
+from ..caching import get_local_content_cache
+from ..middleware import coalesce_ranges, parse_range_header, HTTP_DATE_FORMAT, StaticContentServer
 
 log = logging.getLogger(__name__)
 
@@ -242,16 +243,61 @@ class ContentStoreToyCourseTest(SharedModuleStoreTestCase):
 
     def test_range_request_multiple_ranges(self):
         """
-        Test that multiple ranges in request outputs the full content.
+        Test that multiple ranges in request outputs a multipart/byteranges message
+        with a part for each range.
         """
+        data = self.contentstore.find(self.unlocked_asset).data
         first_byte = self.length_unlocked / 4
         last_byte = self.length_unlocked / 2
-        resp = self.client.get(self.url_unlocked, HTTP_RANGE='bytes={first}-{last}, -100'.format(
+        resp = self.client.get(self.url_unlocked, HTTP_RANGE='bytes={first}-{last}, -10'.format(
             first=first_byte, last=last_byte))
 
-        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.status_code, 206)  # HTTP_206_PARTIAL_CONTENT
         self.assertNotIn('Content-Range', resp)
-        self.assertEqual(resp['Content-Length'], str(self.length_unlocked))
+        self.assertEqual(resp['Content-Length'], str(len(resp.content)))
+
+        content_type, boundary = resp['Content-Type'].split('; boundary=')
+        self.assertEqual(content_type, 'multipart/byteranges')
+        parts = resp.content.split('\r\n--{}'.format(boundary))
+        self.assertEqual(parts[0], '')
+        self.assertEqual(parts[-1], '--\r\n')
+
+        expected_ranges = [(first_byte, last_byte), (self.length_unlocked - 10, self.length_unlocked - 1)]
+        self.assertEqual(len(parts), 2 + len(expected_ranges))
+        for part, (first, last) in zip(parts[1:-1], expected_ranges):
+            headers, part_data = part.split('\r\n\r\n', 1)
+            self.assertIn('Content-Range: bytes {}-{}/{}'.format(first, last, self.length_unlocked), headers)
+            self.assertEqual(part_data, data[first:last + 1])
+
+    def test_range_request_overlapping_ranges(self):
+        """
+        Test that overlapping and unsatisfiable ranges in request are coalesced
+        and ignored, respectively.
+        """
+        resp = self.client.get(self.url_unlocked, HTTP_RANGE='bytes=10-19, 0-14, 20-29, {}-'.format(
+            self.length_unlocked))
+
+        self.assertEqual(resp.status_code, 206)  # HTTP_206_PARTIAL_CONTENT
+        self.assertEqual(resp['Content-Range'], 'bytes 0-29/{}'.format(self.length_unlocked))
+        self.assertEqual(resp['Content-Length'], '30')
+
+    def test_streamed_asset(self):
+        """
+        Test that assets which are read from the contentstore are streamed.
+        """
+        data = self.contentstore.find(self.unlocked_asset).data
+        with patch.object(
+            StaticContentServer, 'load_asset_from_location', lambda _self, loc: AssetManager.find(loc, as_stream=True)
+        ):
+            resp = self.client.get(self.url_unlocked)
+            self.assertEqual(resp.status_code, 200)
+            self.assertTrue(resp.streaming)
+            self.assertEqual(''.join(resp.streaming_content), data)
+
+            resp = self.client.get(self.url_unlocked, HTTP_RANGE='bytes=0-9, 20-29')
+            self.assertEqual(resp.status_code, 206)  # HTTP_206_PARTIAL_CONTENT
+            self.assertTrue(resp.streaming)
+            self.assertEqual(resp['Content-Length'], str(len(''.join(resp.streaming_content))))
 
     @ddt.data(
         'bytes 0-',
@@ -294,6 +340,96 @@ class ContentStoreToyCourseTest(SharedModuleStoreTestCase):
         self.assertEqual(resp.status_code, 200)
         self.assertEquals('Origin', resp['Vary'])
 
+    def test_etag_header_sent(self):
+        """
+        Tests that assets are sent back with their content digest as their ETag.
+        """
+        content_digest = self.contentstore.find(self.unlocked_asset).content_digest
+        resp = self.client.get(self.url_unlocked)
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp['ETag'], '"{}"'.format(content_digest))
+
+    @ddt.data(
+        ('"{digest}"', 304),
+        ('W/"{digest}"', 304),
+        ('"{other}", "{digest}"', 304),
+        ('*', 304),
+        ('"{other}"', 200),
+    )
+    @ddt.unpack
+    def test_if_none_match(self, if_none_match, expected_status_code):
+        """
+        Tests that a request with an If-None-Match header matching the asset's ETag
+        is answered with a 304 Not Modified, even if If-Modified-Since doesn't match.
+        """
+        content_digest = self.contentstore.find(self.unlocked_asset).content_digest
+        resp = self.client.get(
+            self.url_unlocked,
+            HTTP_IF_NONE_MATCH=if_none_match.format(digest=content_digest, other=FAKE_MD5_HASH),
+            HTTP_IF_MODIFIED_SINCE='Thu, 01 Jan 1970 00:00:00 GMT',
+        )
+        self.assertEqual(resp.status_code, expected_status_code)
+        self.assertEqual(resp['ETag'], '"{}"'.format(content_digest))
+
+    @patch('openedx.core.djangoapps.contentserver.models.CourseAssetCacheTtlConfig.get_cache_ttl')
+    def test_not_modified_cache_headers(self, mock_get_cache_ttl):
+        """
+        Tests that a 304 Not Modified is sent back with the same caching headers as the asset.
+        """
+        mock_get_cache_ttl.return_value = 10
+        content_digest = self.contentstore.find(self.unlocked_asset).content_digest
+
+        resp = self.client.get(self.url_unlocked, HTTP_IF_NONE_MATCH='"{}"'.format(content_digest))
+        self.assertEqual(resp.status_code, 304)
+        self.assertIn('Expires', resp)
+        self.assertEquals('public, max-age=10, s-maxage=10', resp['Cache-Control'])
+        self.assertEquals('Origin', resp['Vary'])
+
+    @ddt.data('*', '"{}"'.format(FAKE_MD5_HASH))
+    def test_if_none_match_without_digest(self, if_none_match):
+        """
+        Tests that assets without a content digest don't match any If-None-Match header,
+        and are sent back without an ETag.
+        """
+        content = self.contentstore.find(self.unlocked_asset)
+        content.content_digest = None
+        with patch.object(StaticContentServer, 'load_asset_from_location', return_value=content):
+            resp = self.client.get(self.url_unlocked, HTTP_IF_NONE_MATCH=if_none_match)
+        self.assertEqual(resp.status_code, 200)
+        self.assertNotIn('ETag', resp)
+
+    @override_settings(CONTENTSERVER_LOCAL_CACHE_MAX_SIZE=1024 * 1024)
+    def test_local_cache(self):
+        """
+        Tests that assets are served from the process-local cache once they've been read.
+        """
+        get_local_content_cache().clear()
+        resp = self.client.get(self.url_unlocked)
+        self.assertEqual(resp.status_code, 200)
+        content = resp.content
+
+        with patch('openedx.core.djangoapps.contentserver.middleware.get_cached_content') as mock_get_cached_content:
+            with patch.object(AssetManager, 'find') as mock_find:
+                resp = self.client.get(self.url_unlocked, HTTP_RANGE='bytes=0-')
+                self.assertEqual(resp.status_code, 206)
+                self.assertEqual(resp.content, content)
+        self.assertFalse(mock_get_cached_content.called)
+        self.assertFalse(mock_find.called)
+
+    @override_settings(CONTENTSERVER_LOCAL_CACHE_MAX_SIZE=1024 * 1024, CONTENTSERVER_LOCAL_CACHE_TIMEOUT=-1)
+    def test_local_cache_expired(self):
+        """
+        Tests that expired assets in the process-local cache are read again.
+        """
+        get_local_content_cache().clear()
+        self.client.get(self.url_unlocked)
+        with patch(
+            'openedx.core.djangoapps.contentserver.middleware.get_cached_content', return_value=None
+        ) as mock_get_cached_content:
+            resp = self.client.get(self.url_unlocked)
+            self.assertEqual(resp.status_code, 200)
+        self.assertTrue(mock_get_cached_content.called)
+
     @patch('openedx.core.djangoapps.contentserver.models.CourseAssetCacheTtlConfig.get_cache_ttl')
     def test_cache_headers_with_ttl_unlocked(self, mock_get_cache_ttl):
         """
@@ -431,6 +567,16 @@ class ParseRangeHeaderTestCase(unittest.TestCase):
         self.assertEqual(len(ranges), excepted_ranges_length)
         self.assertEqual(ranges, expected_ranges)
 
+    @ddt.data(
+        ([(100, 199)], [(100, 199)]),
+        ([(200, 299), (100, 199)], [(100, 299)]),
+        ([(100, 199), (150, 249), (500, 599)], [(100, 249), (500, 599)]),
+        ([(500, 599), (100, 199), (100, 149)], [(100, 199), (500, 599)]),
+    )
+    @ddt.unpack
+    def test_coalesce_ranges(self, ranges, expected_ranges):
+        self.assertEqual(coalesce_ranges(ranges), expected_ranges)
+
     @ddt.data(
         ('bytes=one-20', ValueError, 'invalid literal for int()'),
         ('bytes=-one', ValueError, 'invalid literal for int()'),
@@ -401,7 +401,7 @@ class BlockStructureBlockData(BlockStructure):
     # update this value whenever the data structure changes. Dependent storage
     # layers can then use this value when serializing/deserializing block
     # structures, and invalidating any previously cached/stored data.
-    VERSION = 1
+    VERSION = 2
 
     def __init__(self, root_block_usage_key):
         super(BlockStructureBlockData, self).__init__(root_block_usage_key)
@@ -770,6 +770,17 @@ class BlockStructureModulestoreData(BlockStructureBlockData):
         # set(string)
         self._requested_xblock_fields = set()
 
+        # Block structure collected from a previous version of the
+        # blocks, whose data can be reused for the unchanged blocks.
+        # BlockStructureBlockData
+        self._previous_block_structure = None
+
+        # Set of the usage keys of the blocks that were changed since
+        # the previous block structure was collected, or whose
+        # ancestors were.
+        # set(UsageKey)
+        self._changed_block_keys = set()
+
     def request_xblock_fields(self, *field_names):
         """
         Records request for collecting data for the given xBlock fields.
@@ -786,6 +797,33 @@ class BlockStructureModulestoreData(BlockStructureBlockData):
         """
         self._requested_xblock_fields.update(set(field_names))
 
+    def get_previous_transformer_block_field(self, usage_key, transformer, key, default=None):
+        """
+        Returns the value previously collected by the given transformer
+        for the given key of the block identified by the given usage_key,
+        if neither the block nor its ancestors changed since it was
+        collected; returns default otherwise.
+
+        A Transformer can call this method to reuse data that is costly
+        to collect and only depends on the block and its ancestors.
+
+        Arguments:
+            usage_key (UsageKey) - Usage key of the block whose
+                transformer data is requested.
+
+            transformer (BlockStructureTransformer) - The transformer
+                whose dictionary data is requested.
+
+            key (string) - A dictionary key to the transformer's data
+                that is requested.
+
+            default (any type) - The value to return if the data can't
+                be reused, or is not found.
+        """
+        if self._previous_block_structure is None or usage_key in self._changed_block_keys:
+            return default
+        return self._previous_block_structure.get_transformer_block_field(usage_key, transformer, key, default)
+
     def get_xblock(self, usage_key):
         """
         Returns the instantiated xBlock for the given usage key.
@@ -824,6 +862,43 @@ class BlockStructureModulestoreData(BlockStructureBlockData):
             for field_name in self._requested_xblock_fields:
                 self._set_xblock_field(block_data, xblock, field_name)
 
+    def _set_previous_block_structure(self, previous_block_structure, changed_block_keys):
+        """
+        Sets the block structure collected from a previous version of
+        the blocks, whose transformer data can be reused for the blocks
+        that didn't change since, and whose ancestors didn't either.
+
+        Arguments:
+            previous_block_structure (BlockStructureBlockData) - The
+                previously collected block structure, with the same
+                registered transformers.
+
+            changed_block_keys (set(UsageKey)) - Usage keys of the
+                blocks that were added or updated since the previous
+                block structure was collected.  Blocks that were added,
+                or whose children changed, are also found by comparing
+                the block structures.
+        """
+        changed = set()
+        for block_key in self.topological_traversal():
+            if (  # pylint: disable=bad-continuation
+                block_key in changed_block_keys or
+                block_key not in previous_block_structure or
+                self.get_children(block_key) != previous_block_structure.get_children(block_key) or
+                any(parent_key in changed for parent_key in self.get_parents(block_key))
+            ):
+                changed.add(block_key)
+
+        self._previous_block_structure = previous_block_structure
+        self._changed_block_keys = changed
+
+        logger.info(
+            "Transformers can reuse the data of %d of the %d blocks of the previous BlockStructure %s.",
+            len(self) - len(changed),
+            len(self),
+            self.root_block_usage_key,
+        )
+
     def _set_xblock_field(self, block_data, xblock, field_name):
         """
         Updates the given block's xBlock fields data with the xBlock
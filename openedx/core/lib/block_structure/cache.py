@@ -3,8 +3,9 @@ Module for the Cache class for BlockStructure objects.
 """
 # pylint: disable=protected-access
 from logging import getLogger
+from uuid import uuid4
 
-from openedx.core.lib.cache_utils import zpickle, zunpickle
+from openedx.core.lib import cache_codecs
 
 from .block_structure import BlockStructureBlockData
 from .factory import BlockStructureFactory
@@ -16,25 +17,54 @@ logger = getLogger(__name__)  # pylint: disable=C0103
 class BlockStructureCache(object):
     """
     Cache for BlockStructure objects.
+
+    Block structures are stored in the given (shared) cache.  When a
+    local_cache is also given, the serialized data is additionally kept
+    in that per-process cache, keyed by the structure's root usage key
+    and the version stamp that was stored alongside it in the shared
+    cache.  A lookup then only needs to read the small version stamp
+    from the shared cache to know whether the local copy is current.
+
+    When a persistent store is also given, the compressed data and its
+    version stamp are written through to it, and read back from it when
+    they are missing from the shared cache (e.g. after it was restarted
+    or the data was evicted), so that the block structure doesn't need
+    to be recollected from the modulestore.
     """
-    def __init__(self, cache):
+    def __init__(self, cache, local_cache=None, store=None):
         """
         Arguments:
             cache (django.core.cache.backends.base.BaseCache) - The
                 cache into which cacheable data of the block structure
                 is to be serialized.
+
+            local_cache (openedx.core.lib.cache_utils.LRUCache) - An
+                optional, bounded per-process cache used in front of
+                the given cache.
+
+            store - An optional persistent storage used behind the given
+                cache, with the methods:
+                  get(root_block_usage_key) -> (version_stamp, data) or None
+                  set(root_block_usage_key, version_stamp, data)
+                  delete(root_block_usage_key)
         """
         self._cache = cache
+        self._local_cache = local_cache
+        self._store = store
 
     def add(self, block_structure):
         """
-        Store a compressed and pickled serialization of the given
-        block structure into the given cache.
+        Store a compressed serialization of the given block structure
+        into the given cache, encoded with the default cache codec.
 
         The key in the cache is 'root.key.<root_block_usage_key>'.
         The data stored in the cache includes the structure's
         block relations, transformer data, and block data.
 
+        A version stamp for the stored data is written under
+        'root.version.<root_block_usage_key>' after the data itself.
+        Any stale block structure kept by delete is then removed.
+
         Arguments:
             block_structure (BlockStructure) - The block structure
                 that is to be serialized to the given cache.
@@ -44,20 +74,28 @@ class BlockStructureCache(object):
             block_structure.transformer_data,
             block_structure._block_data_map,
         )
-        zp_data_to_cache = zpickle(data_to_cache)
+        codec = cache_codecs.get_default_codec()
+        serialized_data = codec.serialize(data_to_cache)
+        zp_data_to_cache = cache_codecs.compress(serialized_data, codec)
+        root_block_usage_key = block_structure.root_block_usage_key
+        version_stamp = self._get_version_stamp(block_structure)
 
-        # Set the timeout value for the cache to 1 day as a fail-safe
-        # in case the signal to invalidate the cache doesn't come through.
-        timeout_in_seconds = 60 * 60 * 24
-        self._cache.set(
-            self._encode_root_cache_key(block_structure.root_block_usage_key),
-            zp_data_to_cache,
-            timeout=timeout_in_seconds,
-        )
+        if self._store is not None:
+            self._store.set(root_block_usage_key, self._encode_store_version(version_stamp), zp_data_to_cache)
+        self._set_in_cache(root_block_usage_key, version_stamp, zp_data_to_cache)
+        if self._local_cache is not None:
+            self._local_cache.set(
+                (root_block_usage_key, version_stamp),
+                (codec, serialized_data),
+                size=len(serialized_data),
+            )
+        # The stale block structure, if any, is now outdated.
+        self._cache.delete(self._encode_stale_cache_key(root_block_usage_key))
 
         logger.info(
-            "Wrote BlockStructure %s to cache, size: %s",
-            block_structure.root_block_usage_key,
+            "Wrote BlockStructure %s to cache, version: %s, size: %s",
+            root_block_usage_key,
+            version_stamp,
             len(zp_data_to_cache),
         )
 
@@ -80,24 +118,93 @@ class BlockStructureCache(object):
 
             NoneType - If the root_block_usage_key is not found in the cache.
         """
+        codec, serialized_data = None, None
+        version_stamp = None
+        if self._local_cache is not None:
+            version_stamp = self._cache.get(self._encode_version_cache_key(root_block_usage_key))
+            if version_stamp:
+                codec, serialized_data = self._local_cache.get((root_block_usage_key, version_stamp), (None, None))
 
-        # Find root_block_usage_key in the cache.
-        zp_data_from_cache = self._cache.get(self._encode_root_cache_key(root_block_usage_key))
-        if not zp_data_from_cache:
+        if serialized_data:
             logger.info(
-                "Did not find BlockStructure %r in the cache.",
+                "Read BlockStructure %r from local cache, version: %s",
                 root_block_usage_key,
+                version_stamp,
             )
-            return None
         else:
-            logger.info(
-                "Read BlockStructure %r from cache, size: %s",
-                root_block_usage_key,
-                len(zp_data_from_cache),
-            )
+            # Find root_block_usage_key in the cache.
+            zp_data_from_cache = self._cache.get(self._encode_root_cache_key(root_block_usage_key))
+            if not zp_data_from_cache:
+                zp_data_from_cache, version_stamp = self._get_from_store(root_block_usage_key)
+            if not zp_data_from_cache:
+                logger.info(
+                    "Did not find BlockStructure %r in the cache.",
+                    root_block_usage_key,
+                )
+                return None
+            else:
+                logger.info(
+                    "Read BlockStructure %r from cache, size: %s",
+                    root_block_usage_key,
+                    len(zp_data_from_cache),
+                )
+            codec, serialized_data = cache_codecs.decompress(zp_data_from_cache)
+            if codec is None:
+                logger.info(
+                    "Ignoring BlockStructure %r in the cache, since it was stored in an unknown format.",
+                    root_block_usage_key,
+                )
+                return None
+
+            # The version stamp is written after the data, so the data
+            # read here is at least as recent as the stamp read above.
+            if version_stamp and self._local_cache is not None:
+                self._local_cache.set(
+                    (root_block_usage_key, version_stamp),
+                    (codec, serialized_data),
+                    size=len(serialized_data),
+                )
 
         # Deserialize and construct the block structure.
-        block_relations, transformer_data, block_data_map = zunpickle(zp_data_from_cache)
+        block_relations, transformer_data, block_data_map = codec.deserialize(serialized_data)
+        return BlockStructureFactory.create_new(
+            root_block_usage_key,
+            block_relations,
+            transformer_data,
+            block_data_map,
+        )
+
+    def get_stale(self, root_block_usage_key):
+        """
+        Deserializes and returns the block structure starting at
+        root_block_usage_key that was kept in the given cache when it
+        was last deleted with keep_stale, if it's found in the cache.
+
+        Arguments:
+            root_block_usage_key (UsageKey) - The usage_key for the root
+                of the block structure that is to be deserialized from
+                the given cache.
+
+        Returns:
+            BlockStructure - The stale block structure starting at
+            root_block_usage_key, if found in the cache.
+
+            NoneType - If no stale block structure is found in the cache.
+        """
+        zp_data_from_cache = self._cache.get(self._encode_stale_cache_key(root_block_usage_key))
+        if not zp_data_from_cache:
+            return None
+
+        codec, serialized_data = cache_codecs.decompress(zp_data_from_cache)
+        if codec is None:
+            return None
+
+        logger.info(
+            "Read stale BlockStructure %r from cache, size: %s",
+            root_block_usage_key,
+            len(zp_data_from_cache),
+        )
+        block_relations, transformer_data, block_data_map = codec.deserialize(serialized_data)
         return BlockStructureFactory.create_new(
             root_block_usage_key,
             block_relations,
@@ -105,22 +212,164 @@ class BlockStructureCache(object):
             block_data_map,
         )
 
-    def delete(self, root_block_usage_key):
+    def delete(self, root_block_usage_key, keep_stale=False):
         """
         Deletes the block structure for the given root_block_usage_key
         from the given cache.
 
+        Deleting the version stamp from the shared cache invalidates
+        any copies held in the local caches of other processes.
+
         Arguments:
             root_block_usage_key (UsageKey) - The usage_key for the root
                 of the block structure that is to be removed from
                 the cache.
+
+            keep_stale (bool) - Whether to keep a copy of the deleted
+                block structure in the cache, to be returned by get_stale
+                while the block structure is recollected.
         """
+        if keep_stale:
+            zp_data_from_cache = self._cache.get(self._encode_root_cache_key(root_block_usage_key))
+            if zp_data_from_cache:
+                self._cache.set(
+                    self._encode_stale_cache_key(root_block_usage_key),
+                    zp_data_from_cache,
+                    timeout=60 * 60 * 24,
+                )
+        self._cache.delete(self._encode_version_cache_key(root_block_usage_key))
         self._cache.delete(self._encode_root_cache_key(root_block_usage_key))
+        if self._store is not None:
+            self._store.delete(root_block_usage_key)
         logger.info(
             "Deleted BlockStructure %r from the cache.",
             root_block_usage_key,
         )
 
+    def acquire_collect_lock(self, root_block_usage_key, timeout, course_version=None):
+        """
+        Acquires the lock on collecting the given version of the block
+        structure for the given root_block_usage_key, shared by all the
+        processes using the given cache, unless it's already held.
+
+        Arguments:
+            root_block_usage_key (UsageKey) - The usage_key for the root
+                of the block structure that is to be collected.
+
+            timeout (int) - The number of seconds after which the lock
+                expires, in case it isn't released.
+
+            course_version - The version of the course whose block
+                structure is to be collected, if known.
+
+        Returns:
+            A token to pass to release_collect_lock if the lock was
+            acquired, None otherwise.
+        """
+        token = uuid4().hex
+        lock_cache_key = self._encode_lock_cache_key(root_block_usage_key, course_version)
+        if self._cache.add(lock_cache_key, token, timeout=timeout):
+            return token
+        return None
+
+    def is_collect_locked(self, root_block_usage_key, course_version=None):
+        """
+        Returns whether the lock on collecting the given version of the
+        block structure for the given root_block_usage_key is held.
+        """
+        return self._cache.get(self._encode_lock_cache_key(root_block_usage_key, course_version)) is not None
+
+    def release_collect_lock(self, root_block_usage_key, token, course_version=None):
+        """
+        Releases the lock on collecting the given version of the block
+        structure for the given root_block_usage_key, if it's still held
+        with the given token.
+        """
+        lock_cache_key = self._encode_lock_cache_key(root_block_usage_key, course_version)
+        if self._cache.get(lock_cache_key) == token:
+            self._cache.delete(lock_cache_key)
+
+    def _set_in_cache(self, root_block_usage_key, version_stamp, zp_data):
+        """
+        Stores the given compressed data of the block structure, and
+        then its version stamp, into the shared cache.
+        """
+        # Set the timeout value for the cache to 1 day as a fail-safe
+        # in case the signal to invalidate the cache doesn't come through.
+        timeout_in_seconds = 60 * 60 * 24
+        self._cache.set(
+            self._encode_root_cache_key(root_block_usage_key),
+            zp_data,
+            timeout=timeout_in_seconds,
+        )
+        self._cache.set(
+            self._encode_version_cache_key(root_block_usage_key),
+            version_stamp,
+            timeout=timeout_in_seconds,
+        )
+
+    def _get_from_store(self, root_block_usage_key):
+        """
+        Returns the compressed data of the block structure and its
+        version stamp from the persistent store, if found there,
+        after copying them back into the shared cache.
+
+        Returns (None, None) otherwise.
+        """
+        if self._store is None:
+            return None, None
+
+        stored = self._store.get(root_block_usage_key)
+        if stored is None:
+            return None, None
+
+        store_version, zp_data = stored
+        version_prefix = self._encode_store_version('')
+        if not store_version.startswith(version_prefix):
+            logger.info(
+                "Ignoring BlockStructure %r in the persistent store, since it was stored in an older format.",
+                root_block_usage_key,
+            )
+            return None, None
+
+        version_stamp = store_version[len(version_prefix):]
+        logger.info(
+            "Read BlockStructure %r from the persistent store, version: %s, size: %s",
+            root_block_usage_key,
+            version_stamp,
+            len(zp_data),
+        )
+        self._set_in_cache(root_block_usage_key, version_stamp, zp_data)
+        return zp_data, version_stamp
+
+    @classmethod
+    def _get_version_stamp(cls, block_structure):
+        """
+        Returns a version stamp identifying the data of the given
+        block structure.
+
+        The course version of the root xBlock is used when available
+        (as for split modulestore courses), so that processes collecting
+        the same published version agree on the stamp.  Otherwise, a
+        unique value is generated.
+        """
+        root_xblock = getattr(block_structure, '_xblock_map', {}).get(block_structure.root_block_usage_key)
+        course_version = getattr(root_xblock, 'course_version', None)
+        if course_version:
+            return unicode(course_version)
+        return uuid4().hex
+
+    @classmethod
+    def _encode_store_version(cls, version_stamp):
+        """
+        Returns the version to use for storing the block structure
+        with the given version stamp in the persistent store.
+        """
+        return "v{version}.{version_stamp}".format(
+            version=unicode(BlockStructureBlockData.VERSION),
+            version_stamp=version_stamp,
+        )
+
     @classmethod
     def _encode_root_cache_key(cls, root_block_usage_key):
         """
@@ -131,3 +380,37 @@ class BlockStructureCache(object):
             version=unicode(BlockStructureBlockData.VERSION),
             root_usage_key=unicode(root_block_usage_key),
         )
+
+    @classmethod
+    def _encode_stale_cache_key(cls, root_block_usage_key):
+        """
+        Returns the cache key to use for keeping the stale block
+        structure for the given root_block_usage_key.
+        """
+        return "v{version}.root.stale.{root_usage_key}".format(
+            version=unicode(BlockStructureBlockData.VERSION),
+            root_usage_key=unicode(root_block_usage_key),
+        )
+
+    @classmethod
+    def _encode_lock_cache_key(cls, root_block_usage_key, course_version):
+        """
+        Returns the cache key to use for the lock on collecting the
+        given version of the block structure for the given
+        root_block_usage_key.
+        """
+        return "root.lock.{root_usage_key}.{course_version}".format(
+            root_usage_key=unicode(root_block_usage_key),
+            course_version=unicode(course_version),
+        )
+
+    @classmethod
+    def _encode_version_cache_key(cls, root_block_usage_key):
+        """
+        Returns the cache key to use for storing the version stamp of
+        the block structure for the given root_block_usage_key.
+        """
+        return "v{version}.root.version.{root_usage_key}".format(
+            version=unicode(BlockStructureBlockData.VERSION),
+            root_usage_key=unicode(root_block_usage_key),
+        )
@@ -3,6 +3,9 @@ Top-level module for the Block Structure framework with a class for managing
 BlockStructures.
 """
 from contextlib import contextmanager
+import time
+
+from dogapi import dog_stats_api
 
 from .cache import BlockStructureCache
 from .factory import BlockStructureFactory
@@ -14,8 +17,13 @@ class BlockStructureManager(object):
     """
     Top-level class for managing Block Structures.
     """
+    # Number of seconds between checks of the collect lock, while
+    # waiting for another process to collect the block structure.
+    COLLECT_WAIT_INTERVAL = 0.1
 
-    def __init__(self, root_block_usage_key, modulestore, cache):
+    def __init__(self, root_block_usage_key, modulestore, cache, local_cache=None, store=None,
+                 collect_lock_timeout=None, collect_wait_timeout=0, collect_max_workers=1,
+                 incremental_collect=False):
         """
         Arguments:
             root_block_usage_key (UsageKey) - The usage_key for the root
@@ -28,10 +36,44 @@ class BlockStructureManager(object):
             cache (django.core.cache.backends.base.BaseCache) - The
                 cache to use for storing/retrieving the block structure's
                 collected data.
+
+            local_cache (openedx.core.lib.cache_utils.LRUCache) - An
+                optional per-process cache to use in front of the given
+                cache for retrieving the block structure's collected
+                data.
+
+            store - An optional persistent storage to use behind the
+                given cache, which the block structure's collected data
+                is written through to, and read from when it's missing
+                from the cache.  See BlockStructureCache.
+
+            collect_lock_timeout (int) - If given, only one process at a
+                time collects each version of the block structure, while
+                holding a lock in the cache that expires after this
+                number of seconds.
+                The other processes return the block structure that was
+                last cleared, if any, or wait for it to be collected.
+
+            collect_wait_timeout (float) - The maximum number of seconds
+                to wait for another process to collect the block
+                structure, before collecting it regardless.
+
+            collect_max_workers (int) - The maximum number of threads
+                collecting the data of independent transformers
+                concurrently.  See BlockStructureTransformers.collect.
+
+            incremental_collect (bool) - Whether to reuse the data that
+                was collected for the previous version of the blocks, for
+                the blocks that didn't change since, when the modulestore
+                can tell which blocks changed between the two versions.
         """
         self.root_block_usage_key = root_block_usage_key
         self.modulestore = modulestore
-        self.block_structure_cache = BlockStructureCache(cache)
+        self.block_structure_cache = BlockStructureCache(cache, local_cache, store)
+        self.collect_lock_timeout = collect_lock_timeout
+        self.collect_wait_timeout = collect_wait_timeout
+        self.collect_max_workers = collect_max_workers
+        self.incremental_collect = incremental_collect
 
     def get_transformed(self, transformers, starting_block_usage_key=None, collected_block_structure=None):
         """
@@ -95,13 +137,10 @@ class BlockStructureManager(object):
         )
         cache_miss = block_structure is None
         if cache_miss or BlockStructureTransformers.is_collected_outdated(block_structure):
-            with self._bulk_operations():
-                block_structure = BlockStructureFactory.create_from_modulestore(
-                    self.root_block_usage_key,
-                    self.modulestore
-                )
-                BlockStructureTransformers.collect(block_structure)
-                self.block_structure_cache.add(block_structure)
+            if self.collect_lock_timeout is None:
+                block_structure = self._collect()
+            else:
+                block_structure = self._collect_once()
         return block_structure
 
     def update_collected(self):
@@ -109,17 +148,153 @@ class BlockStructureManager(object):
         Updates the collected Block Structure for the root_block_usage_key.
 
         Details: The cache is cleared and updated by collecting transformers
-        data from the modulestore.
+        data from the modulestore, even if another process is collecting
+        the block structure, since it may be collecting an older version.
         """
         self.clear()
-        self.get_collected()
+        self._collect()
 
     def clear(self):
         """
         Removes cached data for the block structure associated with the given
         root block key.
         """
-        self.block_structure_cache.delete(self.root_block_usage_key)
+        self.block_structure_cache.delete(
+            self.root_block_usage_key,
+            keep_stale=self.collect_lock_timeout is not None or self.incremental_collect,
+        )
+
+    def _collect(self):
+        """
+        Collects the block structure from the modulestore, and adds it
+        to the cache.
+        """
+        with self._bulk_operations():
+            block_structure = BlockStructureFactory.create_from_modulestore(
+                self.root_block_usage_key,
+                self.modulestore
+            )
+            if self.incremental_collect:
+                # The course version is needed to find the changes since
+                # the next version, when it's collected.
+                block_structure.request_xblock_fields('course_version')
+                self._set_previous_block_structure(block_structure)
+            BlockStructureTransformers.collect(block_structure, self.collect_max_workers)
+            self.block_structure_cache.add(block_structure)
+        return block_structure
+
+    def _set_previous_block_structure(self, block_structure):
+        """
+        Sets the stale block structure on the given block structure, to
+        be reused for the blocks that didn't change since it was
+        collected, if it's up to date with the registered transformers
+        and the modulestore can tell which blocks changed.
+        """
+        previous_block_structure = self.block_structure_cache.get_stale(self.root_block_usage_key)
+        if (  # pylint: disable=bad-continuation
+            previous_block_structure is None or
+            BlockStructureTransformers.is_collected_outdated(previous_block_structure)
+        ):
+            return
+
+        previous_version = previous_block_structure.get_xblock_field(self.root_block_usage_key, 'course_version')
+        root_xblock = block_structure.get_xblock(self.root_block_usage_key)
+        version = getattr(root_xblock, 'course_version', None)
+        if not previous_version or not version:
+            return
+
+        if previous_version == version:
+            changed_block_keys = set()
+        else:
+            get_structure_changes = getattr(self.modulestore, 'get_structure_changes', None)
+            if get_structure_changes is None:
+                return
+            try:
+                course_key = self.root_block_usage_key.course_key
+            except AttributeError:
+                course_key = None
+            changes = get_structure_changes(course_key, previous_version, version)
+            if changes is None:
+                return
+            changed_block_keys, __ = changes
+
+        block_structure._set_previous_block_structure(  # pylint: disable=protected-access
+            previous_block_structure, changed_block_keys
+        )
+
+    def _collect_once(self):
+        """
+        Collects the block structure, unless another process is already
+        collecting it, in which case the stale block structure is
+        returned when available and up to date with the registered
+        transformers, or the collected block structure is waited for.
+        """
+        course_version = self._get_course_version()
+        lock_token = self.block_structure_cache.acquire_collect_lock(
+            self.root_block_usage_key, self.collect_lock_timeout, course_version
+        )
+        if lock_token is None:
+            block_structure = self.block_structure_cache.get_stale(self.root_block_usage_key)
+            if block_structure is not None and not BlockStructureTransformers.is_collected_outdated(block_structure):
+                dog_stats_api.increment('block_structure.collect_lock.stale_served')
+                return block_structure
+
+            block_structure, lock_token = self._wait_for_collect(course_version)
+            if block_structure is not None:
+                return block_structure
+
+        try:
+            return self._collect()
+        finally:
+            if lock_token is not None:
+                self.block_structure_cache.release_collect_lock(self.root_block_usage_key, lock_token, course_version)
+
+    def _get_course_version(self):
+        """
+        Returns the current version of the course of the block
+        structure, or None if the modulestore doesn't version courses.
+        """
+        root_xblock = self.modulestore.get_item(self.root_block_usage_key, depth=0)
+        return getattr(root_xblock, 'course_version', None)
+
+    def _wait_for_collect(self, course_version):
+        """
+        Waits for the process holding the collect lock of the given
+        course_version to collect the block structure, up to
+        collect_wait_timeout seconds.
+
+        Returns:
+            (block_structure, lock_token) - The collected block structure,
+                if found in the cache, or the token of the collect lock,
+                if it was released and then acquired.  Both are None if
+                the wait timed out, or if the lock was released without
+                the block structure being collected, and acquired by yet
+                another process.
+        """
+        start_time = time.time()
+        block_structure, lock_token, outcome = None, None, 'timeout'
+        while time.time() - start_time < self.collect_wait_timeout:
+            time.sleep(self.COLLECT_WAIT_INTERVAL)
+            if self.block_structure_cache.is_collect_locked(self.root_block_usage_key, course_version):
+                continue
+
+            block_structure = self.block_structure_cache.get(self.root_block_usage_key)
+            if block_structure is not None and not BlockStructureTransformers.is_collected_outdated(block_structure):
+                outcome = 'collected'
+            else:
+                block_structure = None
+                lock_token = self.block_structure_cache.acquire_collect_lock(
+                    self.root_block_usage_key, self.collect_lock_timeout, course_version
+                )
+                outcome = 'released'
+            break
+
+        dog_stats_api.histogram(
+            'block_structure.collect_lock.wait',
+            time.time() - start_time,
+            tags=['outcome:{}'.format(outcome)],
+        )
+        return block_structure, lock_token
 
     @contextmanager
     def _bulk_operations(self):
@@ -95,6 +95,17 @@ class MockCache(object):
         self.map[key] = val
         self.timeout_from_last_call = timeout
 
+    def add(self, key, val, timeout):
+        """
+        Associates the given key with the given value in the cache,
+        unless the key is already in the cache.  Returns whether the
+        value was added.
+        """
+        if key in self.map:
+            return False
+        self.set(key, val, timeout)
+        return True
+
     def get(self, key, default=None):
         """
         Returns the value associated with the given key in the cache;
@@ -106,7 +117,36 @@ class MockCache(object):
         """
         Deletes the given key from the cache.
         """
-        del self.map[key]
+        self.map.pop(key, None)
+
+
+class MockStore(object):
+    """
+    A mock persistent store for block structures, providing only the
+    minimum features needed by the block cache framework.
+    """
+    def __init__(self):
+        # An in-memory map of root usage keys to (version, data) tuples.
+        self.map = {}
+
+    def get(self, root_block_usage_key):
+        """
+        Returns the version and data stored for the given root usage key;
+        returns None if not found.
+        """
+        return self.map.get(root_block_usage_key)
+
+    def set(self, root_block_usage_key, version, data):
+        """
+        Stores the given version and data for the given root usage key.
+        """
+        self.map[root_block_usage_key] = (version, data)
+
+    def delete(self, root_block_usage_key):
+        """
+        Deletes the data stored for the given root usage key.
+        """
+        self.map.pop(root_block_usage_key, None)
 
 
 class MockModulestoreFactory(object):
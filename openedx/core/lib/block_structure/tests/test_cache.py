@@ -1,11 +1,16 @@
 """
 Tests for block_structure/cache.py
 """
+import cPickle as pickle
+import zlib
+
 from nose.plugins.attrib import attr
 from unittest import TestCase
 
+from openedx.core.lib.cache_utils import LRUCache
+
 from ..cache import BlockStructureCache
-from .helpers import ChildrenMapTestMixin, MockCache, MockTransformer
+from .helpers import ChildrenMapTestMixin, MockCache, MockStore, MockTransformer
 
 
 @attr(shard=2)
@@ -54,3 +59,115 @@ class TestBlockStructureCache(ChildrenMapTestMixin, TestCase):
         self.assertIsNone(
             self.block_structure_cache.get(self.block_structure.root_block_usage_key)
         )
+
+    def test_get_unknown_format(self):
+        # Data stored before cache codecs were introduced was a bare zlib stream.
+        self.block_structure_cache.add(self.block_structure)
+        root_cache_key = BlockStructureCache._encode_root_cache_key(self.block_structure.root_block_usage_key)
+        self.mock_cache.map[root_cache_key] = zlib.compress(pickle.dumps('old data'))
+        self.assertIsNone(
+            self.block_structure_cache.get(self.block_structure.root_block_usage_key)
+        )
+
+
+@attr(shard=2)
+class TestBlockStructureCacheWithLocalCache(ChildrenMapTestMixin, TestCase):
+    """
+    Tests for BlockStructureCache with a per-process local cache.
+    """
+    def setUp(self):
+        super(TestBlockStructureCacheWithLocalCache, self).setUp()
+        self.children_map = self.SIMPLE_CHILDREN_MAP
+        self.block_structure = self.create_block_structure(self.children_map)
+        self.mock_cache = MockCache()
+        self.local_cache = LRUCache(max_size=1024 * 1024)
+        self.block_structure_cache = BlockStructureCache(self.mock_cache, self.local_cache)
+        self.root_key = self.block_structure.root_block_usage_key
+
+    def test_add_and_get(self):
+        self.block_structure_cache.add(self.block_structure)
+        self.assertEquals(len(self.local_cache), 1)
+
+        # Served from the local cache even if the shared data is gone.
+        self.mock_cache.map.pop(BlockStructureCache._encode_root_cache_key(self.root_key))
+        cached_value = self.block_structure_cache.get(self.root_key)
+        self.assertIsNotNone(cached_value)
+        self.assert_block_structure(cached_value, self.children_map)
+        self.assertEquals(self.local_cache.hits, 1)
+
+    def test_get_populates_local_cache(self):
+        BlockStructureCache(self.mock_cache).add(self.block_structure)
+        self.assertEquals(len(self.local_cache), 0)
+
+        self.block_structure_cache.get(self.root_key)
+        self.assertEquals(len(self.local_cache), 1)
+        self.block_structure_cache.get(self.root_key)
+        self.assertEquals(self.local_cache.hits, 1)
+
+    def test_get_copies(self):
+        self.block_structure_cache.add(self.block_structure)
+        first = self.block_structure_cache.get(self.root_key)
+        first.remove_block(1, keep_descendants=False)
+        second = self.block_structure_cache.get(self.root_key)
+        self.assert_block_structure(second, self.children_map)
+
+    def test_delete_invalidates_other_processes(self):
+        other_local_cache = LRUCache(max_size=1024 * 1024)
+        other_block_structure_cache = BlockStructureCache(self.mock_cache, other_local_cache)
+        self.block_structure_cache.add(self.block_structure)
+        self.assertIsNotNone(other_block_structure_cache.get(self.root_key))
+
+        self.block_structure_cache.delete(self.root_key)
+        self.assertIsNone(other_block_structure_cache.get(self.root_key))
+        self.assertIsNone(self.block_structure_cache.get(self.root_key))
+
+    def test_new_version_stamp(self):
+        self.block_structure_cache.add(self.block_structure)
+        self.block_structure_cache.add(self.block_structure)
+        self.assertEquals(len(self.local_cache), 2)
+
+
+@attr(shard=2)
+class TestBlockStructureCacheWithStore(ChildrenMapTestMixin, TestCase):
+    """
+    Tests for BlockStructureCache with a persistent store.
+    """
+    def setUp(self):
+        super(TestBlockStructureCacheWithStore, self).setUp()
+        self.children_map = self.SIMPLE_CHILDREN_MAP
+        self.block_structure = self.create_block_structure(self.children_map)
+        self.mock_cache = MockCache()
+        self.mock_store = MockStore()
+        self.local_cache = LRUCache(max_size=1024 * 1024)
+        self.block_structure_cache = BlockStructureCache(self.mock_cache, self.local_cache, self.mock_store)
+        self.root_key = self.block_structure.root_block_usage_key
+
+    def test_add_writes_through(self):
+        self.block_structure_cache.add(self.block_structure)
+        self.assertIn(self.root_key, self.mock_store.map)
+
+    def test_get_after_cache_loss(self):
+        self.block_structure_cache.add(self.block_structure)
+        self.mock_cache.map.clear()
+        self.local_cache.clear()
+
+        cached_value = self.block_structure_cache.get(self.root_key)
+        self.assertIsNotNone(cached_value)
+        self.assert_block_structure(cached_value, self.children_map)
+
+        # The shared cache is repopulated from the store.
+        self.mock_store.map.clear()
+        self.assertIsNotNone(BlockStructureCache(self.mock_cache).get(self.root_key))
+
+    def test_get_older_format(self):
+        self.block_structure_cache.add(self.block_structure)
+        self.mock_cache.map.clear()
+        _, data = self.mock_store.map[self.root_key]
+        self.mock_store.map[self.root_key] = ('v0.stamp', data)
+        self.assertIsNone(self.block_structure_cache.get(self.root_key))
+
+    def test_delete(self):
+        self.block_structure_cache.add(self.block_structure)
+        self.block_structure_cache.delete(self.root_key)
+        self.assertEquals(self.mock_store.map, {})
+        self.assertIsNone(self.block_structure_cache.get(self.root_key))
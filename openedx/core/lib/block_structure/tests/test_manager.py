@@ -1,6 +1,7 @@
 """
 Tests for manager.py
 """
+from mock import MagicMock, patch
 from nose.plugins.attrib import attr
 from unittest import TestCase
 
@@ -122,7 +123,8 @@ class TestBlockStructureManager(TestCase, ChildrenMapTestMixin):
             self.assertGreater(self.modulestore.get_items_call_count, 0)
         else:
             self.assertEquals(self.modulestore.get_items_call_count, 0)
-        self.assertEquals(self.cache.set_call_count, 1 if expect_cache_updated else 0)
+        # The block structure's data and its version stamp are each set.
+        self.assertEquals(self.cache.set_call_count, 2 if expect_cache_updated else 0)
 
     def test_get_transformed(self):
         with mock_registered_transformers(self.registered_transformers):
@@ -184,3 +186,217 @@ class TestBlockStructureManager(TestCase, ChildrenMapTestMixin):
         self.bs_manager.clear()
         self.collect_and_verify(expect_modulestore_called=True, expect_cache_updated=True)
         self.assertEquals(TestTransformer1.collect_call_count, 2)
+
+
+@attr(shard=2)
+class TestBlockStructureManagerCollectLock(TestCase, ChildrenMapTestMixin):
+    """
+    Test class for BlockStructureManager, with a collect lock.
+    """
+    def setUp(self):
+        super(TestBlockStructureManagerCollectLock, self).setUp()
+
+        TestTransformer1.collect_call_count = 0
+        self.registered_transformers = [TestTransformer1()]
+        self.children_map = self.SIMPLE_CHILDREN_MAP
+        self.modulestore = MockModulestoreFactory.create(self.children_map)
+        self.cache = MockCache()
+        self.bs_manager = self.create_manager()
+
+    def create_manager(self, collect_wait_timeout=0):
+        """
+        Returns a manager of the test block structure, as another
+        process would create it.
+        """
+        return BlockStructureManager(
+            root_block_usage_key=0,
+            modulestore=self.modulestore,
+            cache=self.cache,
+            collect_lock_timeout=60,
+            collect_wait_timeout=collect_wait_timeout,
+        )
+
+    def get_collected(self, bs_manager):
+        """
+        Returns the collected block structure from the given manager.
+        """
+        with mock_registered_transformers(self.registered_transformers):
+            return bs_manager.get_collected()
+
+    def test_lock_released(self):
+        self.get_collected(self.bs_manager)
+        self.bs_manager.clear()
+        self.get_collected(self.bs_manager)
+        self.assertEquals(TestTransformer1.collect_call_count, 2)
+        self.assertFalse(self.bs_manager.block_structure_cache.is_collect_locked(0))
+
+    def test_stale_served_while_locked(self):
+        self.get_collected(self.bs_manager)
+        self.bs_manager.clear()
+
+        # Another process is collecting the block structure.
+        self.assertIsNotNone(self.bs_manager.block_structure_cache.acquire_collect_lock(0, 60))
+        block_structure = self.get_collected(self.create_manager())
+        self.assert_block_structure(block_structure, self.children_map)
+        TestTransformer1.assert_collected(block_structure)
+        self.assertEquals(TestTransformer1.collect_call_count, 1)
+
+    def test_stale_deleted_once_collected(self):
+        self.get_collected(self.bs_manager)
+        self.bs_manager.clear()
+        self.assertIsNotNone(self.bs_manager.block_structure_cache.get_stale(0))
+        self.get_collected(self.bs_manager)
+        self.assertIsNone(self.bs_manager.block_structure_cache.get_stale(0))
+
+    def test_lock_per_course_version(self):
+        self.modulestore.blocks[0].field_map['course_version'] = 'v1'
+        self.get_collected(self.bs_manager)
+
+        # Another process is collecting the previous version of the block structure.
+        self.assertIsNotNone(self.bs_manager.block_structure_cache.acquire_collect_lock(0, 60, 'v1'))
+        self.modulestore.blocks[0].field_map['course_version'] = 'v2'
+        self.bs_manager.clear()
+        self.get_collected(self.create_manager())
+        self.assertEquals(TestTransformer1.collect_call_count, 2)
+        self.assertFalse(self.bs_manager.block_structure_cache.is_collect_locked(0, 'v2'))
+
+    def test_update_collected_while_locked(self):
+        self.get_collected(self.bs_manager)
+        self.assertIsNotNone(self.bs_manager.block_structure_cache.acquire_collect_lock(0, 60))
+        with mock_registered_transformers(self.registered_transformers):
+            self.create_manager().update_collected()
+        self.assertEquals(TestTransformer1.collect_call_count, 2)
+
+    def test_outdated_stale_not_served(self):
+        self.get_collected(self.bs_manager)
+        self.bs_manager.clear()
+        TestTransformer1.VERSION += 1
+
+        self.assertIsNotNone(self.bs_manager.block_structure_cache.acquire_collect_lock(0, 60))
+        self.get_collected(self.create_manager())
+        self.assertEquals(TestTransformer1.collect_call_count, 2)
+
+    @patch.object(BlockStructureManager, 'COLLECT_WAIT_INTERVAL', 0)
+    def test_wait_for_collect(self):
+        other_bs_manager = self.create_manager()
+        lock_token = other_bs_manager.block_structure_cache.acquire_collect_lock(0, 60)
+
+        def collect_and_release(*args):  # pylint: disable=unused-argument
+            """Mimics the other process collecting the block structure."""
+            self.get_collected(other_bs_manager)
+            other_bs_manager.block_structure_cache.release_collect_lock(0, lock_token)
+
+        with patch('openedx.core.lib.block_structure.manager.time.sleep', side_effect=collect_and_release):
+            block_structure = self.get_collected(self.create_manager(collect_wait_timeout=10))
+        self.assert_block_structure(block_structure, self.children_map)
+        self.assertEquals(TestTransformer1.collect_call_count, 1)
+
+    def test_wait_timeout(self):
+        self.assertIsNotNone(self.bs_manager.block_structure_cache.acquire_collect_lock(0, 60))
+        block_structure = self.get_collected(self.create_manager())
+        self.assert_block_structure(block_structure, self.children_map)
+        self.assertEquals(TestTransformer1.collect_call_count, 1)
+
+
+class ReusingTransformer(MockTransformer):
+    """
+    Test Transformer class that reuses the data collected for the
+    unchanged blocks of the previous block structure.
+    """
+    computed_block_keys = []
+
+    @classmethod
+    def collect(cls, block_structure):
+        """
+        Collects the value field of each block's xblock, only reading the
+        xblocks of the changed blocks.
+        """
+        for block_key in block_structure.topological_traversal():
+            value = block_structure.get_previous_transformer_block_field(block_key, cls, 'value')
+            if value is None:
+                cls.computed_block_keys.append(block_key)
+                value = block_structure.get_xblock(block_key).value
+            block_structure.set_transformer_block_field(block_key, cls, 'value', value)
+
+
+@attr(shard=2)
+class TestBlockStructureManagerIncrementalCollect(TestCase, ChildrenMapTestMixin):
+    """
+    Test class for BlockStructureManager, with incremental collection.
+    """
+    def setUp(self):
+        super(TestBlockStructureManagerIncrementalCollect, self).setUp()
+
+        ReusingTransformer.computed_block_keys = []
+        self.registered_transformers = [ReusingTransformer()]
+        self.children_map = self.SIMPLE_CHILDREN_MAP
+        self.modulestore = MockModulestoreFactory.create(self.children_map)
+        self.modulestore.get_structure_changes = MagicMock(return_value=(set(), set()))
+        for block_key, xblock in self.modulestore.blocks.iteritems():
+            xblock.field_map['value'] = block_key
+        self.modulestore.blocks[0].field_map['course_version'] = 'v1'
+
+        self.bs_manager = BlockStructureManager(
+            root_block_usage_key=0,
+            modulestore=self.modulestore,
+            cache=MockCache(),
+            incremental_collect=True,
+        )
+        self.update_collected()
+
+    def update_collected(self, version=None, changed_block_keys=(), values=None):
+        """
+        Updates the blocks to the given version, with the given changes,
+        and updates the collected block structure.  Returns the keys of
+        the blocks whose data was collected again.
+        """
+        if version:
+            self.modulestore.blocks[0].field_map['course_version'] = version
+        self.modulestore.get_structure_changes.return_value = (set(changed_block_keys), set())
+        for block_key, value in (values or {}).iteritems():
+            self.modulestore.blocks[block_key].field_map['value'] = value
+
+        ReusingTransformer.computed_block_keys = []
+        with mock_registered_transformers(self.registered_transformers):
+            self.bs_manager.update_collected()
+            block_structure = self.bs_manager.get_collected()
+
+        for block_key, xblock in self.modulestore.blocks.iteritems():
+            self.assertEquals(
+                block_structure.get_transformer_block_field(block_key, ReusingTransformer, 'value'),
+                xblock.value
+            )
+        self.assertEquals(
+            block_structure.get_xblock_field(0, 'course_version'),
+            self.modulestore.blocks[0].course_version
+        )
+        return sorted(ReusingTransformer.computed_block_keys)
+
+    def test_same_version(self):
+        self.assertEquals(self.update_collected(), [])
+        self.assertFalse(self.modulestore.get_structure_changes.called)
+
+    def test_leaf_changed(self):
+        self.assertEquals(self.update_collected('v2', [3], {3: 'new value'}), [3])
+        self.modulestore.get_structure_changes.assert_called_with(None, 'v1', 'v2')
+
+    def test_ancestor_changed(self):
+        self.assertEquals(self.update_collected('v2', [1], {1: 'new value'}), [1, 3, 4])
+
+    def test_children_changed(self):
+        self.modulestore.blocks[2].children = [3]
+        self.assertEquals(self.update_collected('v2', [], {}), [2, 3])
+
+    def test_changes_unknown(self):
+        del self.modulestore.get_structure_changes
+        with mock_registered_transformers(self.registered_transformers):
+            self.bs_manager.update_collected()
+        self.modulestore.blocks[0].field_map['course_version'] = 'v2'
+        ReusingTransformer.computed_block_keys = []
+        with mock_registered_transformers(self.registered_transformers):
+            self.bs_manager.update_collected()
+        self.assertEquals(sorted(ReusingTransformer.computed_block_keys), [0, 1, 2, 3, 4])
+
+    def test_outdated_transformer(self):
+        ReusingTransformer.VERSION += 1
+        self.assertEquals(self.update_collected('v2', [3]), [0, 1, 2, 3, 4])
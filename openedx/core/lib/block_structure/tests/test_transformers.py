@@ -1,6 +1,7 @@
 """
 Tests for transformers.py
 """
+import ddt
 from mock import MagicMock, patch
 from nose.plugins.attrib import attr
 from unittest import TestCase
@@ -13,7 +14,39 @@ from .helpers import (
 )
 
 
+class CollectingTransformer(MockTransformer):
+    """
+    Mock transformer that collects a value for each block.
+    """
+    @classmethod
+    def collect(cls, block_structure):
+        for block_key in block_structure.topological_traversal():
+            block_structure.set_transformer_block_field(block_key, cls, 'value', block_key)
+
+
+class OtherCollectingTransformer(CollectingTransformer):
+    """
+    Mock transformer that collects a value for each block, independently.
+    """
+    pass
+
+
+class DependentTransformer(MockTransformer):
+    """
+    Mock transformer that collects a value computed from the data
+    collected by the CollectingTransformer.
+    """
+    COLLECT_DEPENDENCIES = ('CollectingTransformer',)
+
+    @classmethod
+    def collect(cls, block_structure):
+        for block_key in block_structure.topological_traversal():
+            value = block_structure.get_transformer_block_field(block_key, CollectingTransformer, 'value')
+            block_structure.set_transformer_block_field(block_key, cls, 'value', value * 2)
+
+
 @attr(shard=2)
+@ddt.ddt
 class TestBlockStructureTransformers(ChildrenMapTestMixin, TestCase):
     """
     Test class for testing BlockStructureTransformers
@@ -81,3 +114,46 @@ class TestBlockStructureTransformers(ChildrenMapTestMixin, TestCase):
             self.assertTrue(self.transformers.is_collected_outdated(block_structure))
             self.transformers.collect(block_structure)
             self.assertFalse(self.transformers.is_collected_outdated(block_structure))
+
+    @ddt.data(1, 4)
+    def test_collect_dependencies(self, max_workers):
+        block_structure = self.create_block_structure(
+            self.SIMPLE_CHILDREN_MAP,
+            BlockStructureModulestoreData
+        )
+        registered_transformers = [DependentTransformer(), CollectingTransformer(), OtherCollectingTransformer()]
+
+        with mock_registered_transformers(registered_transformers):
+            self.transformers.collect(block_structure, max_workers=max_workers)
+
+        for block_key in block_structure:
+            self.assertEquals(
+                block_structure.get_transformer_block_field(block_key, OtherCollectingTransformer, 'value'),
+                block_key
+            )
+            self.assertEquals(
+                block_structure.get_transformer_block_field(block_key, DependentTransformer, 'value'),
+                block_key * 2
+            )
+
+    def test_collect_stages(self):
+        stages = BlockStructureTransformers._get_collect_stages(  # pylint: disable=protected-access
+            [DependentTransformer, CollectingTransformer, OtherCollectingTransformer, MockTransformer]
+        )
+        self.assertEquals(
+            stages,
+            [[CollectingTransformer, MockTransformer, OtherCollectingTransformer], [DependentTransformer]]
+        )
+
+    def test_collect_circular_dependencies(self):
+        class CircularTransformer(MockTransformer):
+            """
+            Mock transformer that depends on the DependentTransformer.
+            """
+            COLLECT_DEPENDENCIES = ('DependentTransformer',)
+
+        with patch.object(CollectingTransformer, 'COLLECT_DEPENDENCIES', ('CircularTransformer',)):
+            with self.assertRaises(TransformerException):
+                BlockStructureTransformers._get_collect_stages(  # pylint: disable=protected-access
+                    [DependentTransformer, CollectingTransformer, CircularTransformer]
+                )
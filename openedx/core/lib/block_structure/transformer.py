@@ -28,6 +28,13 @@ class BlockStructureTransformer(object):
     #
     VERSION = 0
 
+    # Names of the transformers whose collect methods must run before
+    # this transformer's, because it reads data they collect or xBlock
+    # fields they modify.  The collect methods of transformers that don't
+    # depend on each other may run concurrently, so they should only
+    # read xBlocks and write their own transformer data.
+    COLLECT_DEPENDENCIES = ()
+
     @classmethod
     def name(cls):
         """
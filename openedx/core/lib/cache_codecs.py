@@ -0,0 +1,171 @@
+"""
+Codecs for the serialized data that is stored in caches.
+
+A codec serializes a value to bytes and compresses those bytes for storage.
+Every encoded value is prefixed with a single format version byte identifying
+the codec that produced it, so that a value can be decoded regardless of which
+codec is currently the default for writing.  Values with an unknown format
+version - including those written before format versions were introduced, or
+by a codec that is unavailable in this process - are treated as cache misses.
+
+Code written before format versions were introduced can't read such values,
+so they must be stored under cache keys it doesn't use: see encode_cache_key.
+
+The codec with which values are written is chosen by the CACHE_CODEC setting,
+so that all the processes sharing a cache agree on it.
+"""
+import cPickle as pickle
+from logging import getLogger
+import zlib
+
+from django.conf import settings
+
+try:
+    import lz4.block
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
+
+log = getLogger(__name__)
+
+# Prefix of the keys under which encoded values are cached.  It is to be
+# changed if encoded values ever become unreadable by the code reading them.
+CACHE_KEY_PREFIX = 'codec.v1'
+
+
+class CacheCodec(object):
+    """
+    Base class for cache codecs.  Values are pickled, and subclasses
+    provide the compression.
+    """
+    # Byte value identifying data encoded by this codec.  It must not be
+    # 0x78, the first byte of the zlib streams that were stored in caches
+    # before format versions were introduced.
+    FORMAT_VERSION = None
+
+    # Human readable name of the codec.
+    NAME = None
+
+    def serialize(self, value):
+        """
+        Returns the given value serialized to bytes.
+        """
+        return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+    def deserialize(self, data):
+        """
+        Returns the value deserialized from the given bytes.
+        """
+        return pickle.loads(data)
+
+    def compress(self, data):
+        """
+        Returns the given serialized data, compressed.
+        """
+        raise NotImplementedError
+
+    def decompress(self, data):
+        """
+        Returns the given compressed data, decompressed.
+        """
+        raise NotImplementedError
+
+
+class PickleZlibCodec(CacheCodec):
+    """
+    Codec using zlib at its fastest compression level.  Always available.
+    """
+    FORMAT_VERSION = 1
+    NAME = 'pickle+zlib'
+
+    def compress(self, data):
+        # 1 = Fastest (slightly larger results)
+        return zlib.compress(data, 1)
+
+    def decompress(self, data):
+        return zlib.decompress(data)
+
+
+class PickleLZ4Codec(CacheCodec):
+    """
+    Codec using LZ4, which decompresses several times faster than zlib at the
+    cost of somewhat larger results.  Available if the lz4 package is installed.
+    """
+    FORMAT_VERSION = 2
+    NAME = 'pickle+lz4'
+
+    def compress(self, data):
+        return lz4.block.compress(data)
+
+    def decompress(self, data):
+        return lz4.block.decompress(data)
+
+
+CODECS = {
+    codec.FORMAT_VERSION: codec
+    for codec in [PickleZlibCodec(), PickleLZ4Codec() if LZ4_AVAILABLE else None]
+    if codec is not None
+}
+
+
+def get_default_codec():
+    """
+    Returns the codec with which data is to be encoded: the one named by
+    the CACHE_CODEC setting, or else pickle+zlib, which every process can
+    decode.
+    """
+    codec_name = getattr(settings, 'CACHE_CODEC', PickleZlibCodec.NAME)
+    for codec in CODECS.itervalues():
+        if codec.NAME == codec_name:
+            return codec
+    log.warning("Cache codec %s is unavailable, using %s instead.", codec_name, PickleZlibCodec.NAME)
+    return CODECS[PickleZlibCodec.FORMAT_VERSION]
+
+
+def encode_cache_key(key):
+    """
+    Returns the cache key under which the encoded value for the given key
+    is to be cached.
+    """
+    return '{prefix}.{key}'.format(prefix=CACHE_KEY_PREFIX, key=key)
+
+
+def compress(serialized_data, codec):
+    """
+    Returns the given data, serialized with the given codec, compressed with
+    that codec and prefixed with its format version.
+    """
+    return chr(codec.FORMAT_VERSION) + codec.compress(serialized_data)
+
+
+def decompress(encoded_data):
+    """
+    Returns a (codec, serialized_data) tuple for the given data that was
+    returned by compress or encode.  Returns (None, None) if the data was
+    encoded by an unknown codec.
+    """
+    codec = CODECS.get(ord(encoded_data[0])) if encoded_data else None
+    if codec is None:
+        return None, None
+    return codec, codec.decompress(encoded_data[1:])
+
+
+def encode(value, codec=None):
+    """
+    Returns the given value serialized and compressed by the given codec,
+    or else by the default codec.
+    """
+    codec = codec or get_default_codec()
+    return compress(codec.serialize(value), codec)
+
+
+def decode(encoded_data):
+    """
+    Returns the value for the given data that was returned by encode, or None
+    if the data was encoded by an unknown codec.
+    """
+    codec, serialized_data = decompress(encoded_data)
+    if codec is None:
+        return None
+    return codec.deserialize(serialized_data)
@@ -4,6 +4,7 @@ Utilities related to caching.
 import collections
 import cPickle as pickle
 import functools
+import threading
 import zlib
 from xblock.core import XBlock
 
@@ -83,6 +84,116 @@ class memoized(object):  # pylint: disable=invalid-name
         return functools.partial(self.__call__, obj)
 
 
+class LRUCache(object):
+    """
+    A bounded, thread-safe, process-local cache that evicts the least
+    recently used entries once either its item count or its total size
+    (as reported by the caller) exceeds the configured limits.
+
+    Intended for caching immutable or version-keyed data that is costly
+    to fetch or decode, in front of a shared cache such as memcached.
+    Hit, miss and eviction counts are kept on the instance so callers
+    can report them as metrics.
+    """
+
+    def __init__(self, max_items=None, max_size=None):
+        """
+        Arguments:
+            max_items (int) - The maximum number of entries to keep, or
+                None for no limit on the number of entries.
+
+            max_size (int) - The maximum total size of the entries to
+                keep, in the units passed to set (typically bytes), or
+                None for no limit on the total size.
+        """
+        self.max_items = max_items
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._size = 0
+        self._data = collections.OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    @property
+    def size(self):
+        """
+        Returns the total size of the entries currently in the cache.
+        """
+        return self._size
+
+    def get(self, key, default=None):
+        """
+        Returns the value cached for the given key, marking it as the
+        most recently used; returns default if not found.
+        """
+        with self._lock:
+            try:
+                value, size = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data[key] = (value, size)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, size=1):
+        """
+        Caches the given value for the given key, evicting least
+        recently used entries as needed to stay within the limits.
+
+        Values whose size alone exceeds max_size are not cached.
+        """
+        with self._lock:
+            self._pop(key)
+            if self.max_size is not None and size > self.max_size:
+                return
+            self._data[key] = (value, size)
+            self._size += size
+            while self._data and self._is_over_limit():
+                self._pop(next(iter(self._data)))
+                self.evictions += 1
+
+    def delete(self, key):
+        """
+        Removes the given key from the cache, if present.
+        """
+        with self._lock:
+            self._pop(key)
+
+    def clear(self):
+        """
+        Removes all entries from the cache.
+        """
+        with self._lock:
+            self._data.clear()
+            self._size = 0
+
+    def _pop(self, key):
+        """
+        Removes the given key and updates the cache's total size.
+        The lock must be held by the caller.
+        """
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self._size -= entry[1]
+
+    def _is_over_limit(self):
+        """
+        Returns whether the cache exceeds either of its limits.
+        """
+        return (
+            (self.max_items is not None and len(self._data) > self.max_items) or
+            (self.max_size is not None and self._size > self.max_size)
+        )
+
+
 def hashvalue(arg):
     """
     If arg is an xblock, use its location. otherwise just turn it into a string
@@ -0,0 +1,66 @@
+"""
+Tests for cache_codecs.py
+"""
+import cPickle as pickle
+import zlib
+from unittest import TestCase
+
+import ddt
+from django.test.utils import override_settings
+from mock import patch
+
+from openedx.core.lib import cache_codecs
+
+
+@ddt.ddt
+class TestCacheCodecs(TestCase):
+    """
+    Tests for encoding and decoding cached data.
+    """
+    VALUE = {'root': ('course', 'course'), 'blocks': {('html', 'intro'): {'display_name': u'Intro \u2603'}}}
+
+    @ddt.data(*cache_codecs.CODECS.values())
+    def test_encode_decode(self, codec):
+        encoded_data = cache_codecs.encode(self.VALUE, codec)
+        self.assertEqual(ord(encoded_data[0]), codec.FORMAT_VERSION)
+        self.assertEqual(cache_codecs.decode(encoded_data), self.VALUE)
+
+    @ddt.data(*cache_codecs.CODECS.values())
+    def test_compress_decompress(self, codec):
+        serialized_data = codec.serialize(self.VALUE)
+        decompressed_codec, decompressed_data = cache_codecs.decompress(
+            cache_codecs.compress(serialized_data, codec)
+        )
+        self.assertIs(decompressed_codec, codec)
+        self.assertEqual(decompressed_data, serialized_data)
+
+    def test_default_codec(self):
+        self.assertIsInstance(cache_codecs.get_default_codec(), cache_codecs.PickleZlibCodec)
+        self.assertEqual(cache_codecs.decode(cache_codecs.encode(self.VALUE)), self.VALUE)
+
+    @ddt.data(*cache_codecs.CODECS.values())
+    def test_configured_codec(self, codec):
+        with override_settings(CACHE_CODEC=codec.NAME):
+            self.assertIs(cache_codecs.get_default_codec(), codec)
+
+    def test_unavailable_configured_codec(self):
+        with override_settings(CACHE_CODEC='unknown'):
+            self.assertIsInstance(cache_codecs.get_default_codec(), cache_codecs.PickleZlibCodec)
+
+    def test_encode_cache_key(self):
+        self.assertEqual(cache_codecs.encode_cache_key('structure'), cache_codecs.CACHE_KEY_PREFIX + '.structure')
+
+    @ddt.data(
+        '',
+        zlib.compress(pickle.dumps(VALUE, pickle.HIGHEST_PROTOCOL)),
+        zlib.compress(pickle.dumps(VALUE, pickle.HIGHEST_PROTOCOL), 1),
+        chr(255) + 'unknown',
+    )
+    def test_unknown_format(self, encoded_data):
+        self.assertEqual(cache_codecs.decompress(encoded_data), (None, None))
+        self.assertIsNone(cache_codecs.decode(encoded_data))
+
+    def test_unavailable_codec(self):
+        encoded_data = cache_codecs.encode(self.VALUE, cache_codecs.PickleZlibCodec())
+        with patch.dict(cache_codecs.CODECS, clear=True):
+            self.assertIsNone(cache_codecs.decode(encoded_data))
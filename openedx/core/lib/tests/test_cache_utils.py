@@ -5,7 +5,7 @@ import ddt
 from mock import MagicMock
 from unittest import TestCase
 
-from openedx.core.lib.cache_utils import memoize_in_request_cache
+from openedx.core.lib.cache_utils import LRUCache, memoize_in_request_cache
 
 
 @ddt.ddt
@@ -62,3 +62,51 @@ class TestMemoizeInRequestCache(TestCase):
                 func_to_memoize(*arg_list2)
 
             self.assertEquals(self.func_to_count.call_count, 2)
+
+
+class TestLRUCache(TestCase):
+    """
+    Tests for the LRUCache class.
+    """
+    def test_get_and_set(self):
+        cache = LRUCache()
+        self.assertIsNone(cache.get('a'))
+        self.assertEquals(cache.get('a', 'default'), 'default')
+        cache.set('a', 1)
+        self.assertEquals(cache.get('a'), 1)
+        self.assertEquals((cache.hits, cache.misses), (1, 2))
+
+    def test_max_items(self):
+        cache = LRUCache(max_items=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+        self.assertEquals(cache.evictions, 1)
+
+    def test_max_size(self):
+        cache = LRUCache(max_size=10)
+        cache.set('a', 'aaaa', size=4)
+        cache.set('b', 'bbbb', size=4)
+        cache.set('c', 'cccc', size=4)
+        self.assertNotIn('a', cache)
+        self.assertEquals(cache.size, 8)
+
+        cache.set('d', 'd' * 11, size=11)
+        self.assertNotIn('d', cache)
+        self.assertEquals(cache.size, 8)
+
+    def test_replace_delete_and_clear(self):
+        cache = LRUCache(max_size=10)
+        cache.set('a', 'aaaa', size=4)
+        cache.set('a', 'aa', size=2)
+        self.assertEquals(cache.size, 2)
+        cache.delete('a')
+        cache.delete('missing')
+        self.assertEquals((len(cache), cache.size), (0, 0))
+        cache.set('b', 'bbbb', size=4)
+        cache.clear()
+        self.assertEquals((len(cache), cache.size), (0, 0))